@@ -1,14 +1,24 @@
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-from datetime import datetime
+
+from gfi import i18n, images, theme, timing
+# The scoring engines (numpy) and figure factory load on first submit, not on
+# first render — see python -m gfi.startup profile app.py
+
+_t0 = timing.start()
+
+# ============================================================================
+# LANGUAGE — ?lang= on first load, then the header switcher; catalogs are
+# parsed once per process (gfi/locales/*.toml)
+# ============================================================================
+APP_LOCALES = ("en", "es", "zh")     # zh-TW only translates the site pages
+LOCALE = i18n.select(st.session_state, st.query_params, available=APP_LOCALES)
+t = i18n.catalog(LOCALE)
 
 # ============================================================================
 # PAGE CONFIGURATION
 # ============================================================================
 st.set_page_config(
-    page_title="GFI Flow Intelligence — Capital Efficiency Verification",
+    page_title=t("page.title"),
     layout="wide",
     initial_sidebar_state="collapsed",
     page_icon="🔍"
@@ -22,296 +32,367 @@ STRIPE_LINK_4999 = "https://buy.stripe.com/7sYcN764GdM4arX0fB3VC01"
 STRIPE_LINK_9999 = "https://buy.stripe.com/8x228t3WyazS7fL4vR3VC02"
 
 # ============================================================================
-# DESIGN TOKENS — matches gfiintel.com exactly
+# DESIGN TOKENS — matches gfiintel.com exactly (defined in gfi.theme)
 # ============================================================================
-BG       = "#141d2e"
-SURF     = "#1c2740"
-SURF2    = "#22304e"
-BORDER   = "rgba(255,255,255,0.08)"
-TEXT     = "#edf0f8"
-MUTED    = "#8fa3c0"
-DIM      = "#4a6080"
-ACCENT   = "#c8f542"   # lime green
-BLUE     = "#4da3ff"
-DANGER   = "#ff6b6b"
-WARN     = "#f59e0b"
-SUCCESS  = "#34d399"
+from gfi.theme import BORDER, TEXT, MUTED, DIM, ACCENT, BLUE
 
 # ============================================================================
-# GLOBAL CSS
+# GLOBAL CSS — built once into static/, only the <link> goes out per rerun
 # ============================================================================
-st.markdown(f"""
-<style>
-  /* ── Base ── */
-  html, body, [data-testid="stAppViewContainer"], [data-testid="stMain"] {{
-    background-color: {BG} !important;
-    color: {TEXT} !important;
-    font-family: 'DM Sans', system-ui, sans-serif;
-  }}
-
-  [data-testid="stSidebar"] {{ background-color: {SURF} !important; }}
-
-  /* Remove default padding */
-  .block-container {{ padding-top: 2rem !important; max-width: 1100px; }}
-
-  /* ── Typography ── */
-  h1, h2, h3, h4, h5 {{ color: {TEXT} !important; font-weight: 500 !important; letter-spacing: -0.01em; }}
-  p, li, span, div {{ color: {MUTED}; }}
-  strong {{ color: {TEXT} !important; }}
-
-  /* ── Inputs ── */
-  [data-testid="stTextInput"] input,
-  [data-testid="stNumberInput"] input,
-  [data-testid="stSelectbox"] div[data-baseweb="select"] {{
-    background-color: {SURF} !important;
-    border: 1px solid {BORDER} !important;
-    color: {TEXT} !important;
-    border-radius: 6px !important;
-  }}
-  [data-testid="stSelectbox"] div[data-baseweb="select"]:hover {{
-    border-color: rgba(255,255,255,0.18) !important;
-  }}
-  [data-baseweb="popover"] ul {{
-    background-color: {SURF2} !important;
-  }}
-
-  /* Sliders */
-  [data-testid="stSlider"] [data-baseweb="slider"] div[role="slider"] {{
-    background-color: {ACCENT} !important;
-  }}
-  [data-testid="stSlider"] div[data-testid="stTickBarMin"],
-  [data-testid="stSlider"] div[data-testid="stTickBarMax"] {{
-    color: {MUTED} !important;
-  }}
-
-  /* ── Tabs ── */
-  [data-testid="stTabs"] [data-baseweb="tab-list"] {{
-    background-color: {SURF} !important;
-    border-radius: 8px;
-    padding: 4px;
-    gap: 4px;
-    border: 1px solid {BORDER};
-  }}
-  [data-testid="stTabs"] [data-baseweb="tab"] {{
-    background-color: transparent !important;
-    color: {MUTED} !important;
-    border-radius: 6px !important;
-    font-size: 14px !important;
-    padding: 8px 16px !important;
-    transition: all .2s;
-  }}
-  [data-testid="stTabs"] [aria-selected="true"] {{
-    background-color: {SURF2} !important;
-    color: {TEXT} !important;
-  }}
-  [data-testid="stTabs"] [data-baseweb="tab-border"] {{ display: none !important; }}
-
-  /* ── Form submit button ── */
-  [data-testid="stFormSubmitButton"] button {{
-    background-color: {ACCENT} !important;
-    color: #0d1117 !important;
-    font-weight: 600 !important;
-    border: none !important;
-    border-radius: 8px !important;
-    padding: 12px 28px !important;
-    font-size: 16px !important;
-    transition: opacity .2s !important;
-    width: 100% !important;
-  }}
-  [data-testid="stFormSubmitButton"] button:hover {{
-    opacity: 0.88 !important;
-  }}
-
-  /* ── Expanders ── */
-  [data-testid="stExpander"] {{
-    background-color: {SURF} !important;
-    border: 1px solid {BORDER} !important;
-    border-radius: 8px !important;
-    margin-bottom: 8px;
-  }}
-  [data-testid="stExpander"] summary {{
-    color: {TEXT} !important;
-    font-size: 15px !important;
-  }}
-
-  /* ── Alerts ── */
-  [data-testid="stAlert"] {{
-    background-color: {SURF} !important;
-    border-radius: 8px !important;
-    border: 1px solid {BORDER} !important;
-  }}
-
-  /* ── Divider ── */
-  hr {{ border-color: {BORDER} !important; }}
-
-  /* ── Plotly charts background ── */
-  .js-plotly-plot .plotly {{ background: transparent !important; }}
-
-  /* ── Custom components ── */
-
-  .eyebrow {{
-    font-family: 'DM Mono', monospace;
-    font-size: 11px;
-    letter-spacing: 0.2em;
-    text-transform: uppercase;
-    color: {ACCENT};
-    margin-bottom: 8px;
-  }}
-
-  .card {{
-    background: {SURF};
-    border: 1px solid {BORDER};
-    border-radius: 10px;
-    padding: clamp(20px, 3vw, 32px);
-  }}
-
-  .card-accent {{
-    background: rgba(200,245,66,0.03);
-    border-color: rgba(200,245,66,0.18);
-  }}
-
-  .price-card {{
-    background: {SURF};
-    border: 1px solid {BORDER};
-    border-radius: 10px;
-    padding: 28px;
-    text-align: center;
-    height: 100%;
-    transition: border-color .2s, transform .25s;
-  }}
-  .price-card:hover {{
-    border-color: rgba(200,245,66,0.22);
-    transform: translateY(-3px);
-  }}
-  .price-card.featured {{
-    background: rgba(200,245,66,0.03);
-    border-color: rgba(200,245,66,0.2);
-  }}
-
-  .price-tier {{
-    font-family: 'DM Mono', monospace;
-    font-size: 10px;
-    letter-spacing: 0.14em;
-    text-transform: uppercase;
-    color: {MUTED};
-    margin-bottom: 12px;
-  }}
-  .featured .price-tier {{ color: {ACCENT}; }}
-
-  .price-amount {{
-    font-size: 48px;
-    font-weight: 600;
-    color: {TEXT};
-    line-height: 1;
-    margin-bottom: 4px;
-  }}
-  .price-cur {{ font-size: 20px; color: {MUTED}; vertical-align: top; line-height: 1.3; }}
-
-  .feat-list {{
-    list-style: none;
-    padding: 0;
-    text-align: left;
-    margin: 16px 0 24px;
-  }}
-  .feat-list li {{
-    font-size: 14px;
-    color: {MUTED};
-    padding: 8px 0;
-    border-bottom: 1px solid {BORDER};
-    display: flex;
-    gap: 8px;
-  }}
-  .feat-list li::before {{ content: '→'; color: {ACCENT}; flex-shrink: 0; }}
-
-  .cta-btn {{
-    display: block;
-    width: 100%;
-    text-align: center;
-    padding: 13px 20px;
-    background: {SURF2};
-    color: {TEXT};
-    border: 1px solid {BORDER};
-    border-radius: 7px;
-    font-size: 14px;
-    text-decoration: none;
-    transition: background .2s, border-color .2s;
-    margin-top: 8px;
-    cursor: pointer;
-  }}
-  .cta-btn:hover {{ background: rgba(255,255,255,0.04); border-color: rgba(255,255,255,0.18); color: {TEXT}; }}
-
-  .cta-btn-primary {{
-    background: {ACCENT};
-    color: #0d1117;
-    border-color: transparent;
-    font-weight: 600;
-  }}
-  .cta-btn-primary:hover {{ opacity: 0.88; background: {ACCENT}; color: #0d1117; }}
-
-  .result-hero {{
-    background: {SURF};
-    border: 1px solid rgba(255,107,107,0.25);
-    border-radius: 12px;
-    padding: 2.5rem;
-    text-align: center;
-    margin: 1.5rem 0;
-  }}
-  .result-num {{
-    font-size: 56px;
-    font-weight: 600;
-    color: {DANGER};
-    line-height: 1;
-    margin: 1rem 0;
-  }}
-
-  .insight-box {{
-    background: {SURF};
-    border: 1px solid {BORDER};
-    border-left: 3px solid {ACCENT};
-    border-radius: 8px;
-    padding: 20px 24px;
-    margin: 16px 0;
-  }}
-
-  .risk-hi  {{ color: {DANGER}; }}
-  .risk-med {{ color: {WARN}; }}
-  .risk-lo  {{ color: {SUCCESS}; }}
-
-  .guarantee {{
-    background: rgba(52,211,153,0.05);
-    border: 1px solid rgba(52,211,153,0.2);
-    border-radius: 8px;
-    padding: 20px 24px;
-    text-align: center;
-    margin: 24px 0;
-  }}
-  .guarantee h4 {{ color: {SUCCESS} !important; }}
-
-  .badge {{
-    display: inline-block;
-    background: rgba(200,245,66,0.12);
-    color: {ACCENT};
-    font-family: 'DM Mono', monospace;
-    font-size: 10px;
-    letter-spacing: 0.1em;
-    padding: 4px 10px;
-    border-radius: 4px;
-    margin-bottom: 12px;
-  }}
-
-  .two-col {{
-    display: grid;
-    grid-template-columns: 1fr 1fr;
-    gap: 16px;
-    margin: 16px 0;
-  }}
-  @media (max-width: 640px) {{
-    .two-col {{ grid-template-columns: 1fr; }}
-    .result-num {{ font-size: 40px; }}
-  }}
-</style>
-<link href="https://fonts.googleapis.com/css2?family=DM+Serif+Display:ital@0;1&family=DM+Mono:wght@400;500&family=DM+Sans:wght@300;400;500&display=swap" rel="stylesheet">
-""", unsafe_allow_html=True)
+st.markdown(theme.head("gfi"), unsafe_allow_html=True)
+
+# ============================================================================
+# PEER BENCHMARKS — seeded from the stored assessments once per process, off
+# the script thread; submits only read and update the in-memory index
+# ============================================================================
+@st.cache_resource(show_spinner=False)
+def seed_peers():
+    import threading
+    from datetime import datetime, timezone
+
+    # Rows this process stores from now on reach the index through add()
+    before = datetime.now(timezone.utc).isoformat()
+
+    def run():
+        from gfi import benchmark
+        benchmark.seed_default(st.secrets, before=before)
+
+    thread = threading.Thread(target=run, name="gfi-seed-peers", daemon=True)
+    thread.start()
+    return thread
+
+
+seed_peers()
+
+# ============================================================================
+# RESULT BUNDLE — memoized per input tuple in gfi.cache.RESULTS. Holds no
+# display strings, so every language shares the same cache entries.
+# ============================================================================
+def build_results(inputs):
+    from gfi import leak, montecarlo, optimizer, sensitivity
+
+    total_leak, risk_score, breakdown = leak.score_one(
+        labels={c: c for c in leak.CATEGORIES}, **inputs)
+
+    # Roadmap target: into the LOW band, or a 25% cut if already there
+    if risk_score > 40:
+        plan = optimizer.optimize(inputs, target_risk=40)
+    else:
+        plan = optimizer.optimize(inputs, target_leak_reduction=0.25)
+
+    return {
+        'plan':        plan,
+        'total_leak':  total_leak,
+        'risk_score':  risk_score,
+        'breakdown':   breakdown,       # category id → USD
+        'sensitivity': sensitivity.analyze(inputs),
+        'bands':       montecarlo.simulate(inputs),
+    }
+
+# ============================================================================
+# LIVE WHAT-IF — fragment reruns alone; only touched categories recompute
+# ============================================================================
+WHATIF_INPUTS = (
+    "meeting_hours_per_week",
+    "approval_layers",
+    "project_delay_pct",
+    "rework_pct",
+    "decision_time_days",
+    "turnover_rate",
+    "customer_complaint_rate",
+)
+
+@st.fragment
+@timing.timed("what-if")
+def live_what_if(base_inputs, base_total, base_risk):
+    from gfi import leak, whatif
+
+    if 'whatif' not in st.session_state:
+        st.session_state.whatif = whatif.Scenario(base_inputs)
+    scenario = st.session_state.whatif
+    input_labels = t.table("input")
+    category_labels = t.table("category")
+
+    cols = st.columns(2)
+    changes = {}
+    for i, name in enumerate(WHATIF_INPUTS):
+        lo, hi = leak.BOUNDS[name]
+        with cols[i % 2]:
+            changes[name] = st.slider(input_labels[name], int(lo), int(hi),
+                                      int(base_inputs[name]), key=f"whatif_{name}")
+    scenario.update(**changes)
+
+    m1, m2 = st.columns(2)
+    m1.metric(t("results.whatif_total"), f"${scenario.total:,.0f}",
+              delta=f"{scenario.total - base_total:+,.0f}", delta_color="inverse")
+    m2.metric(t("results.whatif_risk"), f"{scenario.risk:.0f}",
+              delta=f"{scenario.risk - base_risk:+.1f}", delta_color="inverse")
+    cat_cols = st.columns(3)
+    for i, c in enumerate(leak.CATEGORIES):
+        cat_cols[i % 3].metric(category_labels[c], f"${scenario.costs[c]:,.0f}")
+
+# ============================================================================
+# PRICE CARDS — shared by the results CTA and the Pricing tab
+# ============================================================================
+TIERS = (
+    # (catalog key, price, link, featured)
+    ("diagnostic",   "999",   STRIPE_LINK_999,  False),
+    ("verification", "4,999", STRIPE_LINK_4999, True),
+    ("board",        "9,999", STRIPE_LINK_9999, False),
+)
+
+def price_card(tier, price, link, featured):
+    features = "".join(f"<li>{f}</li>" for f in t(f"tier.{tier}_features"))
+    badge = f'<div class="badge">{t("tier.popular")}</div>' if featured else ""
+    st.markdown(f"""
+    <div class="price-card{' featured' if featured else ''}">
+      {badge}
+      <div class="price-tier">{t(f"tier.{tier}")}</div>
+      <div class="price-amount"><span class="price-cur">$</span>{price}</div>
+      <p style="color:{MUTED};font-size:14px;margin:10px 0 16px;">{t(f"tier.{tier}_desc")}</p>
+      <ul class="feat-list">{features}</ul>
+      <a href="{link}" target="_blank" class="cta-btn{' cta-btn-primary' if featured else ''}">{t(f"tier.{tier}_cta")}</a>
+    </div>
+    """, unsafe_allow_html=True)
+
+def guarantee(style=""):
+    st.markdown(f"""
+    <div class="guarantee"{style}>
+      <h4>{t("guarantee.title")}</h4>
+      <p style="color:{MUTED};margin-top:8px;line-height:1.7;">{t("guarantee.body")}</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+# ============================================================================
+# CALCULATOR + RESULTS — fragments: submitting the form or moving a what-if
+# slider reruns only these, not the header, overview, sample report or pricing
+# ============================================================================
+@st.fragment
+@timing.timed("results")
+def results():
+    if not st.session_state.get('assessment_complete'):
+        return
+    from gfi import benchmark, figures, leak, montecarlo, sensitivity
+
+    employees  = st.session_state.get('employees', 125)
+    total_leak = st.session_state.calculated_leak
+    risk_score = st.session_state.risk_score
+    company    = st.session_state.get('company_name') or t("calc.default_company")
+    result     = st.session_state.get('result', {})
+    breakdown  = result.get('breakdown', {})
+    bands      = result.get('bands')
+    band_line  = ""
+    if bands:
+        p10, _, p90 = bands.leak
+        r10, _, r90 = bands.risk
+        band_line = f"""<div style="color:{DIM};font-size:13px;margin-top:10px;">{t(
+            "results.band", p10=f"${p10:,.0f}", p90=f"${p90:,.0f}", r10=f"{r10:.0f}", r90=f"{r90:.0f}",
+            n=f"{montecarlo.DEFAULT_SAMPLES:,}")}</div>"""
+    previous = st.session_state.get('previous')
+    if previous:
+        from gfi import store
+        change = total_leak / previous['total_leak'] - 1 if previous['total_leak'] else 0.0
+        band_line += f"""<div style="color:{DIM};font-size:13px;margin-top:6px;">{t(
+            "results.previous", quarter=store.quarter_label(store.quarter_of(previous['ts'])),
+            amount=f"${previous['total_leak']:,.0f}", change=f"{change:+.0%}")}</div>"""
+
+    st.markdown(f"""
+    <div class="result-hero">
+      <div class="eyebrow">{t("results.eyebrow")}</div>
+      <div style="color:{TEXT};font-size:17px;margin-bottom:4px;">{t("results.headline", company=company)}</div>
+      <div class="result-num">${total_leak:,.0f}</div>
+      <div style="color:{MUTED};font-size:15px;">{t("results.per_employee", amount=f"${total_leak/max(employees,1):,.0f}")}</div>
+      {band_line}
+    </div>
+    """, unsafe_allow_html=True)
+
+    rank = st.session_state.get('peer_rank')
+    if rank:
+        size = t.table("employee_band").get(rank['size_band'], rank['size_band'])
+        if rank['industry'] != benchmark.ALL:
+            industry = t.table("industry").get(rank['industry'], rank['industry'])
+            peers = t("results.peers_industry", size=size, industry=industry)
+        elif rank['size_band'] != benchmark.ALL:
+            peers = t("results.peers_size", size=size)
+        else:
+            peers = t("results.peers_all")
+        st.markdown(f"""
+        <div class="insight-box">
+          <div class="eyebrow">{t("results.peer_eyebrow")}</div>
+          <div style="color:{TEXT};font-size:16px;">{t("results.peer_text", peers=peers,
+              leak_pct=t.ordinal(rank['leak_pct']), risk_pct=t.ordinal(rank['risk_pct']))}</div>
+          <div style="color:{DIM};font-size:13px;margin-top:6px;">{t("results.peer_basis", n=f"{rank['peers']:,}")}</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    col_gauge, col_risk = st.columns(2)
+
+    with col_gauge:
+        st.plotly_chart(figures.gauge(risk_score, title=t("chart.gauge")), width='stretch')
+
+    with col_risk:
+        if risk_score > 70:
+            level, cls = "high", "risk-hi"
+        elif risk_score > 40:
+            level, cls = "med", "risk-med"
+        else:
+            level, cls = "low", "risk-lo"
+
+        st.markdown(f"""
+        <div class="card" style="height:100%;">
+          <div class="eyebrow">{t("results.risk_eyebrow")}</div>
+          <div style="font-size:22px;font-weight:600;" class="{cls}">{t(f"results.risk_{level}")}</div>
+          <p style="color:{MUTED};margin-top:12px;line-height:1.7;">{t(f"results.risk_{level}_msg")}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Breakdown chart
+    if breakdown:
+        category_labels = t.table("category")
+        st.markdown(f'<div style="font-size:16px;font-weight:500;color:{TEXT};margin:24px 0 12px;">{t("results.leaking")}</div>', unsafe_allow_html=True)
+        st.plotly_chart(figures.breakdown({category_labels[c]: v for c, v in breakdown.items()},
+                                          y_title=t("chart.cost_axis")), width='stretch')
+
+    # Sensitivity / tornado
+    if result.get('sensitivity'):
+        st.markdown(f'<div style="font-size:16px;font-weight:500;color:{TEXT};margin:24px 0 4px;">{t("results.sensitivity")}</div>', unsafe_allow_html=True)
+        st.markdown(f'<p style="color:{MUTED};font-size:14px;margin-bottom:8px;">{t("results.sensitivity_note", step=f"{sensitivity.STEP:.0%}")}</p>', unsafe_allow_html=True)
+        st.plotly_chart(figures.tornado(result['sensitivity'], labels=t.table("input"),
+                                        x_title=t("chart.swing_axis"),
+                                        elasticity_label=t("chart.elasticity")), width='stretch')
+
+    # Intervention roadmap preview
+    plan = result.get('plan')
+    if plan and plan.changes:
+        input_labels = t.table("input")
+        goal = t("results.goal_risk") if risk_score > 40 else t("results.goal_leak")
+        steps = "".join(
+            f"<li>{input_labels[n]}: {cur:,.0f} → {new:,.0f}</li>"
+            for n, (cur, new) in plan.changes.items()
+        )
+        outcome = t("results.roadmap_outcome", r0=f"{risk_score:.0f}", r1=f"{plan.risk:.0f}",
+                    saved=f"${total_leak - plan.leak:,.0f}", pct=f"{plan.leak_reduction:.0%}")
+        heading = t("results.roadmap_heading" if plan.feasible else "results.roadmap_infeasible", goal=goal)
+        st.markdown(f"""
+        <div class="card" style="margin-top:24px;">
+          <div class="eyebrow">{t("results.roadmap_eyebrow")}</div>
+          <div style="color:{TEXT};font-size:15px;margin-bottom:8px;">{heading}</div>
+          <ul class="feat-list" style="margin:8px 0 12px;">{steps}</ul>
+          <div style="color:{MUTED};font-size:14px;">{outcome}</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Live what-if
+    if st.session_state.get('inputs'):
+        st.markdown(f'<div style="font-size:16px;font-weight:500;color:{TEXT};margin:24px 0 4px;">{t("results.whatif")}</div>', unsafe_allow_html=True)
+        st.markdown(f'<p style="color:{MUTED};font-size:14px;margin-bottom:8px;">{t("results.whatif_note")}</p>', unsafe_allow_html=True)
+        live_what_if(st.session_state.inputs, total_leak, risk_score)
+
+    # CTA
+    st.markdown(f"""
+    <div class="insight-box">
+      <div style="font-size:16px;font-weight:500;color:{TEXT};margin-bottom:10px;">{t("results.cta_title")}</div>
+      <p style="color:{MUTED};line-height:1.75;margin:0;">{t("results.cta_body")}</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown(f'<div style="font-size:16px;font-weight:500;color:{TEXT};margin:24px 0 16px;">{t("results.start")}</div>', unsafe_allow_html=True)
+
+    for col, tier in zip(st.columns(2), TIERS[:2]):
+        with col:
+            price_card(*tier)
+
+    guarantee()
+
+@st.fragment
+@timing.timed("calculator")
+def calculator():
+    st.markdown(f'<div style="font-size:22px;font-weight:500;color:{TEXT};margin-bottom:4px;">{t("calc.title")}</div>', unsafe_allow_html=True)
+    st.markdown(f'<p style="color:{MUTED};margin-bottom:24px;">{t("calc.subtitle")}</p>', unsafe_allow_html=True)
+
+    # Option values stay locale-neutral ids (leak.EMP_MAP keys, benchmark
+    # industry names); only format_func is translated. Keys keep answers
+    # across a language switch.
+    bands = t.table("employee_band")
+    industries = t.table("industry")
+
+    with st.form("assessment_form"):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown(f'<div style="font-size:13px;font-family:monospace;letter-spacing:.1em;text-transform:uppercase;color:{ACCENT};margin-bottom:12px;">{t("calc.organisation")}</div>', unsafe_allow_html=True)
+            company_name = st.text_input(t("calc.company"), placeholder=t("calc.company_placeholder"), key="calc_company")
+            employee_count = st.selectbox(t("calc.employees"), list(bands), format_func=bands.get, key="calc_employees")
+            industry = st.selectbox(t("calc.industry"), list(industries), format_func=industries.get, key="calc_industry")
+            avg_salary = st.number_input(t("calc.salary"), min_value=30000, value=75000, step=5000, key="calc_salary")
+            revenue_per_employee = st.number_input(t("calc.revenue"), min_value=50000, value=150000, step=10000, key="calc_revenue")
+            meeting_hours_per_week = st.slider(t("calc.meetings"), 0, 40, 15, key="calc_meetings")
+
+        with col2:
+            st.markdown(f'<div style="font-size:13px;font-family:monospace;letter-spacing:.1em;text-transform:uppercase;color:{ACCENT};margin-bottom:12px;">{t("calc.friction")}</div>', unsafe_allow_html=True)
+            approval_layers = st.slider(t("calc.approval"), 1, 10, 3, key="calc_approval")
+            project_delay_pct = st.slider(t("calc.delay"), 0, 100, 30, key="calc_delay")
+            rework_pct = st.slider(t("calc.rework"), 0, 50, 15, key="calc_rework")
+            decision_time_days = st.slider(t("calc.decision"), 1, 90, 14, key="calc_decision")
+            turnover_rate = st.slider(t("calc.turnover"), 0, 50, 15, key="calc_turnover")
+            customer_complaint_rate = st.slider(t("calc.complaints"), 0, 50, 5, key="calc_complaints")
+
+        submitted = st.form_submit_button(t("calc.submit"))
+
+    # Handle form submission
+    if submitted:
+        import time
+        from gfi import benchmark, cache, leak, repository, store, writebehind
+
+        employees = leak.EMP_MAP[employee_count]
+        inputs = dict(
+            employees=employees,
+            avg_salary=avg_salary,
+            revenue_per_employee=revenue_per_employee,
+            meeting_hours_per_week=meeting_hours_per_week,
+            approval_layers=approval_layers,
+            project_delay_pct=project_delay_pct,
+            rework_pct=rework_pct,
+            decision_time_days=decision_time_days,
+            turnover_rate=turnover_rate,
+            customer_complaint_rate=customer_complaint_rate,
+        )
+        key, inputs = cache.quantize(inputs)
+        result = cache.RESULTS.get_or_compute(key, lambda: build_results(inputs))
+        st.session_state.assessment_complete = True
+        st.session_state.calculated_leak = result['total_leak']
+        st.session_state.risk_score = result['risk_score']
+        st.session_state.company_name = company_name
+        st.session_state.employees = employees
+        st.session_state.inputs = inputs
+        st.session_state.result = result
+        # Quarterly re-measurement: only named clients are tracked. The name is
+        # free text on a public page, so the "previous" line only ever shows a
+        # measurement this session made — never another visitor's
+        client = company_name.strip()
+        measured = st.session_state.setdefault('measured', {})
+        st.session_state.previous = measured.get(client)
+        if client:
+            store.track(client, inputs)
+            measured[client] = {'ts': time.time(), 'total_leak': result['total_leak']}
+        st.session_state.peer_rank = benchmark.INDEX.percentile(
+            industry, employee_count, leak=result['total_leak'], risk=result['risk_score'])
+        benchmark.INDEX.add(industry, employee_count, result['total_leak'], result['risk_score'])
+        writebehind.submit("assessments", repository.assessment(
+            inputs, result, locale=LOCALE, company=company_name, industry=industry,
+            employee_band=employee_count, peers=st.session_state.peer_rank), st.secrets)
+        for k in [k for k in st.session_state if k.startswith('whatif')]:
+            del st.session_state[k]
+
+    results()
+
+    if st.query_params.get("timing"):
+        with st.expander(t("results.timings")):
+            st.markdown(timing.table())
+            from gfi import repository, writebehind
+            if repository.WRITES.summary():
+                st.markdown(timing.table(repository.WRITES))
+                st.markdown(writebehind.table())
 
 # ============================================================================
 # SESSION STATE
@@ -326,70 +407,69 @@ if 'risk_score' not in st.session_state:
 # ============================================================================
 # HEADER
 # ============================================================================
-col_logo, col_title = st.columns([1, 4])
+def _switch_locale():
+    st.query_params["lang"] = st.session_state.locale
+
+col_logo, col_title, col_lang = st.columns([1, 3, 1])
 with col_logo:
     try:
-        st.image("GFILOGO.png", width=80)
+        st.markdown(images.picture("GFILOGO.png", 80, alt="GFI"), unsafe_allow_html=True)
     except:
         st.markdown(f'<div style="font-family:monospace;font-size:22px;color:{ACCENT};font-weight:600;padding-top:8px">GFI</div>', unsafe_allow_html=True)
 
 with col_title:
     st.markdown(f"""
     <div style="padding: 4px 0 0 8px;">
-      <div class="eyebrow">GFI Flow Intelligence · Boston</div>
+      <div class="eyebrow">{t("header.eyebrow")}</div>
       <div style="font-size: 22px; font-weight: 500; color: {TEXT}; line-height: 1.2;">
-        Capital Efficiency Verification
+        {t("header.title")}
       </div>
       <div style="font-size: 14px; color: {MUTED}; margin-top: 4px;">
-        Measure execution before transformation. Prove it after.
+        {t("header.tagline")}
         &nbsp;·&nbsp;
-        <span style="color:{ACCENT}">Free diagnostic — 12 minutes</span>
+        <span style="color:{ACCENT}">{t("header.free")}</span>
       </div>
     </div>
     """, unsafe_allow_html=True)
 
+with col_lang:
+    st.segmented_control(t("page.language"), APP_LOCALES,
+                         format_func=i18n.LOCALES.get, required=True, key="locale",
+                         on_change=_switch_locale, label_visibility="collapsed")
+
 st.markdown(f'<hr style="border-color:{BORDER};margin:16px 0 24px;">', unsafe_allow_html=True)
 
 # ============================================================================
 # FRAMEWORK OVERVIEW
 # ============================================================================
+def _items(key):
+    return "".join(f"<li>{item}</li>" for item in t(key))
+
 st.markdown(f"""
 <div class="card" style="margin-bottom:24px;">
-  <div class="eyebrow">GL Framework</div>
+  <div class="eyebrow">{t("overview.eyebrow")}</div>
   <div style="font-size:18px;color:{TEXT};margin-bottom:12px;font-weight:500;">
-    Structural Intelligence Layer for Institutional Transformation
+    {t("overview.title")}
   </div>
   <p style="color:{MUTED};line-height:1.75;max-width:800px;">
-    Most engagements stop at implementation. GFI measures structural risk 
-    <strong>before</strong> transformation and proves structural improvement <strong>after</strong> — 
-    creating measurable, defensible ROI.
+    {t("overview.body")}
   </p>
 </div>
 <div class="two-col" style="margin-bottom:24px;">
   <div class="card">
-    <div class="eyebrow">Phase I · Pre-Transformation</div>
-    <div style="font-size:16px;color:{TEXT};margin-bottom:10px;font-weight:500;">Quantify structural execution risk</div>
-    <ul style="color:{MUTED};line-height:1.85;padding-left:16px;margin:0 0 16px;">
-      <li>Decision latency density mapping</li>
-      <li>Organizational friction coefficient</li>
-      <li>Capacity loss baseline measurement</li>
-      <li>Execution readiness index</li>
-    </ul>
+    <div class="eyebrow">{t("overview.phase1_eyebrow")}</div>
+    <div style="font-size:16px;color:{TEXT};margin-bottom:10px;font-weight:500;">{t("overview.phase1_title")}</div>
+    <ul style="color:{MUTED};line-height:1.85;padding-left:16px;margin:0 0 16px;">{_items("overview.phase1_items")}</ul>
     <div style="background:rgba(77,163,255,0.07);border:1px solid rgba(77,163,255,0.15);border-radius:6px;padding:10px 14px;font-size:13px;color:{BLUE};">
-      Output: Executive Execution Readiness Scorecard
+      {t("overview.phase1_output")}
     </div>
   </div>
   <div class="card">
-    <div class="eyebrow">Phase II · Post-Transformation</div>
-    <div style="font-size:16px;color:{TEXT};margin-bottom:10px;font-weight:500;">Prove structural improvement</div>
-    <ul style="color:{MUTED};line-height:1.85;padding-left:16px;margin:0 0 16px;">
-      <li>Friction reduction delta analysis</li>
-      <li>Latency compression measurement</li>
-      <li>Execution capacity expansion rate</li>
-      <li>Institutional resilience index</li>
-    </ul>
+    <div class="eyebrow">{t("overview.phase2_eyebrow")}</div>
+    <div style="font-size:16px;color:{TEXT};margin-bottom:10px;font-weight:500;">{t("overview.phase2_title")}</div>
+    <ul style="color:{MUTED};line-height:1.85;padding-left:16px;margin:0 0 16px;">{_items("overview.phase2_items")}</ul>
     <div style="background:rgba(200,245,66,0.06);border:1px solid rgba(200,245,66,0.18);border-radius:6px;padding:10px 14px;font-size:13px;color:{ACCENT};">
-      Output: Transformation Impact Certification Report
+      {t("overview.phase2_output")}
     </div>
   </div>
 </div>
@@ -398,389 +478,62 @@ st.markdown(f"""
 st.markdown(f'<hr style="border-color:{BORDER};margin:8px 0 28px;">', unsafe_allow_html=True)
 
 # ============================================================================
-# TABS
+# SAMPLE REPORT / PRICING — static content, rendered only while its tab is open
 # ============================================================================
-tab1, tab2, tab3 = st.tabs(["Free Assessment", "Sample Report", "Pricing"])
-
-# ════════════════════════════════════════════════════════════════════════════
-# TAB 1 — FREE ASSESSMENT
-# ════════════════════════════════════════════════════════════════════════════
-with tab1:
-    st.markdown(f'<div style="font-size:22px;font-weight:500;color:{TEXT};margin-bottom:4px;">GL Friction Calculator</div>', unsafe_allow_html=True)
-    st.markdown(f'<p style="color:{MUTED};margin-bottom:24px;">Answer 12 questions to estimate your annual capital efficiency loss.</p>', unsafe_allow_html=True)
+def sample_report():
+    st.markdown(f'<div style="font-size:22px;font-weight:500;color:{TEXT};margin-bottom:4px;">{t("sample.title")}</div>', unsafe_allow_html=True)
+    st.markdown(f'<p style="color:{MUTED};margin-bottom:24px;">{t("sample.subtitle")}</p>', unsafe_allow_html=True)
 
-    with st.form("assessment_form"):
-        col1, col2 = st.columns(2)
+    for section in t("sample.sections"):
+        with st.expander(section["title"]):
+            # Markdown hard breaks: the catalog keeps plain newlines
+            st.markdown(section["body"].replace("\n", "  \n"))
 
-        with col1:
-            st.markdown(f'<div style="font-size:13px;font-family:monospace;letter-spacing:.1em;text-transform:uppercase;color:{ACCENT};margin-bottom:12px;">Organisation</div>', unsafe_allow_html=True)
-            company_name = st.text_input("Company Name", placeholder="Acme Corp")
-            employee_count = st.selectbox("Number of Employees", ["1-10","11-50","51-200","201-500","501-1000","1000+"])
-            industry = st.selectbox("Industry", ["Technology/SaaS","Professional Services","Finance","Healthcare","Manufacturing","Retail","Other"])
-            avg_salary = st.number_input("Average Annual Salary (USD)", min_value=30000, value=75000, step=5000)
-            revenue_per_employee = st.number_input("Annual Revenue per Employee (USD)", min_value=50000, value=150000, step=10000)
-            meeting_hours_per_week = st.slider("Avg Meeting Hours / Employee / Week", 0, 40, 15)
 
-        with col2:
-            st.markdown(f'<div style="font-size:13px;font-family:monospace;letter-spacing:.1em;text-transform:uppercase;color:{ACCENT};margin-bottom:12px;">Friction Inputs</div>', unsafe_allow_html=True)
-            approval_layers = st.slider("Approval Layers for Key Decisions", 1, 10, 3)
-            project_delay_pct = st.slider("Project Delay Rate (%)", 0, 100, 30)
-            rework_pct = st.slider("Rework Due to Miscommunication (%)", 0, 50, 15)
-            decision_time_days = st.slider("Avg Days to Make Strategic Decisions", 1, 90, 14)
-            turnover_rate = st.slider("Annual Employee Turnover Rate (%)", 0, 50, 15)
-            customer_complaint_rate = st.slider("Customer Complaint Rate (per 100)", 0, 50, 5)
-
-        st.form_submit_button("Calculate Capital Efficiency Loss →")
-
-    # ── RESULTS ──
-    if st.session_state.get('assessment_complete'):
-
-        emp_map = {"1-10":5,"11-50":30,"51-200":125,"201-500":350,"501-1000":750,"1000+":1500}
-        employees = emp_map.get(st.session_state.get('_emp_count','51-200'), 125)
-        total_leak = st.session_state.calculated_leak
-        risk_score = st.session_state.risk_score
-        company    = st.session_state.get('company_name','Your Company')
-        breakdown  = st.session_state.get('breakdown', {})
+def pricing():
+    st.markdown(f'<div style="font-size:22px;font-weight:500;color:{TEXT};margin-bottom:4px;">{t("pricing.title")}</div>', unsafe_allow_html=True)
+    st.markdown(f'<p style="color:{MUTED};margin-bottom:28px;">{t("pricing.subtitle")}</p>', unsafe_allow_html=True)
 
-        st.markdown(f"""
-        <div class="result-hero">
-          <div class="eyebrow">Assessment Complete</div>
-          <div style="color:{TEXT};font-size:17px;margin-bottom:4px;">{company} · Estimated Annual Capital Efficiency Loss</div>
-          <div class="result-num">${total_leak:,.0f}</div>
-          <div style="color:{MUTED};font-size:15px;">${total_leak/max(employees,1):,.0f} per employee per year</div>
-        </div>
-        """, unsafe_allow_html=True)
+    for col, tier in zip(st.columns(3), TIERS):
+        with col:
+            price_card(*tier)
 
-        col_gauge, col_risk = st.columns(2)
-
-        with col_gauge:
-            risk_color = DANGER if risk_score > 70 else WARN if risk_score > 40 else SUCCESS
-            fig = go.Figure(go.Indicator(
-                mode="gauge+number",
-                value=risk_score,
-                domain={'x':[0,1],'y':[0,1]},
-                title={'text':"Operational Friction Score", 'font':{'color':TEXT,'size':14}},
-                number={'font':{'color':TEXT}},
-                gauge={
-                    'axis':{'range':[0,100],'tickcolor':MUTED,'tickfont':{'color':MUTED}},
-                    'bar':{'color':risk_color},
-                    'bgcolor':SURF2,
-                    'bordercolor':BORDER,
-                    'steps':[
-                        {'range':[0,40],'color':'rgba(52,211,153,0.1)'},
-                        {'range':[40,70],'color':'rgba(245,158,11,0.1)'},
-                        {'range':[70,100],'color':'rgba(255,107,107,0.1)'}
-                    ],
-                }
-            ))
-            fig.update_layout(
-                height=280,
-                paper_bgcolor=SURF,
-                plot_bgcolor=SURF,
-                margin=dict(t=40,b=20,l=20,r=20),
-                font={'color':TEXT}
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-        with col_risk:
-            if risk_score > 70:
-                level, cls, msg = "HIGH RISK", "risk-hi", "Multiple critical friction sources detected. Immediate GL verification recommended."
-            elif risk_score > 40:
-                level, cls, msg = "MODERATE RISK", "risk-med", "Several friction points are impacting capital velocity. Structured verification will identify priority interventions."
-            else:
-                level, cls, msg = "LOW RISK", "risk-lo", "Operations show strong flow characteristics. GL verification can confirm and benchmark efficiency gains."
-
-            st.markdown(f"""
-            <div class="card" style="height:100%;">
-              <div class="eyebrow">Risk Profile</div>
-              <div style="font-size:22px;font-weight:600;" class="{cls}">{level}</div>
-              <p style="color:{MUTED};margin-top:12px;line-height:1.7;">{msg}</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-        # Breakdown chart
-        if breakdown:
-            st.markdown(f'<div style="font-size:16px;font-weight:500;color:{TEXT};margin:24px 0 12px;">Where Capital Is Leaking</div>', unsafe_allow_html=True)
-            df = pd.DataFrame({'Category': list(breakdown.keys()), 'Annual Cost': list(breakdown.values())})
-            fig2 = px.bar(df, x='Category', y='Annual Cost',
-                         color='Annual Cost', color_continuous_scale=[[0,SURF2],[0.5,BLUE],[1,DANGER]])
-            fig2.update_layout(
-                height=320,
-                paper_bgcolor=SURF,
-                plot_bgcolor=SURF,
-                font={'color':TEXT},
-                showlegend=False,
-                coloraxis_showscale=False,
-                xaxis=dict(tickfont={'color':MUTED}, gridcolor=BORDER),
-                yaxis=dict(tickfont={'color':MUTED}, gridcolor=BORDER, title='Annual Cost (USD)')
-            )
-            fig2.update_traces(marker_line_color=BG, marker_line_width=1)
-            st.plotly_chart(fig2, use_container_width=True)
-
-        # CTA
-        st.markdown(f"""
-        <div class="insight-box">
-          <div style="font-size:16px;font-weight:500;color:{TEXT};margin-bottom:10px;">This estimate is the surface. GL verification goes deeper.</div>
-          <p style="color:{MUTED};line-height:1.75;margin:0;">
-            The calculator gives you magnitude. A full GL assessment identifies which specific layers are generating friction, 
-            quantifies the pre/post delta, and produces a board-ready verification report.
-          </p>
-        </div>
-        """, unsafe_allow_html=True)
+    guarantee(' style="margin-top:32px;"')
 
-        st.markdown(f'<div style="font-size:16px;font-weight:500;color:{TEXT};margin:24px 0 16px;">Start Verification</div>', unsafe_allow_html=True)
-
-        c1, c2 = st.columns(2)
-        with c1:
-            st.markdown(f"""
-            <div class="price-card">
-              <div class="price-tier">Diagnostic</div>
-              <div class="price-amount"><span class="price-cur">$</span>999</div>
-              <p style="color:{MUTED};font-size:14px;margin:10px 0 16px;">Baseline GL assessment. Identify friction before committing to transformation.</p>
-              <ul class="feat-list">
-                <li>12-question GL diagnostic</li>
-                <li>Friction source identification</li>
-                <li>GL score + risk classification</li>
-                <li>12-page PDF report</li>
-                <li>48-hour delivery</li>
-              </ul>
-              <a href="{STRIPE_LINK_999}" target="_blank" class="cta-btn">Begin Assessment →</a>
-            </div>
-            """, unsafe_allow_html=True)
-        with c2:
-            st.markdown(f"""
-            <div class="price-card featured">
-              <div class="badge">Most Popular</div>
-              <div class="price-tier">Verification</div>
-              <div class="price-amount"><span class="price-cur">$</span>4,999</div>
-              <p style="color:{MUTED};font-size:14px;margin:10px 0 16px;">Before & after GL measurement. Verify whether transformation improved capital efficiency.</p>
-              <ul class="feat-list">
-                <li>Everything in Diagnostic</li>
-                <li>Pre/post GL delta analysis</li>
-                <li>Layer-by-layer friction map</li>
-                <li>Executive strategy session (2hr)</li>
-                <li>30-day follow-up support</li>
-              </ul>
-              <a href="{STRIPE_LINK_4999}" target="_blank" class="cta-btn cta-btn-primary">Start Verification →</a>
-            </div>
-            """, unsafe_allow_html=True)
+    st.markdown(f'<div style="font-size:16px;font-weight:500;color:{TEXT};margin:32px 0 16px;">{t("pricing.faq_title")}</div>', unsafe_allow_html=True)
 
-        st.markdown(f"""
-        <div class="guarantee">
-          <h4>100% Money-Back Guarantee</h4>
-          <p style="color:{MUTED};margin-top:8px;line-height:1.7;">
-            If you don't discover at least <strong>5× the report cost</strong> in actionable savings, we refund in full. No questions.
-          </p>
-        </div>
-        """, unsafe_allow_html=True)
+    for faq in t("pricing.faqs"):
+        with st.expander(faq["q"]):
+            st.markdown(faq["a"])
 
-    # Handle form submission
-    elif st.session_state.get('_submitted'):
-        emp_map = {"1-10":5,"11-50":30,"51-200":125,"201-500":350,"501-1000":750,"1000+":1500}
-        employees = emp_map.get(st.session_state._emp_count, 125)
-        avg_sal   = st.session_state._avg_salary
-        rev_pe    = st.session_state._rev_pe
-        hourly    = avg_sal / 2080
-
-        mtg_cost   = st.session_state._meeting_h * 0.4 * 50 * employees * hourly
-        delay_cost = (st.session_state._delay_pct/100) * (rev_pe*0.3) * employees * 0.2
-        rework_cost= (st.session_state._rework_pct/100) * avg_sal * employees * 0.15
-        dec_cost   = ((st.session_state._dec_days/7)-1) * 500 * employees * 10
-        turn_cost  = (st.session_state._turnover/100) * employees * avg_sal * 1.5
-        cust_cost  = (st.session_state._cust_rate/100) * employees * (rev_pe*2) * 0.1
-
-        total_leak = max(mtg_cost+delay_cost+rework_cost+dec_cost+turn_cost+cust_cost, 0)
-        risk_factors = [
-            (st.session_state._approval-1)*10,
-            st.session_state._delay_pct*0.5,
-            st.session_state._rework_pct*1.5,
-            (st.session_state._dec_days/30)*20,
-            st.session_state._turnover,
-            st.session_state._cust_rate*1.5
-        ]
-        risk_score = min(sum(risk_factors)/len(risk_factors), 100)
+# ============================================================================
+# TABS — on_change="rerun" makes tab.open reflect the selection, so the
+# Sample Report and Pricing tabs are only built while open. The assessment
+# always renders so its form keeps its values across tab switches. Labels
+# differ per language, so each language keeps its own tab state.
+# ============================================================================
+tab1, tab2, tab3 = st.tabs([t("tabs.assessment"), t("tabs.sample"), t("tabs.pricing")],
+                           key=f"tab_{LOCALE}", on_change="rerun")
 
-        st.session_state.assessment_complete = True
-        st.session_state.calculated_leak = total_leak
-        st.session_state.risk_score = risk_score
-        st.session_state.company_name = st.session_state._company
-        st.session_state.employees = employees
-        st.session_state.breakdown = {
-            "Meeting Overhead": mtg_cost,
-            "Project Delays": delay_cost,
-            "Rework": rework_cost,
-            "Decision Bottlenecks": dec_cost,
-            "Turnover": turn_cost,
-            "Customer Friction": cust_cost
-        }
-        st.rerun()
+# ════════════════════════════════════════════════════════════════════════════
+# TAB 1 — FREE ASSESSMENT
+# ════════════════════════════════════════════════════════════════════════════
+with tab1:
+    calculator()
 
 # ════════════════════════════════════════════════════════════════════════════
 # TAB 2 — SAMPLE REPORT
 # ════════════════════════════════════════════════════════════════════════════
 with tab2:
-    st.markdown(f'<div style="font-size:22px;font-weight:500;color:{TEXT};margin-bottom:4px;">Sample Report Preview</div>', unsafe_allow_html=True)
-    st.markdown(f'<p style="color:{MUTED};margin-bottom:24px;">Your actual report will be fully customized with your organisation\'s data.</p>', unsafe_allow_html=True)
-
-    sections = [
-        ("Page 1 — Executive Summary", f"""
-**GL VERIFICATION REPORT**
-*Prepared for: [Organisation Name]*  ·  *Date: [Report Date]*  ·  *Analyst: Ping Xu (徐萍), GFI Flow Intelligence*
-
----
-
-**Key Findings**
-
-🔴 Primary Friction Source: [Largest cost category]  
-💰 Total Annual Efficiency Loss: $[X]  
-📊 GL Score (Pre-Transformation): [X.XX]  
-📈 Recovery Potential: $[X] within 90 days
-"""),
-        ("Pages 2–3 — Friction Layer Analysis", f"""
-| Layer | Annual Cost | % of Total | Severity |
-|-------|-------------|------------|----------|
-| Meeting Overhead | $[X] | [X]% | High |
-| Project Delays | $[X] | [X]% | Medium |
-| Rework & Errors | $[X] | [X]% | High |
-| Decision Bottlenecks | $[X] | [X]% | Medium |
-| Turnover Costs | $[X] | [X]% | High |
-| Customer Friction | $[X] | [X]% | Low |
-"""),
-        ("Pages 4–5 — Top 3 Friction Sources", """
-**Bottleneck #1: [Specific Issue]**  
-Annual Cost Impact: $[X] · Affected Layers: [Teams]  
-Root Cause: [Structural issue]  
-
-Recommended Intervention:  
-1. [Specific action]  
-2. [Specific action]  
-3. [Specific action]  
-
-Expected GL Delta: +[X.XX] within [timeframe]
-"""),
-        ("Pages 6–7 — GL Score & Benchmarks", """
-GL score breakdown vs. international case benchmarks:
-
-| System | Domain | GL Score |
-|--------|---------|----------|
-| Estonia e-Governance | Digital Identity | 4.17 |
-| Singapore SkillsFuture | Workforce | 3.84 |
-| Your Organisation (pre) | [Domain] | [X.XX] |
-| UK NHS Digital | Healthcare | 0.89 |
-"""),
-        ("Pages 8–12 — Interventions & Methodology", """
-**90-Day Intervention Roadmap**
-
-Phase 1 (0–30 days): Quick wins — immediate friction removal  
-Phase 2 (30–60 days): Structural adjustments  
-Phase 3 (60–90 days): GL re-measurement and delta confirmation  
-
-**Methodology**  
-All scores derived from the GL formula: GL = (Fs × Vn) / (Pd × Cf)  
-Variable definitions, data sources, and confidence intervals documented in full.
-"""),
-    ]
-
-    for title, content in sections:
-        with st.expander(title):
-            st.markdown(content)
+    if tab2.open:
+        sample_report()
 
 # ════════════════════════════════════════════════════════════════════════════
 # TAB 3 — PRICING
 # ════════════════════════════════════════════════════════════════════════════
 with tab3:
-    st.markdown(f'<div style="font-size:22px;font-weight:500;color:{TEXT};margin-bottom:4px;">Engagement Tiers</div>', unsafe_allow_html=True)
-    st.markdown(f'<p style="color:{MUTED};margin-bottom:28px;">Three levels for different transformation stages.</p>', unsafe_allow_html=True)
-
-    c1, c2, c3 = st.columns(3)
-
-    with c1:
-        st.markdown(f"""
-        <div class="price-card">
-          <div class="price-tier">Diagnostic</div>
-          <div class="price-amount"><span class="price-cur">$</span>999</div>
-          <p style="color:{MUTED};font-size:14px;margin:10px 0 16px;">Baseline GL assessment. Identify friction before committing to transformation.</p>
-          <ul class="feat-list">
-            <li>12-question GL diagnostic</li>
-            <li>Friction source identification</li>
-            <li>GL score + risk classification</li>
-            <li>12-page PDF report</li>
-            <li>48-hour delivery</li>
-          </ul>
-          <a href="{STRIPE_LINK_999}" target="_blank" class="cta-btn">Begin Assessment →</a>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with c2:
-        st.markdown(f"""
-        <div class="price-card featured">
-          <div class="badge">Most Popular</div>
-          <div class="price-tier">Verification</div>
-          <div class="price-amount"><span class="price-cur">$</span>4,999</div>
-          <p style="color:{MUTED};font-size:14px;margin:10px 0 16px;">Before & after GL measurement. Verify whether transformation improved capital efficiency.</p>
-          <ul class="feat-list">
-            <li>Everything in Diagnostic</li>
-            <li>Pre/post GL delta analysis</li>
-            <li>Layer-by-layer friction map</li>
-            <li>Executive strategy session (2hr)</li>
-            <li>30-day follow-up support</li>
-          </ul>
-          <a href="{STRIPE_LINK_4999}" target="_blank" class="cta-btn cta-btn-primary">Start Verification →</a>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with c3:
-        st.markdown(f"""
-        <div class="price-card">
-          <div class="price-tier">Board-Ready</div>
-          <div class="price-amount"><span class="price-cur">$</span>9,999</div>
-          <p style="color:{MUTED};font-size:14px;margin:10px 0 16px;">Full independent verification for board presentation, investor reporting, or M&A due diligence.</p>
-          <ul class="feat-list">
-            <li>Everything in Verification</li>
-            <li>Independent auditor sign-off</li>
-            <li>Board presentation format</li>
-            <li>Investor / LP summary</li>
-            <li>Quarterly tracking</li>
-          </ul>
-          <a href="{STRIPE_LINK_9999}" target="_blank" class="cta-btn">Engage →</a>
-        </div>
-        """, unsafe_allow_html=True)
-
-    st.markdown(f"""
-    <div class="guarantee" style="margin-top:32px;">
-      <h4>100% Money-Back Guarantee</h4>
-      <p style="color:{MUTED};margin-top:8px;line-height:1.7;">
-        If you don't discover at least <strong>5× the report cost</strong> in actionable savings, we refund in full. No questions.
-      </p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    st.markdown(f'<div style="font-size:16px;font-weight:500;color:{TEXT};margin:32px 0 16px;">Frequently Asked Questions</div>', unsafe_allow_html=True)
-
-    faqs = [
-        ("What makes this different from traditional consulting?", f"""
-Traditional consulting: $50K–$200K+, 3–6 months, generalised frameworks.
-
-GL Verification: Fixed transparent pricing · Delivered in 24–48 hours · Focused specifically on capital efficiency delta · Actionable from day one.
-"""),
-        ("How is the GL score calculated?", f"""
-The GL formula: **GL = (Fs × Vn) / (Pd × Cf)**
-
-- **Fs** Flow Success Rate (0–1)
-- **Vn** Strategic Value (0–10)
-- **Pd** Pain Duration (annual hours)
-- **Cf** Cognitive Friction Index (0–10)
-
-Full methodology available at [gfiintel.com/methodology.html](https://gfiintel.com/methodology.html)
-"""),
-        ("What if I don't find actionable savings?", """
-100% money-back guarantee. If the report doesn't identify at least 5× its cost in potential savings, full refund, no questions.
-"""),
-    ]
-
-    for q, a in faqs:
-        with st.expander(q):
-            st.markdown(a)
+    if tab3.open:
+        pricing()
 
 # ============================================================================
 # FOOTER
@@ -789,7 +542,7 @@ st.markdown(f'<hr style="border-color:{BORDER};margin:40px 0 24px;">', unsafe_al
 fc1, fc2 = st.columns([1, 4])
 with fc1:
     try:
-        st.image("GFILOGO.png", width=60)
+        st.markdown(images.picture("GFILOGO.png", 60, alt="GFI"), unsafe_allow_html=True)
     except:
         pass
 with fc2:
@@ -797,11 +550,16 @@ with fc2:
     <div style="padding-top:4px;">
       <div style="font-size:14px;font-weight:500;color:{TEXT};">GFI Flow Intelligence</div>
       <div style="font-size:13px;color:{MUTED};margin-top:4px;">
-        Created by Ping Xu (徐萍) · Boston, MA · 
+        {t("footer.created")} ·
         <a href="mailto:gfi@gfiintel.com" style="color:{MUTED};text-decoration:none;">gfi@gfiintel.com</a>
         &nbsp;·&nbsp;
         <a href="https://gfiintel.com" style="color:{MUTED};text-decoration:none;">gfiintel.com</a>
       </div>
-      <div style="font-size:12px;color:{DIM};margin-top:4px;">© 2026 All Rights Reserved</div>
+      <div style="font-size:12px;color:{DIM};margin-top:4px;">{t("footer.rights")}</div>
     </div>
     """, unsafe_allow_html=True)
+
+# ============================================================================
+# RERUN TIMING — full-script reruns; fragment reruns record their own scope
+# ============================================================================
+timing.TIMINGS.record("script", timing.elapsed(_t0))
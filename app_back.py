@@ -1,25 +1,28 @@
 import streamlit as st
 
-st.set_page_config(page_title="GFI Flow Intelligence", page_icon="🛡️", layout="wide")
-st.title("GFI Flow Intelligence")
-st.caption("Independent Diagnostic Reports · Confidential · Non-Political")
-
-NAV = {
-    "EN": [
-        st.Page("app_pages/en_overview.py", title="Overview"),
-        st.Page("app_pages/en_methodology.py", title="Methodology"),
-        st.Page("app_pages/en_case_studies.py", title="Case Studies"),
-        st.Page("app_pages/en_founder.py", title="Founder"),
-        st.Page("app_pages/en_contact.py", title="Contact"),
-    ],
-    "中文": [
-        st.Page("app_pages/cn_overview.py", title="概覽"),
-        st.Page("app_pages/cn_methodology.py", title="方法論"),
-        st.Page("app_pages/cn_case_studies.py", title="案例研究"),
-        st.Page("app_pages/cn_founder.py", title="創辦人"),
-        st.Page("app_pages/cn_contact.py", title="聯絡"),
-    ],
-}
+from gfi import i18n
+
+SITE_LOCALES = ("en", "zh-TW")
+LOCALE = i18n.select(st.session_state, st.query_params, available=SITE_LOCALES)
+t = i18n.catalog(LOCALE)
+
+st.set_page_config(page_title=t("site.title"), page_icon="🛡️", layout="wide")
+st.title(t("site.title"))
+st.caption(t("site.caption"))
+
+
+def _switch_locale():
+    st.query_params["lang"] = st.session_state.locale
+
+
+st.sidebar.segmented_control(t("page.language"), SITE_LOCALES, format_func=i18n.LOCALES.get,
+                             required=True, key="locale", on_change=_switch_locale)
+
+# One page per topic; each reads its copy from the session's catalog
+NAV = [
+    st.Page(f"app_pages/{page}.py", title=t(f"site.nav.{page}"))
+    for page in ("overview", "methodology", "case_studies", "founder", "contact")
+]
 
 pg = st.navigation(NAV)
 pg.run()
@@ -0,0 +1,10 @@
+import streamlit as st
+
+from gfi import i18n
+
+t = i18n.catalog(st.session_state.get("locale", i18n.DEFAULT))
+
+st.title(t("site.nav.case_studies"))
+st.caption(t("site.case_studies.caption"))
+
+st.markdown("\n".join(f"- {p}" for p in t("site.case_studies.points")))
@@ -1,10 +0,0 @@
-import streamlit as st
-
-st.title("案例研究")
-st.caption("典型模式（可匿名化）。")
-
-st.markdown(
-    "- 積壓螺旋：延遲增加 → 上訴增加 → 延遲更嚴重\n"
-    "- 資格迷宮：小不一致造成連鎖拒件\n"
-    "- 驗證瓶頸：單一隊列卡死整條管線"
-)
@@ -1,11 +0,0 @@
-import streamlit as st
-
-st.title("創辦人")
-st.caption("關於 GFI Flow Intelligence 的設計者。")
-
-st.markdown("**Ping Xu（徐萍）**  \n治理/流程摩擦診斷設計者。")
-
-st.write(
-    "本工具聚焦可量化的執行失敗：機構如何因流程摩擦、延遲、規則堆疊而流失吞吐量，"
-    "以及如何把流動性修復回來。"
-)
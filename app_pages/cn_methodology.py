@@ -1,13 +0,0 @@
-import streamlit as st
-
-st.title("方法論")
-st.caption("可審計的邏輯，用人話講清楚。")
-
-st.markdown(
-    "- 摩擦：流程阻力\n"
-    "- 延遲/滯後：步驟之間浪費的時間\n"
-    "- 吞吐量：單位時間的有效產出\n"
-    "- 蒸發：因摩擦與延遲造成的能力/價值流失"
-)
-
-st.info("完整公式與細節可在正式交付報告中提供。")
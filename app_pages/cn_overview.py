@@ -1,11 +0,0 @@
-import streamlit as st
-
-st.title("概覽")
-st.caption("獨立診斷報告 · 保密 · 非政治化")
-
-st.write(
-    "GFI 用來量化制度執行的摩擦與延遲，讓決策者看見吞吐量在哪裡崩潰、規則在哪裡過度束縛，"
-    "以及時間損失如何變成隱性成本。"
-)
-
-st.markdown("- 獨立\n- 保密\n- 非政治化")
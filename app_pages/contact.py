@@ -0,0 +1,86 @@
+import streamlit as st
+import textwrap
+from datetime import datetime
+
+from gfi import i18n
+
+t = i18n.catalog(st.session_state.get("locale", i18n.DEFAULT))
+
+st.title(t("site.contact.title"))
+st.caption(t("site.contact.caption"))
+
+GOOGLE_FORM_URL = "https://forms.gle/96rG6e4PTAJgDkcJ9"
+EMAIL = "pingshyu0@gmail.com"
+LINKEDIN = "https://www.linkedin.com/in/ping-shyu/"
+
+c1, c2 = st.columns([1.2, 1])
+with c1:
+    st.subheader(t("site.contact.direct"))
+    st.markdown(t("site.contact.email", email=EMAIL))
+    st.markdown(t("site.contact.linkedin", url=LINKEDIN))
+with c2:
+    st.subheader(t("site.contact.engagement"))
+    st.markdown(t("site.contact.engagement_body"))
+
+st.divider()
+
+st.subheader(t("site.contact.form"))
+st.link_button(t("site.contact.form_button"), GOOGLE_FORM_URL)
+
+st.divider()
+
+st.subheader(t("site.contact.pay"))
+st.markdown(
+    """
+<script async src="https://js.stripe.com/v3/buy-button.js"></script>
+<stripe-buy-button
+  buy-button-id="buy_btn_1T1sUvRw9CVw8oC7f8G5G2UR"
+  publishable-key="pk_live_51SzplSRw9CVw8oC78qxLy57eZRzWrELB0tBzLJa9FWOkxijGMyDDxrr1si3LdzdOEkoNxY4k5pXwCGAshI5iJ1ul00QnZ6DdJQ">
+</stripe-buy-button>
+""",
+    unsafe_allow_html=True
+)
+
+st.divider()
+
+st.subheader(t("site.contact.upload"))
+uploaded = st.file_uploader(
+    t("site.contact.upload_label"),
+    type=["csv", "xlsx", "pdf"],
+    accept_multiple_files=True
+)
+
+# Keys keep what was typed when the sidebar switches language
+org = st.text_input(t("site.contact.org"), key="contact_org")
+contact_name = st.text_input(t("site.contact.name"), key="contact_name")
+contact_email = st.text_input(t("site.contact.contact_email"), key="contact_email")
+notes = st.text_area(t("site.contact.notes"), key="contact_notes")
+
+if st.button(t("site.contact.save"), disabled=not (contact_email or org or notes or uploaded)):
+    from gfi import repository, writebehind
+
+    row = repository.lead(email=contact_email, name=contact_name, organisation=org, notes=notes,
+                          files=[f.name for f in uploaded or ()], locale=st.session_state.get("locale"))
+    if writebehind.submit("leads", row, st.secrets):
+        st.success(t("site.contact.saved"))
+    else:
+        st.error(t("site.contact.save_failed"))
+
+st.divider()
+
+st.subheader(t("site.contact.email_heading"))
+now = datetime.now().strftime("%Y-%m-%d %H:%M")
+file_list = "\n".join([f"- {f.name}" for f in uploaded]) if uploaded else t("site.contact.no_files")
+not_provided = t("site.contact.not_provided")
+intake_text = t(
+    "site.contact.intake",
+    now=now,
+    org=org or not_provided,
+    name=contact_name or not_provided,
+    email=contact_email or not_provided,
+    files=file_list,
+    notes=notes or t("site.contact.none"),
+)
+
+st.markdown(t("site.contact.send_to", email=EMAIL))
+st.text_area(t("site.contact.copy"), value=textwrap.dedent(intake_text).strip(), height=220)
@@ -1,10 +0,0 @@
-import streamlit as st
-
-st.title("Case Studies")
-st.caption("Representative patterns (anonymized).")
-
-st.markdown(
-    "- Backlog spiral: delay increases appeals, which increases delay\n"
-    "- Eligibility maze: small mismatches cause cascading denials\n"
-    "- Verification choke point: one queue stalls the whole pipeline"
-)
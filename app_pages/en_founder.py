@@ -1,11 +0,0 @@
-import streamlit as st
-
-st.title("Founder")
-st.caption("About the creator of GFI Flow Intelligence.")
-
-st.markdown("**Ping Xu (徐萍)**  \nGovernance / operational friction diagnostic designer.")
-
-st.markdown(
-    "This work focuses on measurable execution failure: how institutions lose capacity through "
-    "process friction, delay, and rule overload—and how to restore flow."
-)
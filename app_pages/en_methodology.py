@@ -1,13 +0,0 @@
-import streamlit as st
-
-st.title("Methodology")
-st.caption("Audit-grade logic, explained in plain language.")
-
-st.markdown(
-    "- Friction: process resistance\n"
-    "- Delay/Latency: time lost between steps\n"
-    "- Throughput: outcomes delivered per unit time\n"
-    "- Evaporation: capacity/value lost due to friction + delay"
-)
-
-st.info("Full formulas and detailed model notes can be included in deliverable reports when needed.")
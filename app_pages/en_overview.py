@@ -1,11 +0,0 @@
-import streamlit as st
-
-st.title("Overview")
-st.caption("Independent diagnostic reports · Confidential · Non-political")
-
-st.write(
-    "GFI measures institutional friction and execution delay—so leaders can see where throughput collapses, "
-    "where rules over-constrain, and where time loss turns into hidden cost."
-)
-
-st.markdown("- Independent\n- Confidential\n- Non-political")
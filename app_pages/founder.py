@@ -0,0 +1,12 @@
+import streamlit as st
+
+from gfi import i18n
+
+t = i18n.catalog(st.session_state.get("locale", i18n.DEFAULT))
+
+st.title(t("site.nav.founder"))
+st.caption(t("site.founder.caption"))
+
+st.markdown(t("site.founder.name"))
+
+st.write(t("site.founder.body"))
@@ -0,0 +1,12 @@
+import streamlit as st
+
+from gfi import i18n
+
+t = i18n.catalog(st.session_state.get("locale", i18n.DEFAULT))
+
+st.title(t("site.nav.methodology"))
+st.caption(t("site.methodology.caption"))
+
+st.markdown("\n".join(f"- {p}" for p in t("site.methodology.points")))
+
+st.info(t("site.methodology.note"))
@@ -0,0 +1,12 @@
+import streamlit as st
+
+from gfi import i18n
+
+t = i18n.catalog(st.session_state.get("locale", i18n.DEFAULT))
+
+st.title(t("site.nav.overview"))
+st.caption(t("site.overview.caption"))
+
+st.write(t("site.overview.body"))
+
+st.markdown("\n".join(f"- {p}" for p in t("site.overview.points")))
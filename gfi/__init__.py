@@ -0,0 +1 @@
+"""GFI Flow Intelligence — shared scoring engines for the Streamlit apps."""
@@ -0,0 +1,452 @@
+"""
+Local HTTP JSON service for GL scoring, shared by the static calculators.
+
+The GL math runs in JavaScript in ``ghost-gdp.html`` (``runCalc()``),
+``enterprise.html`` (the quick scan's ``calcResult()``) and the case pages;
+this serves ``gfi.gl`` over HTTP so they — and anything else — can score
+against the one Python engine. Standard library only (plus NumPy, which
+``gfi.gl`` already needs).
+
+    GET  /gl?fs=0.6&vn=7&pd=4&cf=6[&srf=1.5][&wage=40&volume=200]
+    POST /gl/batch     {"fs": [...], "vn": [...], "pd": [...], "cf": [...], ...}
+                       or {"rows": [{"fs": 0.6, "vn": 7, ...}, ...]}
+    GET  /health       liveness
+    GET  /stats        request counts and cache hit rates
+
+Responses carry ``gl`` (Formula (1)), ``gl_r`` (Formula (2), ``null``
+without ``srf``), ``ghost_gdp_pct``, ``friction_pct``, ``band`` (of
+``gl_r`` where given) and ``monthly_cost`` (``null`` without ``wage`` and
+``volume``). A batch answers in columns, one array per field, in row order.
+Values are unrounded; rounding is the page's job. Any value that is not
+finite (e.g. from ``pd=inf``) is sent as ``null``, so bodies are always
+strict JSON.
+
+Every response is a pure function of its inputs, so it is cached twice:
+server-side in an LRU keyed by the parsed inputs (GET) or the body hash
+(batch), and client-side through a strong ``ETag`` — a matching
+``If-None-Match`` gets ``304`` with no body.
+
+    python -m gfi.api serve --port 8765     # add --cpu 0 to pin to one core
+    python -m gfi.api bench --seconds 5     # sustained requests/s per endpoint
+"""
+import argparse
+import functools
+import hashlib
+import json
+import logging
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from http import HTTPStatus
+from http.client import HTTPConnection
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from gfi import gl
+from gfi.cache import LRUCache
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+MAX_BATCH_ROWS = 50_000
+MAX_BODY_BYTES = 8 * 1024 * 1024
+SINGLE_CACHE_SIZE = 4096
+BATCH_CACHE_SIZE = 64       # batch responses run to hundreds of KB each
+
+REQUIRED = ("fs", "vn", "pd", "cf")
+OPTIONAL = ("srf", "wage", "volume")
+OPTIONAL_DEFAULTS = {"srf": np.nan, "wage": 0.0, "volume": 0.0}
+
+# GET results depend only on the query, so browsers and proxies may keep them
+CACHE_CONTROL = "public, max-age=86400"
+
+log = logging.getLogger("gfi.api")
+
+
+class RequestError(ValueError):
+    """A client error, answered with ``status`` and a JSON ``{"error": …}``."""
+
+    def __init__(self, message, status=HTTPStatus.BAD_REQUEST):
+        super().__init__(message)
+        self.status = status
+
+
+# ============================================================================
+# SCORING
+# ============================================================================
+def _nullable(a):
+    """Float array → list with ``None`` where not finite (JSON has no NaN)."""
+    a = np.asarray(a, dtype=float)
+    if np.isfinite(a).all():
+        return a.tolist()
+    return np.where(np.isfinite(a), a, None).tolist()
+
+
+def score_columns(columns):
+    """Score ``{field: array}`` inputs; returns ``{output field: list}``."""
+    missing = [c for c in REQUIRED if c not in columns]
+    if missing:
+        raise RequestError(f"missing input(s): {', '.join(missing)}")
+    try:
+        arrays = {k: np.asarray(columns[k], dtype=float) for k in REQUIRED + OPTIONAL if k in columns}
+    except (TypeError, ValueError):
+        raise RequestError("inputs must be numbers") from None
+    nested = [k for k, a in arrays.items() if a.ndim > 1]
+    if nested:
+        raise RequestError(f"input(s) must be numbers or flat arrays: {', '.join(nested)}")
+    lengths = {a.size for a in arrays.values() if a.ndim}
+    if len(lengths) > 1:
+        raise RequestError(f"input columns differ in length: {sorted(lengths)}")
+
+    srf = arrays.get("srf")
+    try:
+        # Infinite inputs are in the domain; their NaN outputs are sent as null
+        with np.errstate(invalid="ignore", divide="ignore"):
+            base = gl.score(*(arrays[k] for k in REQUIRED),
+                            wage=arrays.get("wage", 0), volume=arrays.get("volume", 0))
+            adjusted = base if srf is None else gl.score(*(arrays[k] for k in REQUIRED), srf=srf)
+    except ValueError as e:
+        raise RequestError(str(e)) from None
+
+    n = max(lengths, default=1)
+
+    def full(a):
+        return np.broadcast_to(a, (n,))
+
+    gl_r = np.full(n, np.nan) if srf is None else np.where(np.isfinite(srf), adjusted.gl, np.nan)
+    return {
+        "gl": _nullable(full(base.gl)),
+        "gl_r": _nullable(full(gl_r)),
+        "ghost_gdp_pct": _nullable(full(base.ghost_gdp_pct)),
+        "friction_pct": _nullable(full(base.friction_pct)),
+        "band": full(adjusted.band).tolist(),
+        "monthly_cost": _nullable(full(base.monthly_cost)),
+    }
+
+
+def _rows_to_columns(rows):
+    if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+        raise RequestError('"rows" must be a list of objects')
+    columns = {}
+    for k in REQUIRED + OPTIONAL:
+        if any(k in r for r in rows):
+            columns[k] = [r.get(k, OPTIONAL_DEFAULTS.get(k)) for r in rows]
+    return columns
+
+
+def score_batch(payload):
+    """Score a batch request body (columnar, or ``{"rows": [...]}``)."""
+    if not isinstance(payload, dict):
+        raise RequestError("body must be a JSON object")
+    columns = _rows_to_columns(payload["rows"]) if "rows" in payload else payload
+    for k in REQUIRED + OPTIONAL:
+        if k in columns and not isinstance(columns[k], list):
+            raise RequestError(f"{k!r} must be an array in a batch")
+    n = len(columns.get("fs", []))
+    if n > MAX_BATCH_ROWS:
+        raise RequestError(f"{n} rows; at most {MAX_BATCH_ROWS} per request",
+                           HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+    # null srf = Formula (1) for that row; null wage / volume = no cost estimate
+    columns = {k: [OPTIONAL_DEFAULTS[k] if v is None else v for v in col] if k in OPTIONAL_DEFAULTS else col
+               for k, col in columns.items()}
+    return {"n": n, **score_columns(columns)}
+
+
+def _query_inputs(query):
+    params = parse_qs(query, keep_blank_values=False)
+    unknown = set(params) - set(REQUIRED + OPTIONAL)
+    if unknown:
+        raise RequestError(f"unknown parameter(s): {', '.join(sorted(unknown))}")
+    try:
+        return {k: float(v[-1]) for k, v in params.items()}
+    except ValueError:
+        raise RequestError("parameters must be numbers") from None
+
+
+# ============================================================================
+# HTTP
+# ============================================================================
+def _encode(obj):
+    body = json.dumps(obj, separators=(",", ":"), allow_nan=False).encode("utf-8")
+    return f'"{hashlib.sha256(body).hexdigest()[:20]}"', body
+
+
+def _guarded(route):
+    """Answer an unexpected exception with a JSON 500 instead of dropping the connection."""
+    @functools.wraps(route)
+    def inner(self):
+        try:
+            route(self)
+        except Exception:
+            log.exception("%s %s failed", self.command, self.path)
+            self.close_connection = True
+            self._error(RequestError("internal error", HTTPStatus.INTERNAL_SERVER_ERROR))
+    return inner
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"     # keep-alive: every response sets Content-Length
+    server_version = "gfi-api"
+    quiet = True
+
+    def setup(self):
+        super().setup()
+        # Headers and body are separate writes; without this, Nagle holds the
+        # body until the client's delayed ACK (~40 ms per keep-alive request)
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    # ── routes ──
+    @_guarded
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == "/gl":
+            try:
+                inputs = _query_inputs(url.query)
+            except RequestError as e:
+                return self._error(e)
+            key = tuple(sorted(inputs.items()))
+            self._cached(self.server.single, key, lambda: self._single(inputs), CACHE_CONTROL)
+        elif url.path == "/health":
+            self._send(HTTPStatus.OK, *_encode({"ok": True}), cache="no-store")
+        elif url.path == "/stats":
+            self._send(HTTPStatus.OK, *_encode(self.server.stats()), cache="no-store")
+        else:
+            self._error(RequestError("not found", HTTPStatus.NOT_FOUND))
+
+    @_guarded
+    def do_POST(self):
+        if urlsplit(self.path).path != "/gl/batch":
+            return self._error(RequestError("not found", HTTPStatus.NOT_FOUND))
+        try:
+            length = self._content_length()
+        except RequestError as e:
+            # The body, if any, cannot be skipped reliably
+            self.close_connection = True
+            return self._error(e)
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            return self._error(RequestError(f"body over {MAX_BODY_BYTES} bytes",
+                                            HTTPStatus.REQUEST_ENTITY_TOO_LARGE))
+        body = self.rfile.read(length)
+        key = hashlib.sha256(body).digest()
+        self._cached(self.server.batch, key, lambda: score_batch(self._json(body)), "no-cache")
+
+    def do_OPTIONS(self):
+        self._send(HTTPStatus.NO_CONTENT, None, b"", cache="max-age=86400",
+                   extra={"Access-Control-Allow-Methods": "GET, POST, OPTIONS",
+                          "Access-Control-Allow-Headers": "Content-Type, If-None-Match",
+                          "Access-Control-Max-Age": "86400"})
+
+    # ── helpers ──
+    def _content_length(self):
+        value = self.headers.get("Content-Length")
+        if value is None:
+            raise RequestError("Content-Length required", HTTPStatus.LENGTH_REQUIRED)
+        if not (value.strip().isascii() and value.strip().isdigit()):
+            raise RequestError(f"invalid Content-Length {value!r}")
+        return int(value)
+
+    @staticmethod
+    def _single(inputs):
+        return {k: v[0] for k, v in score_columns(inputs).items()}
+
+    @staticmethod
+    def _json(body):
+        try:
+            return json.loads(body)
+        except ValueError:
+            raise RequestError("body is not valid JSON") from None
+
+    def _cached(self, cache, key, compute, cache_control):
+        """Answer from ``cache`` (computing on a miss), honouring If-None-Match."""
+        try:
+            etag, body = cache.get_or_compute(key, lambda: _encode(compute()))
+        except RequestError as e:
+            return self._error(e)
+        if etag in (t.strip() for t in self.headers.get("If-None-Match", "").split(",")):
+            return self._send(HTTPStatus.NOT_MODIFIED, etag, b"", cache=cache_control)
+        self._send(HTTPStatus.OK, etag, body, cache=cache_control)
+
+    def _error(self, e):
+        self._send(e.status, *_encode({"error": str(e)}), cache="no-store")
+
+    def _send(self, status, etag, body, cache, extra=None):
+        self.server.count(status)
+        self.send_response(status)
+        if status != HTTPStatus.NO_CONTENT and status != HTTPStatus.NOT_MODIFIED:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", cache)
+        if etag:
+            self.send_header("ETag", etag)
+        # The static pages call this from their own origin
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Expose-Headers", "ETag")
+        for name, value in (extra or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address=(DEFAULT_HOST, DEFAULT_PORT), handler=Handler):
+        super().__init__(address, handler)
+        self.single = LRUCache(SINGLE_CACHE_SIZE)
+        self.batch = LRUCache(BATCH_CACHE_SIZE)
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def count(self, status):
+        with self._lock:
+            self._counts[int(status)] = self._counts.get(int(status), 0) + 1
+
+    def stats(self):
+        with self._lock:
+            responses = {str(k): v for k, v in sorted(self._counts.items())}
+        return {"responses": responses, "single_cache": self.single.stats(), "batch_cache": self.batch.stats()}
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, cpu=None, verbose=False):
+    if cpu is not None:
+        os.sched_setaffinity(0, {cpu})
+    Handler.quiet = not verbose
+    with Server((host, port)) as httpd:
+        print(f"GL API on http://{host}:{httpd.server_address[1]}  (Ctrl-C to stop)", flush=True)
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+# ============================================================================
+# LOAD TEST
+# ============================================================================
+def _random_query(rng):
+    return (f"fs={rng.uniform(0.05, 1):.3f}&vn={rng.uniform(0.5, 10):.2f}"
+            f"&pd={rng.uniform(0.5, 60):.1f}&cf={rng.uniform(0.5, 10):.2f}")
+
+
+def _random_batch(rng, n):
+    return json.dumps({
+        "fs": [round(rng.uniform(0.05, 1), 3) for _ in range(n)],
+        "vn": [round(rng.uniform(0.5, 10), 2) for _ in range(n)],
+        "pd": [round(rng.uniform(0.5, 60), 1) for _ in range(n)],
+        "cf": [round(rng.uniform(0.5, 10), 2) for _ in range(n)],
+        "srf": [rng.choice([None, 1.5, 2.0]) for _ in range(n)],
+    }).encode()
+
+
+def _client(port, scenario, seconds, seed, batch_rows, out):
+    """One keep-alive connection issuing ``scenario`` requests for ``seconds``."""
+    rng = random.Random(seed)
+    conn = HTTPConnection(DEFAULT_HOST, port)
+    fixed = "/gl?fs=0.6&vn=7&pd=4&cf=6"
+    etag = None
+    # Built up front so the clients spend the shared CPU on requests, not JSON.
+    # "uncached" cycles through more distinct bodies than the server keeps.
+    pool = {"batch cached": 8, "batch uncached": BATCH_CACHE_SIZE}.get(scenario, 0)
+    bodies = [_random_batch(rng, batch_rows) for _ in range(pool)]
+    latencies = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        headers = {}
+        if scenario == "single cached":
+            method, path, body = "GET", fixed, None
+        elif scenario == "single 304":
+            method, path, body = "GET", fixed, None
+            if etag:
+                headers["If-None-Match"] = etag
+        elif scenario == "single uncached":
+            method, path, body = "GET", "/gl?" + _random_query(rng), None
+        else:
+            method, path = "POST", "/gl/batch"
+            body = bodies[len(latencies) % len(bodies)]
+            headers["Content-Type"] = "application/json"
+        t0 = time.perf_counter()
+        conn.request(method, path, body=body, headers=headers)
+        resp = conn.getresponse()
+        resp.read()
+        latencies.append(time.perf_counter() - t0)
+        etag = resp.getheader("ETag") or etag
+        if resp.status >= 400:
+            raise RuntimeError(f"{scenario}: HTTP {resp.status}")
+    conn.close()
+    out.extend(latencies)
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind((DEFAULT_HOST, 0))
+        return s.getsockname()[1]
+
+
+def bench(seconds=5.0, clients=4, batch_rows=1000, cpu=0):
+    """Run each scenario against a server pinned to ``cpu``; returns result rows."""
+    port = _free_port()
+    cmd = [sys.executable, "-m", "gfi.api", "serve", "--port", str(port)]
+    if cpu is not None:
+        cmd += ["--cpu", str(cpu)]
+    server = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    try:
+        server.stdout.readline()    # wait for the banner
+        results = []
+        for scenario in ("single cached", "single 304", "single uncached", "batch cached", "batch uncached"):
+            latencies, threads = [], []
+            for i in range(clients):
+                t = threading.Thread(target=_client, args=(port, scenario, seconds, i, batch_rows, latencies))
+                threads.append(t)
+                t.start()
+            for t in threads:
+                t.join()
+            lat = np.sort(np.asarray(latencies)) * 1000
+            rps = len(lat) / seconds
+            rows = rps * batch_rows if scenario.startswith("batch") else rps
+            results.append((scenario, len(lat), rps, rows, np.percentile(lat, 50), np.percentile(lat, 99)))
+        return results
+    finally:
+        server.terminate()
+        server.wait()
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m gfi.api", description="GL scoring over HTTP.")
+    sub = ap.add_subparsers(dest="command", required=True)
+    s = sub.add_parser("serve", help="run the API")
+    s.add_argument("--host", default=DEFAULT_HOST)
+    s.add_argument("--port", type=int, default=DEFAULT_PORT)
+    s.add_argument("--cpu", type=int, help="pin the server to this CPU")
+    s.add_argument("-v", "--verbose", action="store_true", help="log every request")
+    b = sub.add_parser("bench", help="load-test a fresh server pinned to one core")
+    b.add_argument("--seconds", type=float, default=5.0, help="per scenario")
+    b.add_argument("--clients", type=int, default=4, help="concurrent keep-alive connections")
+    b.add_argument("--batch-rows", type=int, default=1000)
+    b.add_argument("--cpu", type=int, default=0, help="CPU the server is pinned to")
+    args = ap.parse_args(argv)
+
+    if args.command == "serve":
+        serve(args.host, args.port, args.cpu, args.verbose)
+        return
+    print(f"{args.clients} clients × {args.seconds:g}s per scenario, server on CPU {args.cpu}"
+          f" ({os.cpu_count()} CPUs; clients share them)")
+    print(f"{'scenario':<16} {'requests':>9} {'req/s':>9} {'rows/s':>11} {'p50 ms':>8} {'p99 ms':>8}")
+    for scenario, n, rps, rows, p50, p99 in bench(args.seconds, args.clients, args.batch_rows, args.cpu):
+        print(f"{scenario:<16} {n:>9,} {rps:>9,.0f} {rows:>11,.0f} {p50:>8.2f} {p99:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
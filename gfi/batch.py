@@ -0,0 +1,186 @@
+"""
+Bulk portfolio scoring: stream a CSV or Parquet file of assessments through
+the leak model in fixed-size chunks and write results as they are produced.
+
+    python -m gfi.batch portfolio.csv scored.parquet --chunk-size 100000
+
+Input columns use the calculator's field names (``avg_salary``,
+``project_delay_pct``, …). Headcount is read from ``employees`` or, failing
+that, from the ``employee_count`` band (``"51-200"``) via ``leak.EMP_MAP``.
+Any other columns (company, industry, ids) are passed through unchanged.
+
+With ``--model gl`` rows are GL systems instead: ``fs``, ``vn``, ``pd``,
+``cf`` and optionally ``srf`` (Formula (2) where present), ``wage`` and
+``volume``.
+
+With ``--model delta`` each row pairs two snapshots of one client: every
+input appears twice, as ``<name>_pre`` and ``<name>_post``.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from gfi import delta, gl, leak
+
+DEFAULT_CHUNK_SIZE = 50_000
+REQUIRED = tuple(c for c in leak.INPUTS if c != "employees")
+GL_REQUIRED = ("fs", "vn", "pd", "cf")
+GL_OPTIONAL = ("srf", "wage", "volume")
+
+
+# ============================================================================
+# READERS / WRITERS
+# ============================================================================
+def _format(path):
+    suffix = Path(path).suffix.lower()
+    if suffix in (".csv", ".txt"):
+        return "csv"
+    if suffix in (".parquet", ".pq"):
+        return "parquet"
+    raise ValueError(f"Unsupported file type: {path} (expected .csv or .parquet)")
+
+
+def read_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield DataFrames of at most ``chunk_size`` rows."""
+    if _format(path) == "csv":
+        yield from pd.read_csv(path, chunksize=chunk_size)
+    else:
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+
+
+class ChunkWriter:
+    """Append scored chunks to a CSV or Parquet file without holding them."""
+
+    def __init__(self, path):
+        self.path = path
+        self.fmt = _format(path)
+        self._parquet = None
+        self._wrote_header = False
+
+    def write(self, df):
+        if self.fmt == "csv":
+            df.to_csv(self.path, mode="a" if self._wrote_header else "w",
+                      header=not self._wrote_header, index=False)
+            self._wrote_header = True
+            return
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self._parquet is None:
+            self._parquet = pq.ParquetWriter(self.path, table.schema)
+        self._parquet.write_table(table.cast(self._parquet.schema))
+
+    def close(self):
+        if self._parquet is not None:
+            self._parquet.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ============================================================================
+# SCORING
+# ============================================================================
+def _leak_inputs(df, suffix=""):
+    """Model inputs from ``df``, reading ``<name><suffix>`` columns."""
+    missing = [c + suffix for c in REQUIRED if c + suffix not in df.columns]
+    employees = None
+    if "employees" + suffix in df.columns:
+        employees = df["employees" + suffix].to_numpy(dtype=float)
+    elif "employee_count" + suffix in df.columns:
+        bands = df["employee_count" + suffix].astype(str)
+        unknown = sorted(set(bands) - set(leak.EMP_MAP))
+        if unknown:
+            raise ValueError(f"Unknown employee_count bands: {', '.join(unknown)}")
+        employees = bands.map(leak.EMP_MAP).to_numpy(dtype=float)
+    else:
+        missing.insert(0, f"employees{suffix} (or employee_count{suffix})")
+    if missing:
+        raise ValueError(f"Missing input columns: {', '.join(missing)}")
+    return {"employees": employees, **{c: df[c + suffix].to_numpy(dtype=float) for c in REQUIRED}}
+
+
+def score_frame(df):
+    """Return ``df`` with total leak, risk score and per-category columns appended."""
+    result = leak.score(**_leak_inputs(df))
+    scored = {"total_leak": result.total, "risk_score": result.risk}
+    for i, c in enumerate(leak.CATEGORIES):
+        scored[f"leak_{c}"] = result.breakdown[:, i]
+    return df.assign(**scored)
+
+
+def score_delta_frame(df):
+    """Return ``df`` with the pre/post delta columns of ``delta.COMPACT_FIELDS`` appended."""
+    pre, post = _leak_inputs(df, "_pre"), _leak_inputs(df, "_post")
+    for k in delta.GL_INPUTS + ("srf",):
+        if f"{k}_pre" in df.columns and f"{k}_post" in df.columns:
+            pre[k] = df[f"{k}_pre"].to_numpy(dtype=float)
+            post[k] = df[f"{k}_post"].to_numpy(dtype=float)
+    packed = delta.compact(delta.compare(pre, post))
+    return df.assign(**{f: packed[f] for f in delta.COMPACT_FIELDS})
+
+
+def score_gl_frame(df):
+    """Return ``df`` with GL, Ghost GDP %, friction %, band and monthly cost appended."""
+    missing = [c for c in GL_REQUIRED if c not in df.columns]
+    if missing:
+        raise ValueError(f"Missing input columns: {', '.join(missing)}")
+    optional = {c: df[c].to_numpy(dtype=float) for c in GL_OPTIONAL if c in df.columns}
+    result = gl.score(**{c: df[c].to_numpy(dtype=float) for c in GL_REQUIRED}, **optional)
+    return df.assign(**result._asdict())
+
+
+MODELS = {"leak": score_frame, "gl": score_gl_frame, "delta": score_delta_frame}
+
+
+def run(src, dst, chunk_size=DEFAULT_CHUNK_SIZE, progress=None, model="leak"):
+    """Stream ``src`` through the model into ``dst``; return ``(rows, seconds)``."""
+    scorer = MODELS[model]
+    rows, start = 0, time.perf_counter()
+    with ChunkWriter(dst) as writer:
+        for chunk in read_chunks(src, chunk_size):
+            writer.write(scorer(chunk))
+            rows += len(chunk)
+            if progress:
+                progress(rows, time.perf_counter() - start)
+    return rows, time.perf_counter() - start
+
+
+def _report(rows, elapsed):
+    rate = rows / elapsed if elapsed else float("inf")
+    print(f"\r{rows:>12,} rows  {elapsed:8.2f}s  {rate:>12,.0f} rows/s", end="", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m gfi.batch", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("input", help="CSV or Parquet file of assessments")
+    parser.add_argument("output", help="CSV or Parquet file to write scored rows to")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"rows per chunk (default {DEFAULT_CHUNK_SIZE:,})")
+    parser.add_argument("--model", choices=sorted(MODELS), default="leak",
+                        help="leak: six-category friction model (default); gl: GL Formula (1)/(2); "
+                             "delta: paired <input>_pre / <input>_post snapshots")
+    parser.add_argument("--quiet", action="store_true", help="no progress output")
+    args = parser.parse_args(argv)
+
+    try:
+        rows, elapsed = run(args.input, args.output, args.chunk_size,
+                            progress=None if args.quiet else _report, model=args.model)
+    except (ValueError, FileNotFoundError) as e:
+        parser.exit(1, f"error: {e}\n")
+    if not args.quiet:
+        print(file=sys.stderr)
+    rate = rows / elapsed if elapsed else float("inf")
+    print(f"Scored {rows:,} rows in {elapsed:.2f}s ({rate:,.0f} rows/s) → {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Peer benchmarking by industry × company-size cell.
+
+Each cell keeps one KLL sketch for the annual leak and one for the
+friction score, updated as assessments arrive. A percentile query reads
+a cell's cached sorted summary, so its cost depends on the sketch size
+(a few hundred values), never on how many assessments were recorded.
+Cells too thin to quote fall back to the size band across industries,
+then to every assessment.
+
+``INDEX`` lives in process memory, so ``seed_default()`` loads the
+assessments already in the repository into it once per process, from a
+background thread the app starts on its first run — a restart or
+redeploy no longer starts every cell back at zero, and no submit waits
+for it.
+"""
+import json
+import logging
+import threading
+
+from gfi.sketch import KLLSketch
+
+MIN_PEERS = 20
+ALL = "*"
+
+log = logging.getLogger("gfi.benchmark")
+
+
+class Peers:
+    __slots__ = ("leak", "risk")
+
+    def __init__(self):
+        self.leak = KLLSketch()
+        self.risk = KLLSketch()
+
+    def merge(self, other):
+        self.leak.merge(other.leak)
+        self.risk.merge(other.risk)
+
+
+class BenchmarkIndex:
+    """Thread-safe map of ``(industry, size_band)`` → leak / risk sketches.
+
+    Every ``add`` also feeds the ``(ALL, size_band)`` and ``(ALL, ALL)``
+    roll-up cells, so fallbacks are single lookups too.
+    """
+
+    def __init__(self, min_peers=MIN_PEERS):
+        self.min_peers = min_peers
+        self.cells = {}
+        self._lock = threading.Lock()
+
+    def _cell(self, key):
+        if key not in self.cells:
+            self.cells[key] = Peers()
+        return self.cells[key]
+
+    def add(self, industry, size_band, leak, risk):
+        self.extend([(industry, size_band, leak, risk)])
+
+    def extend(self, rows):
+        """``add`` every ``(industry, size_band, leak, risk)`` in ``rows``; returns the count."""
+        n = 0
+        with self._lock:
+            for industry, size_band, leak, risk in rows:
+                for key in {(industry, size_band), (ALL, size_band), (ALL, ALL)}:
+                    cell = self._cell(key)
+                    cell.leak.update(leak)
+                    cell.risk.update(risk)
+                n += 1
+        return n
+
+    def merge(self, other):
+        """Fold another index (e.g. from a second worker) into this one."""
+        with self._lock:
+            for key, cell in other.cells.items():
+                self._cell(key).merge(cell)
+
+    def count(self, industry=ALL, size_band=ALL):
+        cell = self.cells.get((industry, size_band))
+        return cell.leak.n if cell else 0
+
+    def percentile(self, industry, size_band, leak=None, risk=None):
+        """Where ``leak`` / ``risk`` rank among peers.
+
+        Returns ``{"industry", "size_band", "peers", "leak_pct", "risk_pct"}``
+        for the narrowest cell with at least ``min_peers`` assessments
+        (percentages 0–100, ``None`` where not asked), or ``None`` if even
+        the overall cell is too thin.
+        """
+        with self._lock:
+            for key in ((industry, size_band), (ALL, size_band), (ALL, ALL)):
+                cell = self.cells.get(key)
+                if cell and cell.leak.n >= self.min_peers:
+                    return {
+                        "industry": key[0],
+                        "size_band": key[1],
+                        "peers": cell.leak.n,
+                        "leak_pct": None if leak is None else 100 * cell.leak.cdf(leak),
+                        "risk_pct": None if risk is None else 100 * cell.risk.cdf(risk),
+                    }
+        return None
+
+    # ── persistence ──
+    def to_json(self):
+        with self._lock:
+            return json.dumps([
+                {"industry": i, "size_band": b, "leak": c.leak.to_dict(), "risk": c.risk.to_dict()}
+                for (i, b), c in self.cells.items()
+            ])
+
+    @classmethod
+    def from_json(cls, text, min_peers=MIN_PEERS):
+        index = cls(min_peers)
+        for row in json.loads(text):
+            cell = index._cell((row["industry"], row["size_band"]))
+            cell.leak = KLLSketch.from_dict(row["leak"])
+            cell.risk = KLLSketch.from_dict(row["risk"])
+        return index
+
+
+INDEX = BenchmarkIndex()
+
+_seeded = False
+_seed_lock = threading.Lock()
+
+
+def seed(repo, index=None, before=None):
+    """Fold every assessment stored in ``repo`` into ``index`` (``INDEX``), once per process.
+
+    Only rows created before ``before`` (an ISO timestamp) are read, so
+    assessments this process has already added are not counted twice.
+    Best-effort: a failure is logged and not retried. Returns the rows loaded.
+    """
+    global _seeded
+    with _seed_lock:
+        if _seeded:
+            return 0
+        _seeded = True
+        index = INDEX if index is None else index
+        try:
+            # Read everything first: the index lock is not held across the network
+            n = index.extend(list(repo.peers(before)))
+        except Exception:
+            log.exception("could not seed peer benchmarks from %s", repo.name)
+            return 0
+        log.info("seeded peer benchmarks with %d stored assessment(s)", n)
+        return n
+
+
+def seed_default(secrets=None, before=None):
+    """``seed()`` from ``repository.default()``; never raises.
+
+    The store may be unconfigured, missing its driver or unreachable:
+    that is logged and the index simply starts empty.
+    """
+    from gfi import repository
+
+    try:
+        repo = repository.default(secrets)
+    except Exception:
+        log.exception("could not open the repository to seed peer benchmarks")
+        return 0
+    return seed(repo, before=before)
@@ -0,0 +1,99 @@
+"""
+Process-wide memo of assessment results.
+
+Slider inputs are integers and most visitors keep several defaults, so the
+same input tuple recurs constantly. ``RESULTS`` maps the quantized tuple to
+the full result bundle (scores, sensitivity, roadmap, uncertainty bands);
+a hit skips every model run. Bundles hold no display strings, so one entry
+serves every locale — figures are built per language by the cached factory
+in ``gfi.figures``. Module globals survive Streamlit reruns and are shared
+by every session in the process.
+"""
+import threading
+from collections import OrderedDict
+
+from gfi import leak
+
+DEFAULT_MAXSIZE = 2048
+
+# Rounding applied before keying. Sliders are whole numbers; the dollar
+# fields are typed freely, so nearby entries share a result at $100 — well
+# inside the precision of the leak estimate
+QUANTUM = {
+    "avg_salary":           100,
+    "revenue_per_employee": 100,
+}
+
+
+class LRUCache:
+    """Bounded, thread-safe least-recently-used cache with hit/miss counters."""
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for ``key``, calling ``compute()`` on a miss.
+
+        ``compute`` runs outside the lock, so two sessions missing on the
+        same key at once may both compute it; the results are identical.
+        """
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def quantize(inputs):
+    """Normalize an assessment to the hashable key ``RESULTS`` is indexed by.
+
+    Returns ``(key, normalized_inputs)``; compute from the normalized inputs
+    so a cached bundle is exactly what its key describes.
+    """
+    normalized = {}
+    for name in leak.INPUTS:
+        step = QUANTUM.get(name, 1)
+        normalized[name] = int(round(float(inputs[name]) / step) * step)
+    return tuple(normalized[n] for n in leak.INPUTS), normalized
+
+
+RESULTS = LRUCache()
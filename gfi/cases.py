@@ -0,0 +1,282 @@
+"""
+Pre-rendered case study pages, one per case per language.
+
+``case detail.html`` used to ship every case in every language as one
+55 KB ``CASES`` object and build the page in the browser from
+``?c=<case>``: every visit downloaded all nine cases to show one, and
+crawlers saw an empty ``<div id="content">``. The cases now live as data
+in ``data/cases/<key>.json`` and are rendered here, at build time, into
+``case/<lang>/<key>.html`` from ``templates/case-detail.html``: plain HTML with
+the copy already in it, a canonical URL and ``hreflang`` alternates, and
+no script beyond the menu and scroll reveal.
+
+Rebuilds are incremental. Each page's inputs (its case, the titles of its
+neighbours, the template, the logo markup and this module) are hashed into
+``case/.manifest.json``; a page is rewritten only when that hash changes,
+and pages of deleted cases are removed.
+
+    python -m gfi.cases          # render changed pages, report counts
+    python -m gfi.cases --force  # render everything
+"""
+import argparse
+import hashlib
+import html
+import json
+import re
+from pathlib import Path
+from string import Template
+
+from gfi import images, split
+from gfi.split import DEFAULT_LANG, LANGS, SITE_URL
+
+ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = ROOT / "data" / "cases"
+TEMPLATE = ROOT / "templates" / "case-detail.html"
+OUT_DIR = ROOT / "case"
+MANIFEST = ".manifest.json"
+
+# Pages sit two levels below the site root: case/<lang>/<key>.html
+ROOT_PREFIX = "../../"
+
+LABELS = {
+    "en": {"back": "← All Cases", "prev": "Previous", "next": "Next",
+           "params": ("Flow Success", "Strategic Value", "Pain Duration", "Cognitive Friction"),
+           "bands": ("Outstanding", "Excellent", "Good", "Policy Violence")},
+    "tw": {"back": "← 所有案例", "prev": "上一個", "next": "下一個",
+           "params": ("流程成功率", "戰略價值", "痛苦時長", "認知摩擦"),
+           "bands": ("卓越", "優良", "良好", "政策暴力")},
+    "cn": {"back": "← 所有案例", "prev": "上一个", "next": "下一个",
+           "params": ("流程成功率", "战略价值", "痛苦时长", "认知摩擦"),
+           "bands": ("卓越", "优良", "良好", "政策暴力")},
+}
+FORMULA = "GL = (Fs × Vn) / (Pd × Cf)"
+# Lower bound of each GL band, best first; matches LABELS[...]["bands"]
+BANDS = ((6, "gl-outstanding"), (3, "gl-excellent"), (1.5, "gl-good"), (float("-inf"), "gl-violence"))
+
+
+def load(data_dir=DATA_DIR):
+    """``{key: case}`` for every ``<key>.json``, in the cases' ``order``."""
+    cases = {p.stem: json.loads(p.read_text(encoding="utf-8")) for p in Path(data_dir).glob("*.json")}
+    return dict(sorted(cases.items(), key=lambda kv: (kv[1].get("order", 0), kv[0])))
+
+
+def path(key, lang):
+    """Site-relative URL of one rendered page."""
+    return f"case/{lang}/{key}.html"
+
+
+# ============================================================================
+# RENDERING
+# ============================================================================
+_NUMBER = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+
+
+def _band(gl):
+    n = float(gl)
+    return next(i for i, (low, _) in enumerate(BANDS) if n >= low)
+
+
+def _number(text):
+    """Leading number of ``text`` like JS ``parseFloat`` ("0.8*" → 0.8), NaN if none."""
+    m = _NUMBER.match(text.strip())
+    return float(m.group()) if m else float("nan")
+
+
+def _table(headers, rows):
+    ths = "".join(f"<th>{h}</th>" for h in headers)
+    trs = []
+    for row in rows:
+        tds = []
+        for i, cell in enumerate(row["cells"]):
+            # The second column is the GL score wherever it looks like one
+            cls = ""
+            if i == 1 and ("." in cell or cell == "—"):
+                cls = ' class="gl-bad"' if _number(cell) < 1 else ' class="gl-n"'
+            tds.append(f"<td{cls}>{cell}</td>")
+        hl = ' class="hl"' if row.get("hl") else ""
+        trs.append(f'<tr{hl}>{"".join(tds)}</tr>')
+    return (f'<div class="tscroll"><table><thead><tr>{ths}</tr></thead>'
+            f'<tbody>{"".join(trs)}</tbody></table></div>')
+
+
+def content(case, lang, prev=None, nxt=None):
+    """The page body for one case; ``prev`` / ``nxt`` are ``(key, title)``."""
+    d = case[lang]
+    labels = LABELS[lang]
+    band = _band(case["gl"])
+    params = "".join(
+        f'<div class="gl-param"><div class="gl-param-val">{case[k]}</div>'
+        f'<div class="gl-param-key">{k.capitalize()} · {label}</div></div>'
+        for k, label in zip(("fs", "vn", "pd", "cf"), labels["params"]))
+    principles = "".join(
+        f'\n    <div class="principle reveal">\n      <div class="principle-num">{p["n"]}</div>'
+        f'\n      <div class="principle-title">{p["t"]}</div>\n      <div class="principle-body">{p["b"]}</div>\n    </div>'
+        for p in d["principles"])
+    tags = "".join(f'<span class="tag">{t}</span>' for t in d["tags"])
+    prev_link = f'<a href="{prev[0]}.html">← {labels["prev"]}: {prev[1]}</a>' if prev else ""
+    next_link = f'<a href="{nxt[0]}.html">{labels["next"]}: {nxt[1]} →</a>' if nxt else ""
+    return f"""<div id="content">
+  <div class="hero"><div class="wrap">
+    <a href="{ROOT_PREFIX}{split.path("case.html", lang)}" class="back-link reveal">{labels["back"]}</a>
+    <div class="case-flag-lg reveal">{case["flag"]}</div>
+    <div class="eyebrow reveal">{d["sub"]}</div>
+    <h1 class="case-hero-title reveal">{d["title"]}</h1>
+    <div class="case-tags reveal">{tags}</div>
+
+    <div class="gl-bar reveal">
+      <div>
+        <div class="gl-score-big">{case["gl"]}</div>
+        <div class="gl-score-label"><span class="{BANDS[band][1]}" style="padding:3px 8px;border-radius:12px;font-size:10px;border:1px solid;font-family:var(--mono);letter-spacing:.06em">{labels["bands"][band]}</span></div>
+      </div>
+      <div>
+        <div class="gl-params">{params}</div>
+        <div class="gl-formula">{FORMULA} = ({case["fs"]} × {case["vn"]}) / ({case["pd"]} × {case["cf"]}) = <strong style="color:var(--accent)">{case["gl"]}</strong></div>
+      </div>
+    </div>
+  </div></div>
+
+  <div class="wrap">
+    <div class="section reveal">
+      <div class="section-title">{d["phenomenon_title"]}</div>
+      {d["phenomenon"]}
+    </div>
+
+    <div class="section reveal">
+      <div class="section-title">{d["principles_title"]}</div>
+      <div class="principles">{principles}</div>
+    </div>
+
+    <div class="section reveal">
+      <div class="section-title">{d["compare_title"]}</div>
+      {_table(d["compare_headers"], d["compare_rows"])}
+    </div>
+
+    <div class="verdict reveal">
+      <div class="verdict-label">{d["verdict_label"]}</div>
+      <div class="verdict-text">{d["verdict"]}</div>
+    </div>
+
+    <div class="case-nav reveal">
+      <div>{prev_link}</div>
+      <div>{next_link}</div>
+    </div>
+  </div>
+</div>"""
+
+
+def _text(fragment):
+    """Plain, attribute-safe text of an HTML fragment (meta description)."""
+    return html.escape(html.unescape(re.sub(r"<[^>]+>", "", fragment)).strip(), quote=True)
+
+
+def _lang_links(key, lang):
+    return "\n".join(
+        f'      <a class="lb-btn{" on" if code == lang else ""}" href="../{code}/{key}.html" '
+        f'hreflang="{tag}" lang="{tag}">{label}</a>'
+        for code, (tag, label) in LANGS.items())
+
+
+def _alternates(key):
+    links = [f'<link rel="alternate" hreflang="{tag}" href="{SITE_URL}/{path(key, code)}">'
+             for code, (tag, _) in LANGS.items()]
+    links.append(f'<link rel="alternate" hreflang="x-default" href="{SITE_URL}/{path(key, DEFAULT_LANG)}">')
+    return "\n".join(links)
+
+
+def _logo():
+    return images.picture("GFILOGO.png", images.HTML_WIDTH, alt="GFI", base=ROOT_PREFIX + images.PAGE_URL)
+
+
+def render(template, key, case, lang, prev=None, nxt=None, logo=None):
+    """One complete page as a string."""
+    return Template(template).substitute(
+        html_lang=LANGS[lang][0],
+        title=html.escape(case[lang]["title"]),
+        description=_text(case[lang]["verdict"]),
+        canonical=f"{SITE_URL}/{path(key, lang)}",
+        alternates=_alternates(key),
+        logo=_logo() if logo is None else logo,
+        root=ROOT_PREFIX,
+        lang_root=ROOT_PREFIX + split.DIRS[lang],
+        lang_links=_lang_links(key, lang),
+        content=content(case, lang, prev, nxt),
+    )
+
+
+# ============================================================================
+# INCREMENTAL BUILD
+# ============================================================================
+def _jobs(cases):
+    """Every page to render: ``(out path, key, lang, prev, nxt)``."""
+    keys = list(cases)
+    for lang in LANGS:
+        for i, key in enumerate(keys):
+            prev = (keys[i - 1], cases[keys[i - 1]][lang]["title"]) if i > 0 else None
+            nxt = (keys[i + 1], cases[keys[i + 1]][lang]["title"]) if i + 1 < len(keys) else None
+            yield path(key, lang), key, lang, prev, nxt
+
+
+def _fingerprint(shared, case, lang, prev, nxt):
+    inputs = json.dumps([case, lang, prev, nxt], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(shared + inputs.encode("utf-8")).hexdigest()
+
+
+def build(out=OUT_DIR, data_dir=DATA_DIR, template=TEMPLATE, force=False):
+    """Render changed pages into ``out``; returns ``{"built", "unchanged", "removed"}`` paths."""
+    out = Path(out)
+    cases = load(data_dir)
+    source = Path(template).read_text(encoding="utf-8")
+    logo = _logo()
+    # Anything every page depends on: a change here re-renders the whole set
+    shared = hashlib.sha256(
+        source.encode("utf-8") + logo.encode("utf-8") + Path(__file__).read_bytes()).digest()
+
+    manifest_path = out / MANIFEST
+    try:
+        old = {} if force else json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        old = {}
+
+    manifest, result = {}, {"built": [], "unchanged": [], "removed": []}
+    for rel, key, lang, prev, nxt in _jobs(cases):
+        target = out / Path(rel).relative_to("case")
+        digest = _fingerprint(shared, cases[key], lang, prev, nxt)
+        manifest[rel] = digest
+        if old.get(rel) == digest and target.is_file():
+            result["unchanged"].append(rel)
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(render(source, key, cases[key], lang, prev, nxt, logo), encoding="utf-8")
+        result["built"].append(rel)
+
+    for rel in sorted(set(old) - set(manifest)):
+        stale = out / Path(rel).relative_to("case")
+        if stale.is_file():
+            stale.unlink()
+        result["removed"].append(rel)
+
+    out.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(json.dumps(manifest, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+    return result
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Render case study pages from data/cases/.")
+    ap.add_argument("--force", action="store_true", help="re-render every page")
+    ap.add_argument("-v", "--verbose", action="store_true", help="list the pages written")
+    args = ap.parse_args(argv)
+
+    result = build(force=args.force)
+    print(f"{len(result['built'])} built, {len(result['unchanged'])} unchanged, "
+          f"{len(result['removed'])} removed → {OUT_DIR.relative_to(ROOT)}/")
+    if args.verbose:
+        for kind in ("built", "removed"):
+            for rel in result[kind]:
+                print(f"  {kind:<8} {rel}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+Plotly figure factory for the calculator results.
+
+The GFI look (backgrounds, fonts, gridlines, gauge bands) lives in the
+``gfi`` Plotly template registered once at import, so no figure repeats a
+layout dict. Figures are cached on their (rounded) values and display
+strings: a rerun that shows the same result in the same language reuses the
+built ``go.Figure`` and only pays Streamlit's JSON serialization.
+
+Treat returned figures as read-only; they are shared across sessions.
+
+    python -m gfi.figures      # construction vs. cached vs. serialization timings
+"""
+import argparse
+import functools
+import time
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from gfi import leak, sensitivity
+from gfi.theme import BG, SURF, SURF2, BORDER, TEXT, MUTED, BLUE, DANGER, WARN, SUCCESS
+
+CACHE_SIZE = 512
+RISK_DECIMALS = 1       # gauge values are cached at this precision
+COST_DECIMALS = 0
+
+# ============================================================================
+# TEMPLATES
+# ============================================================================
+pio.templates["gfi"] = go.layout.Template(
+    layout=dict(
+        paper_bgcolor=SURF,
+        plot_bgcolor=SURF,
+        font={'color': TEXT},
+        margin=dict(t=40, b=20, l=20, r=20),
+        legend=dict(font={'color': MUTED}),
+        xaxis=dict(tickfont={'color': MUTED}, gridcolor=BORDER),
+        yaxis=dict(tickfont={'color': MUTED}, gridcolor=BORDER),
+    ),
+    data=dict(
+        bar=[go.Bar(marker_line_color=BG, marker_line_width=1)],
+        indicator=[go.Indicator(
+            title={'font': {'color': TEXT, 'size': 14}},
+            number={'font': {'color': TEXT}},
+            gauge={
+                'axis': {'range': [0, 100], 'tickcolor': MUTED, 'tickfont': {'color': MUTED}},
+                'bgcolor': SURF2,
+                'bordercolor': BORDER,
+            },
+        )],
+    ),
+)
+
+# Per-template colours that depend on the data (risk band, cost scale).
+# Gauge steps go on the trace: plotly.js drops unnamed template array items
+RISK_COLORS = {
+    "gfi": (SUCCESS, WARN, DANGER),
+}
+RISK_STEPS = {
+    "gfi": (
+        {'range': [0, 40], 'color': 'rgba(52,211,153,0.1)'},
+        {'range': [40, 70], 'color': 'rgba(245,158,11,0.1)'},
+        {'range': [70, 100], 'color': 'rgba(255,107,107,0.1)'},
+    ),
+}
+COST_SCALES = {
+    "gfi": [[0, SURF2], [0.5, BLUE], [1, DANGER]],
+}
+
+
+def risk_color(risk, template="gfi"):
+    low, mid, high = RISK_COLORS[template]
+    return high if risk > 70 else mid if risk > 40 else low
+
+
+# ============================================================================
+# FACTORY
+# ============================================================================
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _gauge(risk, title, template, height):
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=risk,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': title},
+        gauge={'bar': {'color': risk_color(risk, template)}, 'steps': list(RISK_STEPS[template])},
+    ))
+    fig.update_layout(template=template, height=height)
+    return fig
+
+
+def gauge(risk, title="Operational Friction Score", template="gfi", height=280):
+    """Operational Friction Score gauge (0–100)."""
+    return _gauge(round(float(risk), RISK_DECIMALS), title, template, height)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _breakdown(items, y_title, template, height):
+    labels, costs = zip(*items)
+    fig = go.Figure(go.Bar(
+        x=labels, y=costs,
+        marker=dict(color=costs, colorscale=COST_SCALES[template]),
+    ))
+    fig.update_layout(template=template, height=height, showlegend=False, yaxis_title=y_title)
+    return fig
+
+
+def breakdown(costs, y_title="Annual Cost (USD)", template="gfi", height=320):
+    """Per-category annual cost bars; ``costs`` maps label → USD in display order."""
+    items = tuple((label, round(float(v), COST_DECIMALS)) for label, v in costs.items())
+    return _breakdown(items, y_title, template, height)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _tornado(names, low, high, elasticity, step, x_title, elasticity_label, template, height):
+    hover = f'%{{y}}: %{{x:$,.0f}}<br>{elasticity_label} %{{customdata:.2f}}<extra></extra>'
+    fig = go.Figure([
+        go.Bar(y=names, x=low, orientation='h', name=f'−{step:.0%}', marker_color=SUCCESS,
+               customdata=elasticity, hovertemplate=hover),
+        go.Bar(y=names, x=high, orientation='h', name=f'+{step:.0%}', marker_color=DANGER,
+               customdata=elasticity, hovertemplate=hover),
+    ])
+    fig.update_layout(
+        template=template,
+        barmode='overlay',
+        height=height,
+        legend=dict(orientation='h', y=1.08),
+        xaxis_title=x_title,
+    )
+    return fig
+
+
+def tornado(sens, labels=leak.INPUT_LABELS, x_title="Change in Annual Cost (USD)",
+            elasticity_label="Elasticity", template="gfi", height=360):
+    """Leak swing per input from a ``sensitivity.Sensitivity``, largest on top."""
+    def col(a):
+        return tuple(round(float(v), COST_DECIMALS) for v in a[::-1])
+    names = tuple(labels[n] for n in sens.inputs)[::-1]
+    elasticity = tuple(round(float(v), 4) for v in sens.leak_elasticity[::-1])
+    return _tornado(names, col(sens.leak_low - sens.base_leak), col(sens.leak_high - sens.base_leak),
+                    elasticity, sensitivity.STEP, x_title, elasticity_label, template, height)
+
+
+def cache_info():
+    return {name: f.cache_info() for name, f in
+            (("gauge", _gauge), ("breakdown", _breakdown), ("tornado", _tornado))}
+
+
+def cache_clear():
+    for f in (_gauge, _breakdown, _tornado):
+        f.cache_clear()
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+def _time(fn, repeat):
+    start = time.perf_counter()
+    for i in range(repeat):
+        fn(i)
+    return (time.perf_counter() - start) / repeat * 1e3
+
+
+def benchmark(repeat=50):
+    """Milliseconds per figure: cold build, cache hit, and ``to_json`` (what
+    ``st.plotly_chart`` runs on every render)."""
+    inputs = dict(leak.DEFAULTS)
+    _, risk, costs = leak.score_one(**inputs)
+    sens = sensitivity.analyze(inputs)
+    makers = {
+        "gauge":     lambda i: gauge(risk + i / 10),
+        "breakdown": lambda i: breakdown({k: v + i for k, v in costs.items()}),
+        "tornado":   lambda i: tornado(sens._replace(base_leak=sens.base_leak + i), leak.INPUT_LABELS),
+    }
+    rows = {}
+    for name, make in makers.items():
+        cache_clear()
+        cold = _time(make, repeat)
+        hit = _time(make, repeat)
+        fig = make(0)
+        to_json = _time(lambda i: pio.to_json(fig, validate=False), repeat)
+        rows[name] = (cold, hit, to_json, len(pio.to_json(fig, validate=False)))
+    return rows
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Time figure construction, cache hits and serialization.")
+    ap.add_argument("--repeat", type=int, default=50)
+    args = ap.parse_args(argv)
+    print(f"{'figure':<10} {'build ms':>9} {'cached ms':>10} {'to_json ms':>11} {'json bytes':>11}")
+    for name, (cold, hit, to_json, size) in benchmark(args.repeat).items():
+        print(f"{name:<10} {cold:>9.2f} {hit:>10.3f} {to_json:>11.2f} {size:>11,}")
+
+
+if __name__ == "__main__":
+    main()
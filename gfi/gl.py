@@ -0,0 +1,122 @@
+"""
+GL scoring engine — Formula (1) and the resilience-adjusted Formula (2).
+
+    GL  = (Fs × Vn) / (Pd × Cf)
+    GLr = (Fs × Vn) / (Pd × Cf × SRF)
+    Ghost GDP % = (Pd × Cf) / [(Fs × Vn) + (Pd × Cf)]
+
+Matches ``runCalc()`` in ghost-gdp.html, without its display rounding.
+All functions broadcast over NumPy arrays so whole case libraries and
+client portfolios score in one call.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+# ============================================================================
+# VARIABLE DOMAINS — see methodology.html, "Variable Definitions"
+# ============================================================================
+# name: (low, high, low_inclusive)
+DOMAINS = {
+    "fs":  (0.0, 1.0, False),      # Flow Success Rate, decimal
+    "vn":  (0.0, 10.0, False),     # Strategic Value
+    "pd":  (0.0, np.inf, False),   # Pain Duration, hours
+    "cf":  (0.0, 10.0, False),     # Cognitive Friction index
+    "srf": (1.0, 3.0, True),       # Systemic Risk Factor, Formula (2) only
+}
+
+HEALTHY = 1.5   # GL ≥ 1.5
+WARNING = 0.5   # 0.5 ≤ GL < 1.5; below is critical
+BANDS = ("critical", "warning", "healthy")
+
+MAX_FRICTION_PCT = 99
+
+
+class GLResult(NamedTuple):
+    gl: np.ndarray              # Formula (1), or Formula (2) where SRF was given
+    ghost_gdp_pct: np.ndarray   # share of process cost producing no outcome, 0–100
+    friction_pct: np.ndarray    # ghost share capped at MAX_FRICTION_PCT
+    band: np.ndarray            # "healthy" / "warning" / "critical"; None where GL is not finite
+    monthly_cost: np.ndarray    # Pd × Cf × wage × volume; NaN where not supplied
+
+
+def validate(**values):
+    """Return ``values`` as float arrays, raising ``ValueError`` on any out-of-domain entry."""
+    arrays = {}
+    for name, value in values.items():
+        lo, hi, lo_inclusive = DOMAINS[name]
+        a = np.asarray(value, dtype=float)
+        ok = (a >= lo if lo_inclusive else a > lo) & (a <= hi)
+        if not ok.all():
+            bad = np.flatnonzero(~np.broadcast_to(ok, a.shape).ravel())
+            interval = f"{'[' if lo_inclusive else '('}{lo:g}, {hi:g}]"
+            raise ValueError(
+                f"{name} must be in {interval}: {bad.size} invalid value(s), "
+                f"first at index {bad[0]} ({float(a.ravel()[bad[0]])!r})"
+            )
+        arrays[name] = a
+    return arrays
+
+
+def gl(fs, vn, pd, cf):
+    """Formula (1)."""
+    v = validate(fs=fs, vn=vn, pd=pd, cf=cf)
+    return (v["fs"] * v["vn"]) / (v["pd"] * v["cf"])
+
+
+def gl_resilience(fs, vn, pd, cf, srf):
+    """Formula (2), for critical-infrastructure systems."""
+    v = validate(fs=fs, vn=vn, pd=pd, cf=cf, srf=srf)
+    return (v["fs"] * v["vn"]) / (v["pd"] * v["cf"] * v["srf"])
+
+
+def ghost_gdp_pct(fs, vn, pd, cf):
+    v = validate(fs=fs, vn=vn, pd=pd, cf=cf)
+    friction = v["pd"] * v["cf"]
+    return 100 * friction / (v["fs"] * v["vn"] + friction)
+
+
+def band(score):
+    """Classify GL scores into the healthy / warning / critical bands.
+
+    A NaN or infinite score has no band: ``None`` (``null`` in the API).
+    """
+    score = np.asarray(score, dtype=float)
+    idx = np.digitize(score, [WARNING, HEALTHY])
+    return np.where(np.isfinite(score), np.asarray(BANDS, dtype=object)[idx], None)
+
+
+def monthly_cost(pd, cf, wage, volume):
+    """Monthly friction cost, NaN wherever wage or volume is not positive."""
+    wage = np.asarray(wage, dtype=float)
+    volume = np.asarray(volume, dtype=float)
+    cost = np.asarray(pd, dtype=float) * np.asarray(cf, dtype=float) * wage * volume
+    return np.where((wage > 0) & (volume > 0), cost, np.nan)
+
+
+def score(fs, vn, pd, cf, srf=None, wage=0, volume=0):
+    """Full GL readout for any number of systems.
+
+    Rows with a finite ``srf`` are scored with Formula (2); pass ``srf=None``
+    (or NaN per row) for Formula (1).
+    """
+    v = validate(fs=fs, vn=vn, pd=pd, cf=cf)
+    numerator = v["fs"] * v["vn"]
+    friction = v["pd"] * v["cf"]
+
+    if srf is None:
+        score_ = numerator / friction
+    else:
+        srf = np.asarray(srf, dtype=float)
+        has_srf = np.isfinite(srf)
+        validate(srf=np.where(has_srf, srf, 1.0))
+        score_ = numerator / (friction * np.where(has_srf, srf, 1.0))
+
+    ghost = 100 * friction / (numerator + friction)
+    return GLResult(
+        gl=score_,
+        ghost_gdp_pct=ghost,
+        friction_pct=np.minimum(ghost, MAX_FRICTION_PCT),
+        band=band(score_),
+        monthly_cost=monthly_cost(v["pd"], v["cf"], wage, volume),
+    )
@@ -0,0 +1,187 @@
+"""
+Message catalogs for the calculator and the site pages.
+
+One app serves every language: all user-facing copy lives in
+``gfi/locales/<locale>.toml`` and is looked up by dotted key. Catalogs are
+parsed, validated and merged over their fallback chain once per process;
+a session only holds its locale code.
+
+    t = i18n.catalog("es")
+    t("calc.company")                        # "Nombre de la Empresa"
+    t("results.per_employee", amount="$1")   # placeholders via str.format
+    t.table("category")                      # {"meeting": "...", ...}
+
+``en`` is the reference catalog. Other catalogs may omit keys (they fall
+back along ``FALLBACK``) but may not add keys or placeholders English does
+not have — a typo fails at load, not on the one screen that uses it.
+
+    python -m gfi.i18n          # validate catalogs, report untranslated keys
+"""
+import argparse
+import functools
+import string
+import tomllib
+from pathlib import Path
+
+LOCALE_DIR = Path(__file__).resolve().parent / "locales"
+
+LOCALES = {
+    "en":    "English",
+    "es":    "Español",
+    "zh":    "简体中文",
+    "zh-TW": "繁體中文",
+}
+DEFAULT = "en"
+# Missing keys resolve through this chain; every chain ends at DEFAULT
+FALLBACK = {"zh-TW": "zh", "zh": "en", "es": "en"}
+
+ALIASES = {
+    "en-us": "en", "en-gb": "en",
+    "es-es": "es", "es-mx": "es", "es-419": "es",
+    "cn": "zh", "zh-cn": "zh", "zh-hans": "zh", "zh-sg": "zh",
+    "tw": "zh-TW", "zh-tw": "zh-TW", "zh-hant": "zh-TW", "zh-hk": "zh-TW",
+}
+
+
+class CatalogError(ValueError):
+    pass
+
+
+def _flatten(table, prefix=""):
+    """``{"a": {"b": "x"}}`` → ``{"a.b": "x"}``; lists are kept as values."""
+    flat = {}
+    for key, value in table.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, name + "."))
+        else:
+            flat[name] = value
+    return flat
+
+
+def _placeholders(value):
+    if isinstance(value, str):
+        return {field for _, field, _, _ in string.Formatter().parse(value) if field}
+    if isinstance(value, list):
+        return set().union(*map(_placeholders, value)) if value else set()
+    if isinstance(value, dict):
+        return set().union(*map(_placeholders, value.values())) if value else set()
+    return set()
+
+
+@functools.lru_cache(maxsize=None)
+def _load(locale):
+    path = LOCALE_DIR / f"{locale}.toml"
+    with path.open("rb") as f:
+        return _flatten(tomllib.load(f))
+
+
+def _validate(locale, messages, reference):
+    for key, value in messages.items():
+        if key not in reference:
+            raise CatalogError(f"{locale}: unknown key {key!r}")
+        extra = _placeholders(value) - _placeholders(reference[key])
+        if extra:
+            raise CatalogError(f"{locale}: {key!r} uses placeholders {sorted(extra)} not in {DEFAULT}")
+
+
+def resolve(code):
+    """Normalize a browser / query-string language code to a known locale."""
+    if not code:
+        return DEFAULT
+    code = str(code).strip()
+    if code in LOCALES:
+        return code
+    lower = code.lower().replace("_", "-")
+    if lower in ALIASES:
+        return ALIASES[lower]
+    base = lower.split("-")[0]
+    return base if base in LOCALES else DEFAULT
+
+
+class Catalog:
+    """Merged messages for one locale; call it to look up a key."""
+
+    def __init__(self, locale, messages):
+        self.locale = locale
+        self._messages = messages
+
+    def __call__(self, key, **kwargs):
+        value = self._messages[key]
+        return value.format(**kwargs) if kwargs else value
+
+    def __contains__(self, key):
+        return key in self._messages
+
+    def table(self, prefix):
+        """Every ``prefix.<id>`` entry as ``{id: message}``, in catalog order."""
+        head = prefix + "."
+        return {k[len(head):]: v for k, v in self._messages.items()
+                if k.startswith(head) and "." not in k[len(head):]}
+
+    def ordinal(self, n):
+        """``75`` → ``"75th"``; the suffix rule is English, other locales
+        write their whole form in ``ordinal.format``."""
+        n = int(round(n))
+        suffix = "th" if 10 <= n % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+        return self("ordinal.format", n=n, suffix=suffix)
+
+
+@functools.lru_cache(maxsize=None)
+def catalog(locale=DEFAULT):
+    """The validated, fallback-merged ``Catalog`` for ``locale`` (cached)."""
+    locale = resolve(locale)
+    reference = _load(DEFAULT)
+    chain = [locale]
+    while chain[-1] in FALLBACK:
+        chain.append(FALLBACK[chain[-1]])
+    messages = {}
+    for code in reversed(chain):
+        own = _load(code)
+        if code != DEFAULT:
+            _validate(code, own, reference)
+        messages.update(own)
+    return Catalog(locale, messages)
+
+
+def missing(locale):
+    """Reference keys ``locale`` does not translate itself (before fallback)."""
+    own = _load(locale)
+    return [k for k in _load(DEFAULT) if k not in own]
+
+
+def select(state, query_params, key="locale", available=tuple(LOCALES)):
+    """Locale for this session: ``?lang=`` on first load, then ``state[key]``.
+
+    A locale outside ``available`` (an app that only ships some languages)
+    steps down its fallback chain to the nearest one that is.
+    """
+    if key not in state:
+        state[key] = resolve(query_params.get("lang"))
+    while state[key] not in available:
+        state[key] = FALLBACK.get(state[key], DEFAULT)
+    return state[key]
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Validate message catalogs and report untranslated keys.")
+    ap.add_argument("locales", nargs="*", default=list(LOCALES))
+    ap.add_argument("-v", "--verbose", action="store_true", help="list the untranslated keys")
+    args = ap.parse_args(argv)
+
+    total = len(_load(DEFAULT))
+    for locale in args.locales:
+        catalog(locale)
+        keys = missing(locale)
+        via = FALLBACK.get(locale, "-")
+        print(f"{locale:<6} {total - len(keys):>4}/{total} keys  fallback {via}")
+        if args.verbose:
+            for key in keys:
+                print(f"         {key}")
+
+
+if __name__ == "__main__":
+    main()
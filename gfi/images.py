@@ -0,0 +1,219 @@
+"""
+Right-sized, content-addressed image variants for the apps and static pages.
+
+``GFILOGO.png`` is a 1024 px, 1.6 MB PNG that is never displayed wider than
+200 px, and ``banner.png`` is a ~1 MB, 1520 px wide image shown 38 px tall
+in the Ghost GDP header. Each source is resized to the widths it
+is actually shown at (plus 2x for high-DPI screens) and encoded as AVIF,
+WebP and an optimized PNG fallback under ``static/img/``. File names carry
+a hash of the source bytes and encoder settings, so a variant is built once,
+never goes stale, and can be cached by the browser indefinitely.
+
+    st.markdown(images.picture("GFILOGO.png", 80, alt="GFI"), unsafe_allow_html=True)
+
+    python -m gfi.images                # build variants, print size report
+    python -m gfi.images --rewrite-html # point the static pages at them
+"""
+import argparse
+import functools
+import hashlib
+import html
+import re
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+OUT_DIR = ROOT / "static" / "img"
+APP_URL = "app/static/img"      # Streamlit static serving
+PAGE_URL = "static/img"         # static pages, relative to the site root
+
+# Display widths in CSS px (1x and 2x) for each source image
+SOURCES = {
+    "GFILOGO.png": (44, 60, 80, 88, 120, 160, 200, 240, 400),
+    "banner.png":  (152, 304),
+}
+
+# Encoders in <source> preference order; the last one is the <img> fallback
+FORMATS = {
+    "avif": ("image/avif", {"quality": 55}),
+    "webp": ("image/webp", {"quality": 80, "method": 6}),
+    "png":  ("image/png",  {"optimize": True}),
+}
+
+# Static pages whose logo and banner <img> are swapped for a <picture>; the
+# trilingual pages are rewritten in their templates/ source (then run gfi.split)
+HTML_PAGES = ("index.html", "templates/about.html", "templates/case.html", "templates/enterprise.html",
+              "templates/ghost-gdp.html", "government.html", "ghost gdp.html", "methodology.html",
+              "cn.html", "es.html", "onion.html", "paid-999.html", "paid-4999.html", "paid-9999.html")
+HTML_WIDTH = 44
+BANNER_WIDTH = 152      # .logo img is 38 px tall
+
+
+@functools.lru_cache(maxsize=None)
+def _source_hash(source):
+    return hashlib.sha256((ROOT / source).read_bytes())
+
+
+def _digest(source, fmt):
+    h = _source_hash(source).copy()
+    h.update(repr(FORMATS[fmt][1]).encode())
+    return h.hexdigest()[:10]
+
+
+@functools.lru_cache(maxsize=None)
+def _supported(fmt):
+    from PIL import features
+    return fmt == "png" or features.check(fmt)
+
+
+def _encode(im, width, fmt, path):
+    from PIL import Image
+
+    height = round(im.height * width / im.width)
+    resized = im.resize((width, height), Image.LANCZOS)
+    if fmt == "png" and resized.mode == "RGBA" and resized.getextrema()[3][0] == 255:
+        resized = resized.convert("RGB")
+    tmp = path.with_name(path.name + ".tmp")
+    resized.save(tmp, format=fmt.upper(), **FORMATS[fmt][1])
+    tmp.replace(path)
+
+
+@functools.lru_cache(maxsize=None)
+def build(source):
+    """Ensure every variant of ``source`` exists; return ``{fmt: ((width, filename), ...)}``.
+
+    Runs once per process. Existing content-addressed files are reused, so
+    only a changed source image (or encoder setting) triggers re-encoding.
+    """
+    stem = Path(source).stem
+    variants = {}
+    im = None
+    for fmt in FORMATS:
+        digest = _digest(source, fmt)
+        files = tuple((width, f"{stem}-{width}.{digest}.{fmt}") for width in SOURCES[source])
+        missing = [(w, f) for w, f in files if not (OUT_DIR / f).exists()]
+        # Pillow is only imported when something actually needs encoding
+        if missing and not _supported(fmt):
+            continue
+        for width, filename in missing:
+            if im is None:
+                from PIL import Image
+                OUT_DIR.mkdir(parents=True, exist_ok=True)
+                im = Image.open(ROOT / source)
+                im.load()
+            _encode(im, width, fmt, OUT_DIR / filename)
+        if missing:
+            for stale in OUT_DIR.glob(f"{stem}-*.{fmt}"):
+                if stale.name not in {f for _, f in files}:
+                    stale.unlink(missing_ok=True)
+        variants[fmt] = files
+    return variants
+
+
+def _srcset(files, width, base):
+    """1x/2x descriptors for a fixed display width, ``w`` descriptors otherwise."""
+    if width is None:
+        return ", ".join(f"{base}/{f} {w}w" for w, f in files)
+    one = min((w, f) for w, f in files if w >= width)
+    two = min(((w, f) for w, f in files if w >= 2 * width), default=files[-1])
+    return f"{base}/{one[1]} 1x, {base}/{two[1]} 2x"
+
+
+@functools.lru_cache(maxsize=None)
+def picture(source, width=None, alt="", base=APP_URL, attrs=""):
+    """``<picture>`` markup for ``source`` displayed ``width`` px wide.
+
+    ``width=None`` makes the image fluid (``100%`` of its container) with a
+    width-descriptor srcset, the equivalent of ``use_container_width=True``.
+    """
+    variants = build(source)
+    *sources, fallback = variants
+    tags = [f'<source type="{FORMATS[fmt][0]}" srcset="{_srcset(variants[fmt], width, base)}"'
+            + (' sizes="100vw"' if width is None else "") + ">"
+            for fmt in sources]
+    files = variants[fallback]
+    src = files[-1][1] if width is None else min((w, f) for w, f in files if w >= width)[1]
+    size = 'style="width:100%;height:auto"' if width is None else f'width="{width}"'
+    tags.append(f'<img src="{base}/{src}" srcset="{_srcset(files, width, base)}" '
+                f'alt="{html.escape(alt)}" {size} {attrs}'.rstrip() + ">")
+    return f'<picture data-src="{source}">' + "".join(tags) + "</picture>"
+
+
+# ============================================================================
+# STATIC PAGES
+# ============================================================================
+def _img(source, src):
+    return re.compile(rf'<picture data-src="{re.escape(source)}">.*?<img [^>]*?alt="([^"]*)"([^>]*?)></picture>'
+                      rf'|<img src="{src}"(?: alt="([^"]*)")?([^>]*?)\s*/?>', re.S)
+
+
+@functools.lru_cache(maxsize=None)
+def _aspect(source):
+    from PIL import Image
+    with Image.open(ROOT / source) as im:
+        return im.width / im.height
+
+
+# Some pages link the logo on the live site rather than relative to
+# themselves; both forms are swapped. The banner was referenced as
+# GFIbanner.png, which never existed: every Ghost GDP page fell back to the
+# logo through onerror
+_PAGE_IMAGES = (
+    ("GFILOGO.png", _img("GFILOGO.png", r"(?:https://gfiintel\.com/)?GFILOGO\.png"), HTML_WIDTH),
+    ("banner.png", _img("banner.png", r"(?:GFI)?banner\.png"), BANNER_WIDTH),
+)
+
+
+def rewrite_html(pages=HTML_PAGES):
+    """Swap the logo and banner ``<img>`` on each page for the variant ``<picture>``.
+
+    Idempotent: pages already rewritten are refreshed in place, so rerunning
+    after an image changes picks up the new content hashes.
+    """
+    changed = []
+    for page in pages:
+        path = ROOT / page
+        text = path.read_text(encoding="utf-8")
+        new = text
+        for source, pattern, width in _PAGE_IMAGES:
+
+            def swap(m, source=source, width=width):
+                alt = html.unescape(m.group(1) if m.group(1) is not None else m.group(3) or "")
+                rest = m.group(2) if m.group(1) is not None else m.group(4)
+                rest = re.sub(r'\s*(?:width="\d+"|onerror="[^"]*")', "", rest).strip()
+                # An inline height sets the displayed size, and so the variants
+                height = re.search(r'height:\s*(\d+)px', rest)
+                if height:
+                    width = round(int(height.group(1)) * _aspect(source))
+                return picture(source, width, alt=alt, base=PAGE_URL, attrs=rest)
+
+            new = pattern.sub(swap, new)
+        if new != text:
+            path.write_text(new, encoding="utf-8")
+            changed.append(page)
+    return changed
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Build resized WebP/AVIF/PNG image variants into static/img/.")
+    ap.add_argument("--rewrite-html", action="store_true",
+                    help="point the static pages' logo and banner at the variants")
+    args = ap.parse_args(argv)
+
+    for source, widths in SOURCES.items():
+        original = (ROOT / source).stat().st_size
+        variants = build(source)
+        print(f"{source}  original {original:,} B")
+        for width in widths:
+            sizes = "  ".join(f"{fmt} {(OUT_DIR / dict(files)[width]).stat().st_size:>8,} B"
+                              for fmt, files in variants.items())
+            print(f"  {width:>5} px  {sizes}")
+    if args.rewrite_html:
+        for page in rewrite_html():
+            print(f"rewrote {page}")
+
+
+if __name__ == "__main__":
+    main()
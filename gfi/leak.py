@@ -0,0 +1,213 @@
+"""
+Six-category friction-leak model behind the GL Friction Calculator.
+
+Every function broadcasts over NumPy arrays, so one call scores a single
+form submission or thousands of client / what-if variants in one pass.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+# ============================================================================
+# MODEL CONSTANTS
+# ============================================================================
+EMP_MAP = {"1-10": 5, "11-50": 30, "51-200": 125, "201-500": 350, "501-1000": 750, "1000+": 1500}
+
+HOURS_PER_YEAR = 2080
+WORK_WEEKS     = 50
+
+# Calibration multipliers — the "estimates" a Monte Carlo run may perturb
+MULTIPLIERS = {
+    "meeting_waste":   0.4,    # share of meeting time that is low value
+    "project_share":   0.3,    # share of revenue tied to projects
+    "delay_cost":      0.2,
+    "rework_cost":     0.15,
+    "decision_weekly": 500,    # opportunity cost per employee-week of delay
+    "decision_scale":  10,
+    "turnover_cost":   1.5,    # replacement cost as a multiple of salary
+    "customer_value":  2,      # customer value as a multiple of revenue/employee
+    "customer_loss":   0.1,
+}
+
+# Numeric assessment inputs, in form order
+INPUTS = (
+    "employees",
+    "avg_salary",
+    "revenue_per_employee",
+    "meeting_hours_per_week",
+    "approval_layers",
+    "project_delay_pct",
+    "rework_pct",
+    "decision_time_days",
+    "turnover_rate",
+    "customer_complaint_rate",
+)
+
+DEFAULTS = {
+    "employees":               EMP_MAP["51-200"],
+    "avg_salary":              75000,
+    "revenue_per_employee":    150000,
+    "meeting_hours_per_week":  15,
+    "approval_layers":         3,
+    "project_delay_pct":       30,
+    "rework_pct":              15,
+    "decision_time_days":      14,
+    "turnover_rate":           15,
+    "customer_complaint_rate": 5,
+}
+
+INPUT_LABELS = {
+    "employees":               "Number of Employees",
+    "avg_salary":              "Average Annual Salary",
+    "revenue_per_employee":    "Revenue per Employee",
+    "meeting_hours_per_week":  "Meeting Hours / Week",
+    "approval_layers":         "Approval Layers",
+    "project_delay_pct":       "Project Delay Rate",
+    "rework_pct":              "Rework Rate",
+    "decision_time_days":      "Days to Decide",
+    "turnover_rate":           "Turnover Rate",
+    "customer_complaint_rate": "Customer Complaint Rate",
+}
+
+# Form limits (number_input minimums, slider ranges)
+BOUNDS = {
+    "employees":               (1, np.inf),
+    "avg_salary":              (30000, np.inf),
+    "revenue_per_employee":    (50000, np.inf),
+    "meeting_hours_per_week":  (0, 40),
+    "approval_layers":         (1, 10),
+    "project_delay_pct":       (0, 100),
+    "rework_pct":              (0, 50),
+    "decision_time_days":      (1, 90),
+    "turnover_rate":           (0, 50),
+    "customer_complaint_rate": (0, 50),
+}
+
+CATEGORIES = ("meeting", "delay", "rework", "decision", "turnover", "customer")
+LABELS = {
+    "meeting":  "Meeting Overhead",
+    "delay":    "Project Delays",
+    "rework":   "Rework",
+    "decision": "Decision Bottlenecks",
+    "turnover": "Turnover",
+    "customer": "Customer Friction",
+}
+
+
+class LeakResult(NamedTuple):
+    total: np.ndarray       # (n,)   annual leak in USD, floored at 0
+    breakdown: np.ndarray   # (n, 6) per-category cost, columns in CATEGORIES order
+    risk: np.ndarray        # (n,)   operational friction score, 0–100
+
+    def category(self, name):
+        return self.breakdown[..., CATEGORIES.index(name)]
+
+
+# ============================================================================
+# MODEL TERMS
+# ============================================================================
+# Each cost term reads the inputs it lists in COST_INPUTS; each risk factor
+# reads exactly one input (RISK_INPUTS). Incremental what-if updates use
+# these to recompute only the terms an input change touches.
+def _meeting(x, m):
+    return x["meeting_hours_per_week"] * m["meeting_waste"] * WORK_WEEKS * x["employees"] * (x["avg_salary"] / HOURS_PER_YEAR)
+
+def _delay(x, m):
+    return (x["project_delay_pct"] / 100) * (x["revenue_per_employee"] * m["project_share"]) * x["employees"] * m["delay_cost"]
+
+def _rework(x, m):
+    return (x["rework_pct"] / 100) * x["avg_salary"] * x["employees"] * m["rework_cost"]
+
+def _decision(x, m):
+    return ((x["decision_time_days"] / 7) - 1) * m["decision_weekly"] * x["employees"] * m["decision_scale"]
+
+def _turnover(x, m):
+    return (x["turnover_rate"] / 100) * x["employees"] * x["avg_salary"] * m["turnover_cost"]
+
+def _customer(x, m):
+    return (x["customer_complaint_rate"] / 100) * x["employees"] * (x["revenue_per_employee"] * m["customer_value"]) * m["customer_loss"]
+
+
+COST_TERMS = {
+    "meeting":  _meeting,
+    "delay":    _delay,
+    "rework":   _rework,
+    "decision": _decision,
+    "turnover": _turnover,
+    "customer": _customer,
+}
+COST_INPUTS = {
+    "meeting":  ("meeting_hours_per_week", "employees", "avg_salary"),
+    "delay":    ("project_delay_pct", "revenue_per_employee", "employees"),
+    "rework":   ("rework_pct", "avg_salary", "employees"),
+    "decision": ("decision_time_days", "employees"),
+    "turnover": ("turnover_rate", "employees", "avg_salary"),
+    "customer": ("customer_complaint_rate", "revenue_per_employee", "employees"),
+}
+
+RISK_TERMS = (
+    lambda v: (v - 1) * 10,
+    lambda v: v * 0.5,
+    lambda v: v * 1.5,
+    lambda v: (v / 30) * 20,
+    lambda v: v,
+    lambda v: v * 1.5,
+)
+RISK_INPUTS = (
+    "approval_layers",
+    "project_delay_pct",
+    "rework_pct",
+    "decision_time_days",
+    "turnover_rate",
+    "customer_complaint_rate",
+)
+
+
+def total_of(breakdown):
+    return np.maximum(np.sum(breakdown, axis=-1), 0)
+
+
+def risk_of(factors):
+    return np.minimum(np.mean(factors, axis=-1), 100)
+
+
+# ============================================================================
+# SCORING
+# ============================================================================
+def score(employees, avg_salary, revenue_per_employee, meeting_hours_per_week,
+          approval_layers, project_delay_pct, rework_pct, decision_time_days,
+          turnover_rate, customer_complaint_rate, **multipliers):
+    """Score any number of assessments at once.
+
+    Inputs are scalars or equal-length (broadcastable) arrays. Keyword
+    overrides for ``MULTIPLIERS`` may also be arrays, e.g. one sampled
+    multiplier per row.
+    """
+    unknown = set(multipliers) - set(MULTIPLIERS)
+    if unknown:
+        raise ValueError(f"Unknown multipliers: {', '.join(sorted(unknown))}")
+    m = {**MULTIPLIERS, **multipliers}
+
+    values = (employees, avg_salary, revenue_per_employee, meeting_hours_per_week,
+              approval_layers, project_delay_pct, rework_pct, decision_time_days,
+              turnover_rate, customer_complaint_rate)
+    x = {name: np.asarray(v, dtype=float) for name, v in zip(INPUTS, values)}
+
+    terms = np.broadcast_arrays(*(COST_TERMS[c](x, m) for c in CATEGORIES),
+                                *(f(x[n]) for f, n in zip(RISK_TERMS, RISK_INPUTS)))
+    breakdown = np.stack(terms[:len(CATEGORIES)], axis=-1)
+    factors = np.stack(terms[len(CATEGORIES):], axis=-1)
+    return LeakResult(total_of(breakdown), breakdown, risk_of(factors))
+
+
+def score_one(labels=None, **inputs):
+    """Score a single form submission.
+
+    Returns ``(total_leak, risk_score, breakdown)`` as plain Python values,
+    with the breakdown keyed by ``labels`` (defaults to ``LABELS``) in
+    ``CATEGORIES`` order — ready to drop into ``st.session_state``.
+    """
+    labels = labels or LABELS
+    result = score(**inputs)
+    breakdown = {labels[c]: float(v) for c, v in zip(CATEGORIES, result.breakdown)}
+    return float(result.total), float(result.risk), breakdown
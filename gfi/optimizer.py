@@ -0,0 +1,124 @@
+"""
+Intervention optimizer: the fewest input changes that reach a target.
+
+Only the operational inputs a client can act on are searched; headcount,
+salary and revenue stay fixed. Subsets of inputs are tried in order of
+size. Each input moves one model term, so leak and risk are additive
+across inputs. The best-case gain of a subset (every input at its slider
+minimum) is therefore an exact upper bound, and subsets that cannot
+reach the target are pruned before any grid is built. The surviving
+subsets are scored as one cartesian grid per subset with a single
+``leak.score`` call. Among feasible plans the smallest total change
+(as a share of each slider's range) wins.
+"""
+from itertools import combinations
+from typing import NamedTuple
+
+import numpy as np
+
+from gfi import leak
+
+ACTIONABLE = (
+    "meeting_hours_per_week",
+    "approval_layers",
+    "project_delay_pct",
+    "rework_pct",
+    "decision_time_days",
+    "turnover_rate",
+    "customer_complaint_rate",
+)
+
+# Grid rows per subset: one- and two-input plans search every integer slider
+# value; larger subsets get proportionally coarser grids.
+MAX_GRID_ROWS = 50_000
+
+
+class Plan(NamedTuple):
+    feasible: bool
+    changes: dict         # input -> (current, proposed), only inputs that move
+    leak: float
+    risk: float
+    leak_reduction: float # fraction of the current leak removed
+
+
+def _levels(current, lo, n):
+    """Up to ``n`` integer slider values from ``lo`` up to and including ``current``."""
+    if n > current - lo:
+        return np.arange(lo, current + 1)
+    return np.unique(np.round(np.linspace(lo, current, n)))
+
+
+def _meets(total, risk, base_total, target_risk, target_leak_reduction):
+    ok = np.ones(np.shape(total), dtype=bool)
+    if target_risk is not None:
+        ok &= risk <= target_risk + 1e-9
+    if target_leak_reduction is not None:
+        ok &= (base_total - total) >= target_leak_reduction * base_total - 1e-6
+    return ok
+
+
+def optimize(inputs, target_risk=None, target_leak_reduction=None, actionable=ACTIONABLE):
+    """Smallest set of input changes reaching ``target_risk`` (score ≤ target)
+    and/or cutting the leak by ``target_leak_reduction`` (a fraction).
+
+    If no combination within the slider ranges reaches the target, returns the
+    best achievable plan (every actionable input at its minimum) with
+    ``feasible=False``.
+    """
+    if target_risk is None and target_leak_reduction is None:
+        raise ValueError("Give target_risk and/or target_leak_reduction")
+
+    x = {n: float(inputs[n]) for n in leak.INPUTS}
+    base = leak.score(**x)
+    base_total, base_risk = float(base.total), float(base.risk)
+    if _meets(base_total, base_risk, base_total, target_risk, target_leak_reduction):
+        return Plan(True, {}, base_total, base_risk, 0.0)
+
+    lo = {n: float(leak.BOUNDS[n][0]) for n in actionable}
+    span = {n: float(leak.BOUNDS[n][1] - leak.BOUNDS[n][0]) for n in actionable}
+    movable = [n for n in actionable if x[n] > lo[n]]
+
+    # Best-case single-input gains (all rows at once): exact, since terms are additive
+    floor = np.tile([x[n] for n in leak.INPUTS], (len(movable), 1))
+    for i, n in enumerate(movable):
+        floor[i, leak.INPUTS.index(n)] = lo[n]
+    best = leak.score(**{n: floor[:, j] for j, n in enumerate(leak.INPUTS)})
+    # Raw (uncapped) gains keep the bound additive
+    leak_gain = dict(zip(movable, base.breakdown.sum() - best.breakdown.sum(axis=-1)))
+    risk_gain = dict(zip(movable, base_risk - best.risk))
+    need_leak = (target_leak_reduction or 0.0) * base_total
+    need_risk = base_risk - target_risk if target_risk is not None else 0.0
+
+    for size in range(1, len(movable) + 1):
+        levels = max(2, int(MAX_GRID_ROWS ** (1 / size)))
+        winner = None
+        for subset in combinations(movable, size):
+            if sum(leak_gain[n] for n in subset) < need_leak - 1e-6:
+                continue
+            if sum(risk_gain[n] for n in subset) < need_risk - 1e-9:
+                continue
+            # Every input in the subset must actually move
+            axes = [_levels(x[n], lo[n], levels)[:-1] for n in subset]
+            mesh = np.meshgrid(*axes, indexing="ij")
+            grid = {n: x[n] for n in leak.INPUTS}
+            grid.update({n: m.ravel() for n, m in zip(subset, mesh)})
+            result = leak.score(**grid)
+            ok = _meets(result.total, result.risk, base_total, target_risk, target_leak_reduction)
+            if not ok.any():
+                continue
+            cost = sum((x[n] - grid[n]) / span[n] for n in subset)
+            cost = np.where(ok, cost, np.inf)
+            i = int(np.argmin(cost))
+            if winner is None or cost[i] < winner[0]:
+                winner = (float(cost[i]), subset, {n: float(grid[n][i]) for n in subset},
+                          float(result.total[i]), float(result.risk[i]))
+        if winner:
+            _, subset, proposed, total, risk = winner
+            return Plan(True, {n: (x[n], proposed[n]) for n in subset}, total, risk,
+                        (base_total - total) / base_total if base_total else 0.0)
+
+    proposed = {n: lo[n] for n in movable}
+    floor_all = leak.score(**{**x, **proposed})
+    total, risk = float(floor_all.total), float(floor_all.risk)
+    return Plan(False, {n: (x[n], lo[n]) for n in movable}, total, risk,
+                (base_total - total) / base_total if base_total else 0.0)
@@ -0,0 +1,486 @@
+"""
+Persistence for completed assessments and leads.
+
+Until now every assessment lived only in ``st.session_state`` and was gone
+when the tab closed. A ``Repository`` writes two tables — ``assessments``
+and ``leads`` — to one of three interchangeable backends:
+
+    SupabaseRepository   production; PostgREST over one pooled HTTP client
+    PostgresRepository   a local Postgres (``pip install "psycopg[binary,pool]"``)
+    SQLiteRepository     development and tests; no server, no dependency
+
+``default()`` picks one from the environment or ``st.secrets`` and builds it
+once per process, so every Streamlit session shares the same connection
+pool instead of opening its own:
+
+    GFI_DATABASE_URL=postgresql://…  or  sqlite:///path/to.db
+    SUPABASE_URL + SUPABASE_KEY     Supabase
+    (nothing)                       SQLite at data/local/gfi.sqlite3
+
+Rows carry a client-generated ``id``; inserts ignore an ``id`` that is
+already stored, so a retried write never duplicates a row. Every write is
+timed into ``WRITES`` (a ``gfi.timing.Timings``), per table, and shows up in
+the app's ``?timing=1`` panel next to the rerun timings.
+
+    python -m gfi.repository schema            # Postgres / Supabase DDL
+    python -m gfi.repository bench -n 500      # write latency against default()
+"""
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from gfi import timing
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SQLITE = ROOT / "data" / "local" / "gfi.sqlite3"
+
+POOL_SIZE = 10          # connections per process, every backend
+PAGE = 1000             # rows per request when reading back
+TIMEOUT = 10.0          # seconds per write
+
+log = logging.getLogger("gfi.repository")
+
+# ============================================================================
+# SCHEMA — Postgres types; SQLite stores json as TEXT and timestamps as ISO
+# ============================================================================
+TABLES = {
+    "assessments": (
+        ("id",            "text primary key"),
+        ("created_at",    "timestamptz not null"),
+        ("locale",        "text"),
+        ("company",       "text"),
+        ("industry",      "text"),
+        ("employee_band", "text"),
+        ("employees",     "integer"),
+        ("inputs",        "jsonb not null"),
+        ("total_leak",    "double precision"),
+        ("risk_score",    "double precision"),
+        ("peer_leak_pct", "double precision"),
+        ("peer_risk_pct", "double precision"),
+    ),
+    "leads": (
+        ("id",            "text primary key"),
+        ("created_at",    "timestamptz not null"),
+        ("source",        "text"),
+        ("locale",        "text"),
+        ("organisation",  "text"),
+        ("name",          "text"),
+        ("email",         "text"),
+        ("notes",         "text"),
+        ("files",         "jsonb"),
+    ),
+}
+JSON_COLUMNS = {name for cols in TABLES.values() for name, kind in cols if kind.startswith("jsonb")}
+PEER_COLUMNS = ("industry", "employee_band", "total_leak", "risk_score")
+_PEERS_SQL = (f"select {', '.join(PEER_COLUMNS)} from assessments "
+              "where total_leak is not null and risk_score is not null")
+_SQLITE_TYPES = {"timestamptz": "text", "jsonb": "text", "double precision": "real"}
+
+
+def ddl(dialect="postgres"):
+    """``CREATE TABLE IF NOT EXISTS`` statements for every table."""
+    statements = []
+    for table, columns in TABLES.items():
+        cols = []
+        for name, kind in columns:
+            if dialect == "sqlite":
+                for pg, lite in _SQLITE_TYPES.items():
+                    kind = kind.replace(pg, lite)
+            cols.append(f"  {name} {kind}")
+        statements.append(f"create table if not exists {table} (\n" + ",\n".join(cols) + "\n);")
+    return statements
+
+
+# ============================================================================
+# RECORDS
+# ============================================================================
+def _now():
+    return datetime.now(timezone.utc).isoformat()
+
+
+def assessment(inputs, result, locale=None, company=None, industry=None, employee_band=None, peers=None):
+    """One ``assessments`` row from the calculator's inputs and result bundle."""
+    return {
+        "id": uuid.uuid4().hex,
+        "created_at": _now(),
+        "locale": locale,
+        "company": company or None,
+        "industry": industry,
+        "employee_band": employee_band,
+        "employees": int(inputs["employees"]),
+        "inputs": {k: float(v) for k, v in inputs.items()},
+        "total_leak": float(result["total_leak"]),
+        "risk_score": float(result["risk_score"]),
+        "peer_leak_pct": None if not peers else peers.get("leak_pct"),
+        "peer_risk_pct": None if not peers else peers.get("risk_pct"),
+    }
+
+
+def lead(email=None, name=None, organisation=None, notes=None, files=(), source="contact", locale=None):
+    """One ``leads`` row; empty strings are stored as null."""
+    return {
+        "id": uuid.uuid4().hex,
+        "created_at": _now(),
+        "source": source,
+        "locale": locale,
+        "organisation": organisation or None,
+        "name": name or None,
+        "email": email or None,
+        "notes": notes or None,
+        "files": list(files),
+    }
+
+
+# ============================================================================
+# BACKENDS
+# ============================================================================
+class RepositoryError(RuntimeError):
+    """A write that did not reach the store (the cause is chained).
+
+    ``permanent`` marks a failure the store will repeat for the same rows
+    (a constraint, a missing column, a row-level-security denial), as
+    opposed to an outage; retrying those rows cannot help.
+    """
+
+    def __init__(self, message, permanent=False):
+        super().__init__(message)
+        self.permanent = permanent
+
+
+class Repository:
+    """Write interface shared by every backend; subclasses implement ``_insert``."""
+
+    name = "repository"
+
+    def __init__(self, timings=None):
+        self.timings = WRITES if timings is None else timings
+        self.errors = {}
+        self._lock = threading.Lock()
+
+    def write(self, table, rows):
+        """Insert ``rows`` into ``table``, skipping ids already stored.
+
+        Latency is recorded under ``table``; failures are counted and
+        re-raised as ``RepositoryError``.
+        """
+        if table not in TABLES:
+            raise ValueError(f"unknown table {table!r}")
+        if not rows:
+            return
+        t0 = timing.start()
+        try:
+            self._insert(table, rows)
+        except Exception as e:
+            with self._lock:
+                self.errors[table] = self.errors.get(table, 0) + 1
+            raise RepositoryError(f"{self.name}: writing {len(rows)} row(s) to {table} failed: {e}",
+                                  permanent=self._permanent(e)) from e
+        finally:
+            self.timings.record(table, timing.elapsed(t0))
+
+    def save_assessment(self, row):
+        self.write("assessments", [row])
+
+    def save_lead(self, row):
+        self.write("leads", [row])
+
+    def count(self, table):
+        raise NotImplementedError
+
+    def peers(self, before=None):
+        """Every stored assessment as ``(industry, employee_band, total_leak, risk_score)``.
+
+        ``before`` (an ISO timestamp) keeps only rows created earlier.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def _insert(self, table, rows):
+        raise NotImplementedError
+
+    def _permanent(self, exc):
+        """Whether ``exc`` is about the rows rather than the store being reachable."""
+        return isinstance(exc, (TypeError, ValueError))
+
+
+class SQLiteRepository(Repository):
+    """Local file (or ``:memory:``); one connection per thread, WAL journal."""
+
+    name = "sqlite"
+
+    def __init__(self, path=DEFAULT_SQLITE, timings=None):
+        super().__init__(timings)
+        self.path = str(path)
+        if self.path == ":memory:":
+            # One database shared by every thread's connection, not one each
+            self._uri = f"file:gfi-{id(self)}?mode=memory&cache=shared"
+        else:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._uri = None
+        self._local = threading.local()
+        self._connections = []
+        with self._connection() as conn:
+            for statement in ddl("sqlite"):
+                conn.execute(statement)
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._uri or self.path, timeout=TIMEOUT, check_same_thread=False,
+                                   uri=self._uri is not None)
+            conn.execute("pragma journal_mode=wal")
+            conn.execute("pragma synchronous=normal")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _insert(self, table, rows):
+        columns = [name for name, _ in TABLES[table]]
+        sql = (f"insert or ignore into {table} ({', '.join(columns)}) "
+               f"values ({', '.join('?' * len(columns))})")
+        values = [[json.dumps(r.get(c)) if c in JSON_COLUMNS else r.get(c) for c in columns] for r in rows]
+        with self._connection() as conn:
+            conn.executemany(sql, values)
+
+    def _permanent(self, exc):
+        # OperationalError (locked, disk I/O) may pass; the rest is about the rows
+        return super()._permanent(exc) or (
+            isinstance(exc, sqlite3.DatabaseError) and not isinstance(exc, sqlite3.OperationalError))
+
+    def count(self, table):
+        return self._connection().execute(f"select count(*) from {table}").fetchone()[0]
+
+    def peers(self, before=None):
+        if before is None:
+            yield from self._connection().execute(_PEERS_SQL)
+        else:
+            yield from self._connection().execute(_PEERS_SQL + " and created_at < ?", (before,))
+
+    def close(self):
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+
+
+class PostgresRepository(Repository):
+    """Local or self-hosted Postgres through a ``psycopg_pool`` connection pool."""
+
+    name = "postgres"
+
+    def __init__(self, dsn, pool_size=POOL_SIZE, timings=None):
+        super().__init__(timings)
+        try:
+            from psycopg.types.json import Jsonb
+            from psycopg_pool import ConnectionPool
+        except ImportError as e:
+            raise ImportError('PostgresRepository needs: pip install "psycopg[binary,pool]"') from e
+        self._jsonb = Jsonb
+        self._pool = ConnectionPool(dsn, min_size=1, max_size=pool_size, timeout=TIMEOUT, open=True)
+        with self._pool.connection() as conn:
+            for statement in ddl("postgres"):
+                conn.execute(statement)
+
+    def _insert(self, table, rows):
+        columns = [name for name, _ in TABLES[table]]
+        sql = (f"insert into {table} ({', '.join(columns)}) "
+               f"values ({', '.join(['%s'] * len(columns))}) on conflict (id) do nothing")
+        values = [[self._jsonb(r.get(c)) if c in JSON_COLUMNS else r.get(c) for c in columns] for r in rows]
+        with self._pool.connection() as conn:
+            conn.cursor().executemany(sql, values)
+
+    def _permanent(self, exc):
+        from psycopg import errors
+        return super()._permanent(exc) or isinstance(
+            exc, (errors.DataError, errors.IntegrityError, errors.ProgrammingError))
+
+    def count(self, table):
+        with self._pool.connection() as conn:
+            return conn.execute(f"select count(*) from {table}").fetchone()[0]
+
+    def peers(self, before=None):
+        with self._pool.connection() as conn:
+            cursor = conn.cursor()
+            if before is None:
+                cursor.execute(_PEERS_SQL)
+            else:
+                cursor.execute(_PEERS_SQL + " and created_at < %s", (before,))
+            while rows := cursor.fetchmany(PAGE):
+                yield from rows
+
+    def close(self):
+        self._pool.close()
+
+
+class SupabaseRepository(Repository):
+    """Supabase (PostgREST); one ``httpx`` pool shared by every session.
+
+    The tables must exist — paste ``python -m gfi.repository schema`` into
+    the Supabase SQL editor — and the key's row-level-security policies
+    must allow ``insert``. Inserts read nothing back (``returning=minimal``);
+    ``peers()`` needs a ``select`` policy on ``assessments`` and reads
+    nothing without one.
+    """
+
+    name = "supabase"
+
+    def __init__(self, url, key, pool_size=POOL_SIZE, timings=None):
+        super().__init__(timings)
+        import httpx
+        from postgrest import ReturnMethod
+        from supabase import ClientOptions, create_client
+
+        self._http = httpx.Client(
+            timeout=TIMEOUT,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+        )
+        options = ClientOptions(httpx_client=self._http, postgrest_client_timeout=TIMEOUT,
+                                auto_refresh_token=False, persist_session=False)
+        self._client = create_client(url, key, options)
+        self._minimal = ReturnMethod.minimal
+
+    def _insert(self, table, rows):
+        self._client.table(table).upsert(
+            rows, on_conflict="id", ignore_duplicates=True, returning=self._minimal).execute()
+
+    def _permanent(self, exc):
+        from postgrest.exceptions import APIError
+        if not isinstance(exc, APIError):
+            return super()._permanent(exc)
+        # SQLSTATE / PostgREST code; connection (08), resources (53),
+        # operator intervention (57) and rollbacks (40) may pass
+        code = exc.code or ""
+        return bool(code) and not code.startswith(("08", "40", "53", "57"))
+
+    def count(self, table):
+        return self._client.table(table).select("id", count="exact", head=True).execute().count
+
+    def peers(self, before=None):
+        start = 0
+        while True:
+            # Request builders accumulate parameters, so one per page
+            query = (self._client.table("assessments").select(",".join(PEER_COLUMNS))
+                     .not_.is_("total_leak", "null").not_.is_("risk_score", "null"))
+            if before is not None:
+                query = query.lt("created_at", before)
+            rows = query.order("id").range(start, start + PAGE - 1).execute().data
+            yield from (tuple(r[c] for c in PEER_COLUMNS) for r in rows)
+            if len(rows) < PAGE:
+                return
+            start += PAGE
+
+    def close(self):
+        self._http.close()
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+WRITES = timing.Timings(kind="write")
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def _setting(name, secrets):
+    if os.environ.get(name):
+        return os.environ[name]
+    try:
+        return secrets.get(name) if secrets is not None else None
+    except Exception:       # st.secrets raises when there is no secrets.toml
+        return None
+
+
+def connect(url=None, secrets=None):
+    """A new repository for ``url``, or for whatever the settings name."""
+    url = url or _setting("GFI_DATABASE_URL", secrets)
+    if url:
+        if url.startswith("sqlite:///"):
+            return SQLiteRepository(url[len("sqlite:///"):] or ":memory:")
+        if url.startswith(("postgres://", "postgresql://")):
+            return PostgresRepository(url)
+        raise ValueError(f"unsupported database URL {url!r} (sqlite:/// or postgresql://)")
+    supabase_url, supabase_key = _setting("SUPABASE_URL", secrets), _setting("SUPABASE_KEY", secrets)
+    if supabase_url and supabase_key:
+        return SupabaseRepository(supabase_url, supabase_key)
+    if supabase_url or supabase_key:
+        # Usually a misspelt setting; say so rather than quietly save locally
+        missing = "SUPABASE_KEY" if supabase_url else "SUPABASE_URL"
+        log.warning("%s is set but %s is not; saving to SQLite at %s instead of Supabase",
+                    "SUPABASE_URL" if supabase_url else "SUPABASE_KEY", missing, DEFAULT_SQLITE)
+    return SQLiteRepository(DEFAULT_SQLITE)
+
+
+def default(secrets=None):
+    """The process-wide repository, built on first use from the settings."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = connect(secrets=secrets)
+            log.info("persisting to %s", _default.name)
+        return _default
+
+
+def persist(table, row, secrets=None):
+    """Best-effort write for the apps: a failure is logged, never raised.
+
+    Returns whether the row was stored.
+    """
+    try:
+        default(secrets).write(table, [row])
+        return True
+    except Exception:
+        log.exception("could not persist %s row %s", table, row.get("id"))
+        return False
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+def _bench(repo, n, threads):
+    rows = [assessment(
+        {"employees": 100, "avg_salary": 75000, "revenue_per_employee": 150000, "meeting_hours_per_week": 15,
+         "approval_layers": 3, "project_delay_pct": 30, "rework_pct": 15, "decision_time_days": 14,
+         "turnover_rate": 15, "customer_complaint_rate": 5},
+        {"total_leak": 1.0e6 + i, "risk_score": 50.0}, locale="en", company="bench") for i in range(n)]
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(repo.save_assessment, rows))
+    return time.perf_counter() - t0
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m gfi.repository", description="Assessment / lead persistence.")
+    sub = ap.add_subparsers(dest="command", required=True)
+    s = sub.add_parser("schema", help="print CREATE TABLE statements")
+    s.add_argument("--sqlite", action="store_true", help="SQLite dialect instead of Postgres / Supabase")
+    b = sub.add_parser("bench", help="time single-row writes (writes real rows)")
+    b.add_argument("--url", help="sqlite:///… or postgresql://… (default: from the environment)")
+    b.add_argument("-n", type=int, default=500)
+    b.add_argument("--threads", type=int, default=4, help="concurrent writers, like concurrent sessions")
+    args = ap.parse_args(argv)
+
+    if args.command == "schema":
+        print("\n\n".join(ddl("sqlite" if args.sqlite else "postgres")))
+        return
+    repo = connect(args.url)
+    elapsed = _bench(repo, args.n, args.threads)
+    print(f"{repo.name}: {args.n:,} writes in {elapsed:.2f}s ({args.n / elapsed:,.0f}/s), "
+          f"{args.threads} threads, errors: {sum(repo.errors.values())}")
+    print(timing.table(repo.timings))
+    repo.close()
+
+
+if __name__ == "__main__":
+    main()
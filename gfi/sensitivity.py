@@ -0,0 +1,73 @@
+"""
+One-pass sensitivity analysis: which assessment input moves the leak most.
+
+Each numeric input is nudged down and up by ``STEP`` (relative, clipped to
+the form limits) while the others stay at their submitted values. The
+baseline and all 2 × 10 perturbations are stacked into one batch and
+scored with a single ``leak.score`` call.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+from gfi import leak
+
+STEP = 0.10   # ±10% perturbation
+
+
+class Sensitivity(NamedTuple):
+    inputs: tuple               # input names, sorted by leak swing (largest first)
+    leak_low: np.ndarray        # leak with the input nudged down
+    leak_high: np.ndarray       # leak with the input nudged up
+    leak_elasticity: np.ndarray # % change in leak per 1% change in input
+    risk_elasticity: np.ndarray # % change in risk score per 1% change in input
+    base_leak: float
+    base_risk: float
+
+    @property
+    def swing(self):
+        return np.abs(self.leak_high - self.leak_low)
+
+
+def _elasticity(low, high, base, x_low, x_high, x):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        e = ((high - low) / base) / ((x_high - x_low) / x)
+    return np.where(np.isfinite(e), e, 0.0)
+
+
+def analyze(inputs, step=STEP):
+    """Perturb every input in ``leak.INPUTS`` and score the whole batch at once.
+
+    Inputs at zero are nudged by ``step`` of their slider range instead, and
+    report an elasticity of 0 (their swing is still meaningful).
+    """
+    names = leak.INPUTS
+    k = len(names)
+    x = np.array([float(inputs[n]) for n in names])
+    lo = np.array([leak.BOUNDS[n][0] for n in names])
+    hi = np.array([leak.BOUNDS[n][1] for n in names])
+    span = np.where(np.isfinite(hi), hi - lo, x)
+    delta = np.where(x != 0, np.abs(x) * step, span * step)
+    x_low = np.clip(x - delta, lo, hi)
+    x_high = np.clip(x + delta, lo, hi)
+
+    # Row 0 = baseline, rows 1..k = nudged down, rows k+1..2k = nudged up
+    grid = np.tile(x, (2 * k + 1, 1))
+    idx = np.arange(k)
+    grid[1 + idx, idx] = x_low
+    grid[1 + k + idx, idx] = x_high
+    result = leak.score(**{n: grid[:, i] for i, n in enumerate(names)})
+
+    base_leak, base_risk = result.total[0], result.risk[0]
+    leak_low, leak_high = result.total[1:k + 1], result.total[k + 1:]
+    risk_low, risk_high = result.risk[1:k + 1], result.risk[k + 1:]
+    leak_e = _elasticity(leak_low, leak_high, base_leak, x_low, x_high, x)
+    risk_e = _elasticity(risk_low, risk_high, base_risk, x_low, x_high, x)
+
+    order = np.argsort(-np.abs(leak_high - leak_low), kind="stable")
+    return Sensitivity(
+        tuple(names[i] for i in order),
+        leak_low[order], leak_high[order],
+        leak_e[order], risk_e[order],
+        float(base_leak), float(base_risk),
+    )
@@ -0,0 +1,426 @@
+"""
+Build the static site into ``dist/``: minified, content-hashed, precompressed.
+
+The hand-written pages carry their CSS and JS inline, so every navigation
+re-downloads 10–50 KB of styles and scripts the browser has already seen.
+The build moves each inline ``<style>`` / ``<script>`` block into an
+external file named by its content hash (identical blocks on different
+pages become one file), minifies HTML, CSS and JS, rewrites references to
+local stylesheets, and writes ``.gz`` (and, with the ``brotli`` package,
+``.br``) next to every text file so the host can serve them as-is.
+
+Hashed assets never change under the same name, so they can be served with
+``Cache-Control: immutable``; only the HTML needs revalidating.
+
+    python -m gfi.site                  # build dist/, print per-page sizes
+    python -m gfi.site --out public     # somewhere else
+
+The minifiers are deliberately conservative: whitespace is collapsed, not
+reasoned about. HTML keeps one space wherever the source had any, CSS never
+touches ``+`` / ``-`` (``calc()``), and JS keeps a newline wherever removing
+it could change automatic semicolon insertion.
+"""
+import argparse
+import gzip
+import hashlib
+import re
+import shutil
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+OUT_DIR = ROOT / "dist"
+ASSET_DIR = "assets"
+
+# Every page served from the site root, including the rendered case pages
+# (case/<lang>/<case>.html, see gfi.cases); the Streamlit apps are not part of it
+PAGES = tuple(sorted(
+    str(p.relative_to(ROOT)) for p in [*ROOT.glob("*.html"), *ROOT.glob("*/*.html"), *ROOT.glob("case/*/*.html")]
+    if not p.relative_to(ROOT).parts[0] in ("dist", "static", "app_pages", "pages", "templates")
+))
+# Copied verbatim (crawler files); anything a page links to is copied too
+EXTRA_FILES = ("robots.txt", "sitemap.xml", "BingSiteAuth.xml")
+
+COMPRESSIBLE = {".html", ".css", ".js", ".xml", ".txt", ".svg", ".json"}
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+def _hash(data):
+    return hashlib.sha256(data).hexdigest()[:10]
+
+
+# ============================================================================
+# MINIFIERS
+# ============================================================================
+_CSS_PROTECT = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|url\([^)]*\)', re.S)
+
+
+def minify_css(css):
+    """Strip comments and collapse whitespace; strings and ``url()`` are kept."""
+    kept = []
+
+    def stash(m):
+        kept.append(m.group(0))
+        return f"\0{len(kept) - 1}\0"
+
+    css = _CSS_PROTECT.sub(stash, css)
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    css = css.replace(";}", "}").strip()
+    return re.sub(r"\0(\d+)\0", lambda m: kept[int(m.group(1))], css)
+
+
+_JS_WORD = re.compile(r"[\w$\\\u0080-\uffff]")
+# After one of these a "/" starts a regex literal, not a division
+_JS_REGEX_AFTER = set("(,=:[!&|?{};+-*%<>~^")
+_JS_REGEX_KEYWORDS = {"return", "typeof", "case", "do", "else", "in", "of", "new",
+                      "delete", "void", "throw", "yield", "await", "instanceof"}
+# A newline next to these can be dropped without changing semicolon insertion
+_JS_NL_AFTER = set("{[(,;:=?&|!<>*%~^")
+_JS_NL_BEFORE = set("}]),;.:?=&|*%<>")
+
+
+def minify_js(src):
+    """Whitespace and comment removal that is safe under ASI.
+
+    Strings, template literals (including ``${}`` bodies) and regex literals
+    pass through untouched.
+    """
+    out = []
+    _js(src, 0, out, nested=False)
+    return "".join(out).strip()
+
+
+def _js_last(out):
+    for chunk in reversed(out):
+        if chunk.strip():
+            return chunk.rstrip()[-1]
+    return ""
+
+
+def _js_last_word(out):
+    text = "".join(out[-8:]).rstrip()
+    m = re.search(r"[\w$]+$", text)
+    return m.group(0) if m else ""
+
+
+def _js(src, i, out, nested):
+    """Minify code from ``i``; with ``nested`` stop after the ``}`` closing a
+    template ``${``. Returns the index just past where scanning stopped."""
+    n = len(src)
+    depth = 0
+    while i < n:
+        ch = src[i]
+        if ch in "\"'":
+            j = i + 1
+            while j < n and src[j] != ch:
+                j += 2 if src[j] == "\\" else 1
+            out.append(src[i:j + 1])
+            i = j + 1
+        elif ch == "`":
+            i = _js_template(src, i, out)
+        elif ch == "/" and src.startswith("//", i):
+            j = src.find("\n", i)
+            i = n if j < 0 else j          # the newline itself is whitespace
+        elif ch == "/" and src.startswith("/*", i):
+            j = src.find("*/", i + 2)
+            j = n if j < 0 else j + 2
+            out.append("\n" if "\n" in src[i:j] else " ")
+            i = j
+        elif ch == "/" and (_js_last(out) in _JS_REGEX_AFTER or _js_last(out) == ""
+                            or _js_last_word(out) in _JS_REGEX_KEYWORDS):
+            j, in_class = i + 1, False
+            while j < n and (in_class or src[j] != "/") and src[j] != "\n":
+                if src[j] == "\\":
+                    j += 1
+                elif src[j] == "[":
+                    in_class = True
+                elif src[j] == "]":
+                    in_class = False
+                j += 1
+            j += 1
+            while j < n and src[j].isalpha():
+                j += 1
+            out.append(src[i:j])
+            i = j
+        elif ch.isspace():
+            j = i
+            while j < n and src[j].isspace():
+                j += 1
+            newline = "\n" in src[i:j]
+            prev, nxt = _js_last(out), src[j] if j < n else ""
+            # A following comment is more whitespace; decide after it
+            if nxt == "/" and src.startswith(("//", "/*"), j):
+                if newline:
+                    out.append("\n")
+            elif prev and nxt:
+                if _JS_WORD.match(prev) and _JS_WORD.match(nxt):
+                    out.append("\n" if newline else " ")
+                elif prev + nxt in ("++", "--", "+-", "-+"):
+                    out.append(" ")
+                elif newline and prev not in _JS_NL_AFTER and nxt not in _JS_NL_BEFORE:
+                    out.append("\n")
+            i = j
+        else:
+            if nested:
+                if ch == "{":
+                    depth += 1
+                elif ch == "}":
+                    if depth == 0:
+                        out.append(ch)
+                        return i + 1
+                    depth -= 1
+            out.append(ch)
+            i += 1
+    return i
+
+
+def _js_template(src, i, out):
+    n = len(src)
+    j = i + 1
+    start = i
+    while j < n and src[j] != "`":
+        if src[j] == "\\":
+            j += 2
+        elif src.startswith("${", j):
+            out.append(src[start:j + 2])
+            j = _js(src, j + 2, out, nested=True)
+            start = j
+        else:
+            j += 1
+    out.append(src[start:j + 1])
+    return j + 1
+
+
+_TAG = re.compile(r"<!--.*?-->|<(?:[^>\"']|\"[^\"]*\"|'[^']*')*>", re.S)
+_RAW = re.compile(r"<(script|style|pre|textarea)\b", re.I)
+
+
+def minify_html(html):
+    """Drop comments and collapse whitespace in text; tags and raw-text
+    elements (``script``, ``style``, ``pre``, ``textarea``) are untouched."""
+    out = []
+    pos = 0
+    while (m := _TAG.search(html, pos)) is not None:
+        out.append(re.sub(r"\s+", " ", html[pos:m.start()]))
+        tag = m.group(0)
+        pos = m.end()
+        if tag.startswith("<!--"):
+            if tag.startswith("<!--[if"):
+                out.append(tag)
+            continue
+        out.append(tag)
+        raw = _RAW.match(tag)
+        if raw:
+            end = re.compile(rf"</{raw.group(1)}\s*>", re.I).search(html, pos)
+            stop = end.start() if end else len(html)
+            out.append(html[pos:stop])
+            pos = stop
+    out.append(re.sub(r"\s+", " ", html[pos:]))
+    return "".join(out).strip() + "\n"
+
+
+# ============================================================================
+# BUILD
+# ============================================================================
+_STYLE = re.compile(r"<style([^>]*)>(.*?)</style>", re.S | re.I)
+_SCRIPT = re.compile(r"<script([^>]*)>(.*?)</script>", re.S | re.I)
+_JS_TYPES = {"", "text/javascript", "application/javascript", "module"}
+_LOCAL_REF = re.compile(r'\b(href|src)="([^"#?:]+)"')
+
+
+def _attr(attrs, name):
+    m = re.search(rf'\b{name}\s*=\s*"([^"]*)"', attrs, re.I)
+    return m.group(1) if m else None
+
+
+class Site:
+    """One build into ``out``; tracks every file written for the report."""
+
+    def __init__(self, out=OUT_DIR):
+        self.out = Path(out)
+        self.assets = {}       # asset path -> minified bytes
+        self.copied = set()
+
+    def asset(self, ext, text):
+        """Site-relative path of the asset holding ``text``, written on first use.
+
+        Named by content alone, so a block shared by several pages is one file.
+        """
+        data = text.encode()
+        path = f"{ASSET_DIR}/{_hash(data)}.{ext}"
+        if path not in self.assets:
+            self.assets[path] = data
+            self._write(path, data)
+        return path
+
+    def _write(self, rel, data):
+        path = self.out / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        if path.suffix in COMPRESSIBLE:
+            _precompress(path, data)
+
+    def _local(self, page, ref):
+        """Source file a page-relative or root-absolute reference points at."""
+        base = ROOT if ref.startswith("/") else (ROOT / page).parent
+        path = (base / ref.lstrip("/")).resolve()
+        return path if path.is_file() and ROOT in path.parents else None
+
+    def page(self, page):
+        source = (ROOT / page).read_text(encoding="utf-8")
+        # Page-relative references, so the site works under a subpath or from file://
+        up = "../" * len(Path(page).parent.parts)
+        used = []
+        linked = []            # stylesheets the source already loaded externally
+
+        def style(m):
+            media = _attr(m.group(1), "media")
+            path = self.asset("css", minify_css(m.group(2)))
+            used.append(path)
+            extra = f' media="{media}"' if media else ""
+            return f'<link rel="stylesheet" href="{up + path}"{extra}>'
+
+        def script(m):
+            attrs, body = m.group(1), m.group(2)
+            kind = (_attr(attrs, "type") or "").lower()
+            if _attr(attrs, "src") is not None or kind not in _JS_TYPES or not body.strip():
+                return m.group(0)
+            path = self.asset("js", minify_js(body))
+            used.append(path)
+            return f'<script{attrs} src="{up + path}"></script>'
+
+        html = _SCRIPT.sub(script, _STYLE.sub(style, source))
+
+        def local(m):
+            attr, ref = m.groups()
+            path = self._local(page, ref)
+            if path is None or path.suffix == ".html":
+                return m.group(0)
+            if path.suffix == ".css":
+                linked.append(path.read_bytes())
+                rel = self.asset("css", minify_css(path.read_text(encoding="utf-8")))
+                used.append(rel)
+                return f'{attr}="{up + rel}"'
+            self.copy(path)
+            return m.group(0)
+
+        html = _LOCAL_REF.sub(local, html)
+        for srcset in re.findall(r'srcset="([^"]+)"', html):
+            for ref in re.findall(r"([^\s,]+)\s+\d+[wx]", srcset):
+                path = self._local(page, ref)
+                if path is not None:
+                    self.copy(path)
+
+        data = minify_html(html).encode()
+        self._write(page, data)
+        return [source.encode(), *linked], data, used
+
+    def copy(self, path):
+        rel = path.relative_to(ROOT).as_posix()
+        if rel not in self.copied:
+            self.copied.add(rel)
+            self._write(rel, path.read_bytes())
+
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def _precompress(path, data):
+    gz = gzip.compress(data, GZIP_LEVEL, mtime=0)
+    if len(gz) < len(data):
+        path.with_name(path.name + ".gz").write_bytes(gz)
+    brotli = _brotli()
+    if brotli is not None:
+        br = brotli.compress(data, quality=BROTLI_QUALITY)
+        if len(br) < len(data):
+            path.with_name(path.name + ".br").write_bytes(br)
+
+
+def _sizes(data):
+    brotli = _brotli()
+    return {
+        "raw": len(data),
+        "gz": len(gzip.compress(data, GZIP_LEVEL, mtime=0)),
+        "br": len(brotli.compress(data, quality=BROTLI_QUALITY)) if brotli else None,
+    }
+
+
+def _total(sizes):
+    return {k: None if any(s[k] is None for s in sizes) else sum(s[k] for s in sizes)
+            for k in ("raw", "gz", "br")}
+
+
+def build(pages=PAGES, out=OUT_DIR, extra=EXTRA_FILES):
+    """Build ``pages`` into ``out`` (replacing it).
+
+    Returns ``{page: {"before": sizes, "html": sizes, "assets": sizes,
+    "files": [asset paths]}}`` where sizes are raw / gzip / brotli bytes.
+    "before" is the source page (CSS and JS inline) plus any stylesheet it
+    already linked; "assets" sums the page's external files, each
+    compressed on its own.
+    """
+    out = Path(out).resolve()
+    if out == ROOT or out in ROOT.parents:
+        raise ValueError(f"refusing to replace {out}: build into a dedicated directory")
+    if out.exists():
+        shutil.rmtree(out)
+    site = Site(out)
+    report = {}
+    for page in pages:
+        before, html, used = site.page(page)
+        files = list(dict.fromkeys(used))
+        report[page] = {
+            "before": _total([_sizes(b) for b in before]),
+            "html":   _sizes(html),
+            "assets": _total([_sizes(site.assets[f]) for f in files]),
+            "files":  files,
+        }
+    for name in extra:
+        if (ROOT / name).is_file():
+            site.copy(ROOT / name)
+    return report
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+def _kb(n):
+    return "     -" if n is None else f"{n / 1024:6.1f}"
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Minify, hash and precompress the static site into dist/.")
+    ap.add_argument("--out", type=Path, default=OUT_DIR)
+    args = ap.parse_args(argv)
+
+    report = build(out=args.out)
+    enc = "br" if _brotli() else "gz"
+    if enc == "gz":
+        print("brotli not installed: writing .gz only (pip install brotli for .br)")
+    print(f"{'page':<30} {'source':>6} {'src gz':>6} │ {'html':>6} {'+assets':>7} │ "
+          f"{'first ' + enc:>8} {'repeat ' + enc:>9}  (KB)")
+    totals = [0, 0, 0, 0]
+    for page, r in report.items():
+        first = r["html"][enc] + r["assets"][enc]
+        repeat = r["html"][enc]
+        print(f"{page:<30} {_kb(r['before']['raw'])} {_kb(r['before']['gz'])} │ "
+              f"{_kb(r['html']['raw'])} {_kb(r['assets']['raw']):>7} │ {_kb(first):>8} {_kb(repeat):>9}")
+        for i, v in enumerate((r["before"]["raw"], r["before"]["gz"], first, repeat)):
+            totals[i] += v
+    print(f"{'total':<30} {_kb(totals[0])} {_kb(totals[1])} │ {'':>6} {'':>7} │ "
+          f"{_kb(totals[2]):>8} {_kb(totals[3]):>9}")
+    shared = sum(1 for p in {f for r in report.values() for f in r["files"]}
+                 if sum(p in r["files"] for r in report.values()) > 1)
+    print(f"{len({f for r in report.values() for f in r['files']})} assets ({shared} shared) → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
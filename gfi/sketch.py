@@ -0,0 +1,112 @@
+"""
+KLL quantile sketch (Karnin, Lang & Liberty, 2016).
+
+Keeps O(k · log(n/k)) values however many are added, answers rank and
+quantile queries with bounded error (~1.7/k for k=200 at high
+probability) and merges losslessly with other sketches, so per-cell
+sketches can be combined into coarser peer groups on demand.
+"""
+import math
+import random
+
+import numpy as np
+
+DEFAULT_K = 200
+_C = 2 / 3
+
+
+class KLLSketch:
+
+    def __init__(self, k=DEFAULT_K, seed=None):
+        self.k = k
+        self.n = 0
+        self.compactors = [[]]
+        self._size = 0
+        self._max_size = self._capacity(0)
+        self._rng = random.Random(seed)
+        self._summary = None
+
+    # ── sizing ──
+    def _capacity(self, height):
+        depth = len(self.compactors) - height - 1
+        return int(math.ceil(self.k * _C ** depth)) + 1
+
+    def _grow(self):
+        self.compactors.append([])
+        self._max_size = sum(self._capacity(h) for h in range(len(self.compactors)))
+
+    def _compress(self):
+        for h, items in enumerate(self.compactors):
+            if len(items) >= self._capacity(h):
+                if h + 1 >= len(self.compactors):
+                    self._grow()
+                items.sort()
+                offset = self._rng.random() < 0.5
+                self.compactors[h + 1].extend(items[offset::2])
+                self.compactors[h] = []
+                self._size = sum(len(c) for c in self.compactors)
+                if self._size < self._max_size:
+                    break
+
+    # ── updates ──
+    def update(self, value):
+        self.compactors[0].append(float(value))
+        self.n += 1
+        self._size += 1
+        self._summary = None
+        if self._size >= self._max_size:
+            self._compress()
+
+    def merge(self, other):
+        """Fold ``other`` into this sketch in place and return ``self``."""
+        while len(self.compactors) < len(other.compactors):
+            self._grow()
+        for h, items in enumerate(other.compactors):
+            self.compactors[h].extend(items)
+        self.n += other.n
+        self._size = sum(len(c) for c in self.compactors)
+        self._summary = None
+        while self._size >= self._max_size:
+            self._compress()
+        return self
+
+    # ── queries ──
+    def _sorted(self):
+        """Sorted retained values with cumulative weights; cached until the next update."""
+        if self._summary is None:
+            values = np.fromiter((v for c in self.compactors for v in c), dtype=float, count=self._size)
+            weights = np.concatenate([np.full(len(c), 2 ** h, dtype=float) for h, c in enumerate(self.compactors)])
+            order = np.argsort(values, kind="stable")
+            self._summary = values[order], np.cumsum(weights[order])
+        return self._summary
+
+    def cdf(self, value):
+        """Approximate fraction of added values ``<= value``."""
+        if not self.n:
+            return float("nan")
+        values, cum = self._sorted()
+        i = np.searchsorted(values, value, side="right")
+        return float(cum[i - 1] / cum[-1]) if i else 0.0
+
+    def quantile(self, q):
+        if not self.n:
+            return float("nan")
+        values, cum = self._sorted()
+        i = np.searchsorted(cum, q * cum[-1], side="left")
+        return float(values[min(i, len(values) - 1)])
+
+    def __len__(self):
+        return self.n
+
+    # ── serialization ──
+    def to_dict(self):
+        return {"k": self.k, "n": self.n, "compactors": [list(c) for c in self.compactors]}
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(k=data["k"])
+        sketch.compactors = [list(c) for c in data["compactors"]]
+        sketch.n = data["n"]
+        sketch._size = sum(len(c) for c in sketch.compactors)
+        sketch._max_size = sum(sketch._capacity(h) for h in range(len(sketch.compactors)))
+        return sketch
@@ -0,0 +1,219 @@
+"""
+One static page per language for the trilingual pages.
+
+``about.html``, ``case.html``, ``enterprise.html`` and ``ghost-gdp.html``
+carry English, Traditional and Simplified Chinese in one document, each in
+a ``<div class="lb" data-lang="…">`` block, and ``setLang()`` toggles which
+block is shown. Every visitor downloaded and parsed all three. The
+trilingual documents now live in ``templates/`` as the source; this module
+cuts each into one page per language:
+
+    templates/about.html  →  about.html      (en, the existing URL)
+                              tw/about.html   (zh-Hant)
+                              cn/about.html   (zh-Hans)
+
+Each page keeps only its own block, gets ``<html lang>``, a canonical URL
+and ``hreflang`` alternates, and the language buttons become links to the
+sibling pages. Relative links are rebased for the ``tw/`` and ``cn/``
+directories, and links between split pages stay in the same language. Old
+``?lang=tw`` / ``?lang=cn`` URLs redirect from the English page.
+
+Script is cut the same way. Sections of a source's inline JS wrapped in
+``/* lang:<code> */ … /* /lang */`` (string tables, per-language handlers)
+are kept only on that language's page, and ``/* lang:switch */`` sections
+(``setLang()``, the ``?lang`` auto-detect) are dropped from every page —
+the switcher is plain links now.
+
+    python -m gfi.split      # write changed pages, print size / DOM report
+"""
+import argparse
+import gzip
+import re
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCE_DIR = ROOT / "templates"
+SITE_URL = "https://gfiintel.com"
+
+# Trilingual sources in templates/, written per language into the site root
+PAGES = ("about.html", "case.html", "enterprise.html", "ghost-gdp.html")
+
+# Language key (``data-lang``) → (html lang / hreflang, switcher label)
+LANGS = {
+    "en": ("en", "EN"),
+    "tw": ("zh-Hant", "繁"),
+    "cn": ("zh-Hans", "简"),
+}
+DEFAULT_LANG = "en"
+# Where each language's pages live, relative to the site root
+DIRS = {"en": "", "tw": "tw/", "cn": "cn/"}
+
+_BLOCK = re.compile(r'<div class="lb(?: on)?" data-lang="(\w+)">')
+_DIV = re.compile(r"<div\b|</div>")
+_TRAILING_COMMENT = re.compile(r"[ \t]*<!--[^>]*?-->")
+_BUTTON = re.compile(r'<button class="lb-btn[^"]*"\s+onclick="setLang\(\'(\w+)\',this\)[^"]*">([^<]*)</button>')
+_HEAD_LINKS = re.compile(r'[ \t]*<link rel="(?:alternate|canonical)"[^>]*>\n?')
+_URL_ATTR = re.compile(r'(?<![\w-])(href|src|srcset|onerror)="([^"]*)"')
+_ONERROR_URL = re.compile(r"(\.src=')([^']*)(')")
+_SCRIPT_SECTION = re.compile(r"/\* lang:(\w+) \*/\n(.*?)/\* /lang \*/\n?", re.S)
+_EXTERNAL = re.compile(r"^(?:[a-z][a-z0-9+.-]*:|/|#)", re.I)
+
+
+def path(page, lang):
+    """Site-relative URL of ``page`` in ``lang``."""
+    return DIRS[lang] + page
+
+
+def _up(lang):
+    return "../" * DIRS[lang].count("/")
+
+
+def _blocks(text):
+    """``[(lang, start, end)]`` of every language block, ``end`` past ``</div>``."""
+    blocks = []
+    for m in _BLOCK.finditer(text):
+        depth = 0
+        for d in _DIV.finditer(text, m.start()):
+            depth += 1 if d.group() == "<div" else -1
+            if depth == 0:
+                end = d.end()
+                note = _TRAILING_COMMENT.match(text, end)
+                if note and m.group(1) in note.group().lower():
+                    end = note.end()
+                blocks.append((m.group(1), m.start(), end))
+                break
+        else:
+            raise ValueError(f"unclosed language block {m.group()!r}")
+    return blocks
+
+
+def _rebase(ref, lang):
+    """A link from ``templates/<page>`` as seen from ``<lang dir>/<page>``."""
+    if not ref or _EXTERNAL.match(ref):
+        return ref
+    target, rest = re.match(r"([^?#]*)(.*)", ref, re.S).groups()
+    # Split pages have a sibling in the same directory; anything else is up
+    return (target if target in PAGES else _up(lang) + target) + rest
+
+
+def _relink(text, lang):
+    if not DIRS[lang]:
+        return text
+
+    def sub(m):
+        attr, value = m.groups()
+        if attr == "onerror":
+            value = _ONERROR_URL.sub(lambda u: u.group(1) + _rebase(u.group(2), lang) + u.group(3), value)
+        elif attr == "srcset":
+            value = ", ".join(" ".join([_rebase(url, lang), *size])
+                              for url, *size in (part.split() for part in value.split(",")))
+        else:
+            value = _rebase(value, lang)
+        return f'{attr}="{value}"'
+
+    return _URL_ATTR.sub(sub, text)
+
+
+def _scripts(text, lang):
+    """Keep ``lang``'s marked script sections (unmarked) and drop every other one."""
+    return _SCRIPT_SECTION.sub(lambda m: m.group(2) if m.group(1) == lang else "", text)
+
+
+def _switcher(page, lang):
+    def sub(m):
+        code, label = m.groups()
+        if code not in LANGS:
+            return m.group()
+        tag = LANGS[code][0]
+        return (f'<a class="lb-btn{" on" if code == lang else ""}" href="{_up(lang)}{path(page, code)}" '
+                f'hreflang="{tag}" lang="{tag}">{label}</a>')
+    return sub
+
+
+def _head(page, lang):
+    links = [f'<link rel="canonical" href="{SITE_URL}/{path(page, lang)}">']
+    links += [f'<link rel="alternate" hreflang="{tag}" href="{SITE_URL}/{path(page, code)}">'
+              for code, (tag, _) in LANGS.items()]
+    links.append(f'<link rel="alternate" hreflang="x-default" href="{SITE_URL}/{path(page, DEFAULT_LANG)}">')
+    if lang == DEFAULT_LANG:
+        # Before the split, languages were addressed as ?lang=tw on this URL
+        targets = ",".join(f"{code}:'{path(page, code)}'" for code in LANGS if code != lang)
+        links.append(f"<script>(function(){{var u={{{targets}}}[new URLSearchParams(location.search)"
+                     f".get('lang')];if(u)location.replace(u)}})()</script>")
+    return "\n".join(links) + "\n"
+
+
+def split(text, page):
+    """``{lang: html}`` for one trilingual document."""
+    blocks = _blocks(text)
+    langs = [lang for lang, _, _ in blocks]
+    if set(langs) != set(LANGS):
+        raise ValueError(f"{page}: language blocks {langs}, expected {list(LANGS)}")
+    head = _HEAD_LINKS.sub("", text)
+    if head != text:
+        blocks = _blocks(head)
+    out = {}
+    for lang in LANGS:
+        parts, pos = [], 0
+        for code, start, end in blocks:
+            parts.append(head[pos:start])
+            if code == lang:
+                parts.append(_BLOCK.sub(f'<div class="lb on" data-lang="{lang}">', head[start:end], count=1))
+            pos = end
+        parts.append(head[pos:])
+        doc = "".join(parts)
+        doc = re.sub(r'<html lang="[^"]*">', f'<html lang="{LANGS[lang][0]}">', doc, count=1)
+        doc = doc.replace("</title>\n", "</title>\n" + _head(page, lang), 1)
+        doc = _BUTTON.sub(_switcher(page, lang), _relink(_scripts(doc, lang), lang))
+        # Collapse the blank lines left where the other languages were
+        doc = re.sub(r"\n{3,}", "\n\n", doc)
+        out[lang] = doc
+    return out
+
+
+def build(pages=PAGES, source_dir=SOURCE_DIR, out=ROOT):
+    """Write every language of ``pages`` into ``out``; unchanged files are left alone.
+
+    Returns ``{page: {"source": text, lang: (path, text, written)}}``.
+    """
+    report = {}
+    for page in pages:
+        text = (Path(source_dir) / page).read_text(encoding="utf-8")
+        report[page] = {"source": text}
+        for lang, doc in split(text, page).items():
+            target = Path(out) / path(page, lang)
+            written = not target.is_file() or target.read_text(encoding="utf-8") != doc
+            if written:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_text(doc, encoding="utf-8")
+            report[page][lang] = (path(page, lang), doc, written)
+    return report
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+def _sizes(text):
+    data = text.encode("utf-8")
+    # Element count as a stand-in for DOM size
+    return len(data), len(gzip.compress(data, 9, mtime=0)), len(re.findall(r"<[a-zA-Z]", text))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Split the trilingual pages into one page per language.")
+    ap.parse_args(argv)
+
+    report = build()
+    print(f"{'page':<22} {'KB':>6} {'gz KB':>6} {'elems':>6}")
+    for page, r in report.items():
+        raw, gz, elems = _sizes(r["source"])
+        print(f"{'templates/' + page:<22} {raw / 1024:6.1f} {gz / 1024:6.1f} {elems:>6}")
+        for lang in LANGS:
+            rel, doc, written = r[lang]
+            raw_l, gz_l, elems_l = _sizes(doc)
+            print(f"  {rel:<20} {raw_l / 1024:6.1f} {gz_l / 1024:6.1f} {elems_l:>6}  "
+                  f"{1 - raw_l / raw:4.0%} smaller{'' if written else '  (unchanged)'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+"""
+Durable local spool for assessments and leads.
+
+The write-behind queue (``gfi.writebehind``) kept rows in memory: a
+restart, a crash, or an outage longer than its retries lost them. Every
+row is now appended here first — one SQLite file in WAL mode, committed
+before ``submit()`` returns — and removed only once the remote store has
+it:
+
+    append   durable on return (``synchronous=FULL``: survives a power
+             cut, not just a process crash); rows sharing one commit are
+             grouped so concurrent sessions don't each pay an fsync
+    pending  oldest-first batches of what the store has not confirmed
+    ack      delete rows the store confirmed
+    replay   drain ``pending`` into a repository; the store ignores ids it
+             already holds, so a row sent twice (a crash between write and
+             ack) is stored once
+    dead     a row the store keeps refusing (a constraint, a missing
+             column, a row-level-security denial — not an outage) is moved
+             to the ``dead`` table after ``max_attempts`` replays, so it
+             cannot hold up the rows behind it; ``requeue`` puts dead rows
+             back once the cause is fixed
+    compact  checkpoint the WAL back into the database and return the
+             space of acknowledged rows to the file system
+
+    python -m gfi.spool stats
+    python -m gfi.spool replay            # drain into repository.default()
+    python -m gfi.spool dead              # rows the store refused
+    python -m gfi.spool requeue           # retry them after fixing the cause
+    python -m gfi.spool compact
+    python -m gfi.spool bench --sessions 8   # append throughput, concurrent sessions
+"""
+import argparse
+import json
+import logging
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from gfi import repository, timing
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_PATH = ROOT / "data" / "local" / "spool.sqlite3"
+
+REPLAY_BATCH = 500
+MAX_ATTEMPTS = 3        # replays a row the store refuses gets before it is set aside
+
+log = logging.getLogger("gfi.spool")
+
+_SCHEMA = """
+create table if not exists spool (
+  seq      integer primary key autoincrement,
+  tbl      text not null,
+  id       text not null,
+  body     text not null,
+  created  real not null,
+  attempts integer not null default 0
+);
+create table if not exists dead (
+  seq      integer primary key,
+  tbl      text not null,
+  id       text not null,
+  body     text not null,
+  created  real not null,
+  attempts integer not null,
+  error    text,
+  failed   real not null
+);
+"""
+
+
+class Spool:
+    """Append-only row log in one SQLite file; safe across threads and processes."""
+
+    def __init__(self, path=DEFAULT_PATH, synchronous="full", max_attempts=MAX_ATTEMPTS, timings=None):
+        self.path = Path(path)
+        self.max_attempts = max_attempts
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.timings = timing.Timings(kind="spool") if timings is None else timings
+        # isolation_level=None: transactions are explicit below
+        self._conn = sqlite3.connect(self.path, timeout=repository.TIMEOUT, check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.execute("pragma auto_vacuum=incremental")   # only takes effect on a new file
+        self._conn.execute("pragma journal_mode=wal")
+        self._conn.execute(f"pragma synchronous={synchronous}")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        # Group commit: appends that arrive while a commit is running share the next one
+        self._cond = threading.Condition()
+        self._waiting = []
+        self._committing = False
+        self._commits = 0
+
+    # ---------------------------------------------------------------- append
+    def append(self, table, row):
+        """Store ``row`` for ``table`` durably; returns its sequence number."""
+        if table not in repository.TABLES:
+            raise ValueError(f"unknown table {table!r}")
+        t0 = timing.start()
+        entry = [table, row["id"], json.dumps(row, ensure_ascii=False), time.time(), None, None]
+        with self._cond:
+            self._waiting.append(entry)
+            while entry[4] is None and self._committing:
+                self._cond.wait()
+            if entry[4] is None:
+                # Leader: commit everything queued so far, including ours
+                group, self._waiting = self._waiting, []
+                self._committing = True
+                self._cond.release()
+                try:
+                    self._commit(group)
+                finally:
+                    self._cond.acquire()
+                    self._committing = False
+                    self._cond.notify_all()
+        self.timings.record("append", timing.elapsed(t0))
+        if entry[5] is not None:
+            raise entry[5]
+        return entry[4]
+
+    def _commit(self, group):
+        try:
+            with self._lock:
+                self._conn.execute("begin immediate")
+                try:
+                    seqs = [self._conn.execute(
+                        "insert into spool (tbl, id, body, created) values (?, ?, ?, ?)", e[:4]).lastrowid
+                        for e in group]
+                    self._conn.execute("commit")
+                except BaseException:
+                    self._conn.execute("rollback")
+                    raise
+                self._commits += 1
+            for e, seq in zip(group, seqs):
+                e[4] = seq
+        except Exception as exc:
+            for e in group:
+                e[4], e[5] = 0, exc
+
+    # ---------------------------------------------------------------- drain
+    def pending(self, limit=REPLAY_BATCH, after=0):
+        """Up to ``limit`` unacknowledged ``(seq, table, row)``, oldest first."""
+        with self._lock:
+            cur = self._conn.execute(
+                "select seq, tbl, body from spool where seq > ? order by seq limit ?", (after, limit))
+            return [(seq, tbl, json.loads(body)) for seq, tbl, body in cur]
+
+    def ack(self, seqs):
+        """Forget rows the store has confirmed."""
+        seqs = list(seqs)
+        with self._lock:
+            self._conn.executemany("delete from spool where seq = ?", [(s,) for s in seqs])
+
+    def failed(self, seqs, error=None):
+        """Count one more refused delivery against each row.
+
+        Rows that reach ``max_attempts`` move to the ``dead`` table; returns
+        how many did.
+        """
+        params = [(s,) for s in seqs]
+        with self._lock:
+            self._conn.execute("begin immediate")
+            try:
+                self._conn.executemany("update spool set attempts = attempts + 1 where seq = ?", params)
+                moved = self._conn.execute(
+                    f"select id, tbl from spool where attempts >= ? and seq in ({','.join('?' * len(params))})",
+                    (self.max_attempts, *seqs)).fetchall() if params else []
+                self._conn.execute(
+                    "insert or replace into dead select seq, tbl, id, body, created, attempts, ?, ? "
+                    "from spool where attempts >= ?", (error, time.time(), self.max_attempts))
+                self._conn.execute("delete from spool where attempts >= ?", (self.max_attempts,))
+                self._conn.execute("commit")
+            except BaseException:
+                self._conn.execute("rollback")
+                raise
+        for row_id, table in moved:
+            log.error("%s row %s refused %d times, moved to the dead-letter table: %s",
+                      table, row_id, self.max_attempts, error)
+        return len(moved)
+
+    def replay(self, repo, batch=REPLAY_BATCH):
+        """Send every pending row to ``repo``, oldest first, acking as it goes.
+
+        A batch the store refuses outright (``RepositoryError.permanent``)
+        is retried row by row: the good rows are delivered and each refused
+        one is charged an attempt (see ``failed``). Any other failure — the
+        store is unreachable — stops the replay and is re-raised; nothing
+        is charged, so an outage never dead-letters a good row. Returns the
+        number of rows delivered.
+        """
+        delivered, after = 0, 0
+        while True:
+            rows = self.pending(batch, after)
+            if not rows:
+                return delivered
+            by_table = {}
+            for seq, table, row in rows:
+                by_table.setdefault(table, []).append((seq, row))
+            for table, items in by_table.items():
+                try:
+                    repo.write(table, [row for _, row in items])
+                except repository.RepositoryError as e:
+                    if not e.permanent:
+                        raise
+                    delivered += self._isolate(repo, table, items)
+                    continue
+                self.ack(seq for seq, _ in items)
+                delivered += len(items)
+            after = rows[-1][0]
+
+    def _isolate(self, repo, table, items):
+        delivered = 0
+        for seq, row in items:
+            try:
+                repo.write(table, [row])
+            except repository.RepositoryError as e:
+                if not e.permanent:
+                    raise
+                self.failed([seq], str(e))
+                continue
+            self.ack([seq])
+            delivered += 1
+        return delivered
+
+    def dead(self, limit=100):
+        """Dead-lettered rows, newest first: ``(seq, table, id, attempts, error)``."""
+        with self._lock:
+            return self._conn.execute(
+                "select seq, tbl, id, attempts, error from dead order by failed desc limit ?", (limit,)).fetchall()
+
+    def requeue(self):
+        """Move every dead-lettered row back to the spool with a clean slate; returns the count."""
+        with self._lock:
+            self._conn.execute("begin immediate")
+            try:
+                n = self._conn.execute(
+                    "insert into spool (seq, tbl, id, body, created) "
+                    "select seq, tbl, id, body, created from dead").rowcount
+                self._conn.execute("delete from dead")
+                self._conn.execute("commit")
+            except BaseException:
+                self._conn.execute("rollback")
+                raise
+        return n
+
+    # ---------------------------------------------------------------- upkeep
+    def compact(self):
+        """Fold the WAL into the database and release freed pages; returns bytes reclaimed."""
+        before = self.size()
+        with self._lock:
+            # executescript steps the pragma to completion; execute() frees one page
+            self._conn.executescript("pragma incremental_vacuum;")
+            self._conn.execute("pragma wal_checkpoint(truncate)")
+        return before - self.size()
+
+    def size(self):
+        """Bytes on disk, database plus WAL."""
+        return sum(p.stat().st_size for p in (self.path, Path(f"{self.path}-wal")) if p.exists())
+
+    def stats(self):
+        with self._lock:
+            n, oldest, retried = self._conn.execute(
+                "select count(*), min(created), count(nullif(attempts, 0)) from spool").fetchone()
+            dead = self._conn.execute("select count(*) from dead").fetchone()[0]
+            commits = self._commits
+        return {"pending": n, "oldest_s": 0.0 if oldest is None else time.time() - oldest,
+                "retried": retried, "dead": dead, "commits": commits, "bytes": self.size()}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+def _bench(path, n, sessions, synchronous):
+    spool = Spool(path, synchronous=synchronous, timings=timing.Timings(kind="spool"))
+    rows = [repository.assessment({"employees": 100}, {"total_leak": float(i), "risk_score": 50.0},
+                                  locale="en", company="bench") for i in range(n)]
+
+    def session(k):
+        for i in range(k, n, sessions):
+            spool.append("assessments", rows[i])
+
+    threads = [threading.Thread(target=session, args=(k,)) for k in range(sessions)]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - t0
+    s = spool.stats()
+    assert s["pending"] == n
+    summary = spool.timings.summary()["append"]
+    spool.close()
+    return elapsed, s["commits"], summary
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m gfi.spool", description="Durable local spool for writes.")
+    ap.add_argument("--path", type=Path, default=DEFAULT_PATH)
+    sub = ap.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="pending rows, oldest age, size")
+    r = sub.add_parser("replay", help="drain pending rows into the configured repository")
+    r.add_argument("--url", help="sqlite:///… or postgresql://… (default: from the environment)")
+    sub.add_parser("compact", help="checkpoint the WAL and release freed space")
+    sub.add_parser("dead", help="rows the store refused, newest first")
+    sub.add_parser("requeue", help="move dead-lettered rows back to the spool")
+    b = sub.add_parser("bench", help="append throughput with concurrent sessions (temporary file)")
+    b.add_argument("-n", type=int, default=5000)
+    b.add_argument("--sessions", type=int, nargs="+", default=[1, 4, 16])
+    b.add_argument("--synchronous", choices=("full", "normal"), nargs="+", default=["full", "normal"])
+    args = ap.parse_args(argv)
+
+    if args.command == "bench":
+        print(f"{'sync':<7} {'sessions':>8} {'rows/s':>9} {'commits':>8} {'p50 ms':>7} {'p95 ms':>7}")
+        for synchronous in args.synchronous:
+            for sessions in args.sessions:
+                with tempfile.TemporaryDirectory() as tmp:
+                    elapsed, commits, s = _bench(Path(tmp) / "spool.sqlite3", args.n, sessions, synchronous)
+                print(f"{synchronous:<7} {sessions:>8} {args.n / elapsed:>9,.0f} {commits:>8,} "
+                      f"{s['p50']:>7.2f} {s['p95']:>7.2f}")
+        print("(p50 / p95 over the last appends of each run)")
+        return
+
+    spool = Spool(args.path)
+    if args.command == "replay":
+        repo = repository.connect(args.url)
+        n = spool.replay(repo)
+        print(f"{n:,} rows delivered to {repo.name}")
+        repo.close()
+    elif args.command == "compact":
+        print(f"{spool.compact():,} bytes reclaimed")
+    elif args.command == "dead":
+        for seq, table, row_id, attempts, error in spool.dead():
+            print(f"{seq:>8} {table:<12} {row_id}  x{attempts}  {error}")
+    elif args.command == "requeue":
+        print(f"{spool.requeue():,} rows requeued")
+    s = spool.stats()
+    print(f"{s['pending']:,} pending (oldest {s['oldest_s']:.0f}s, {s['retried']:,} retried), "
+          f"{s['dead']:,} dead, {s['bytes'] / 1024:,.1f} KB")
+    spool.close()
+
+
+if __name__ == "__main__":
+    main()
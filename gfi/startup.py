@@ -0,0 +1,117 @@
+"""
+Cold-start budget for the Streamlit entry points.
+
+Every measurement runs in a fresh interpreter so nothing is warm:
+
+    python -m gfi.startup profile app.py          # per-module import time
+    python -m gfi.startup bench                   # time-to-first-render, all apps
+
+``profile`` runs the app's first render under ``python -X importtime`` and
+lists the modules the app itself pulled in (anything Streamlit's own
+bootstrap already imports is excluded), slowest first. ``bench`` reports
+the median wall time of the first complete script run per entry point,
+split into interpreter + Streamlit import and the app's own first render.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+ENTRY_POINTS = ("app.py", "app_es.py", "app_chinese.py", "app_back.py")
+RUNS = 5
+# Streamlit's own import, shared by every entry point
+BASELINE = "import streamlit; from streamlit.testing.v1 import AppTest"
+
+_FIRST_RENDER = """
+import json, sys, time
+t0 = time.perf_counter()
+{baseline}
+t1 = time.perf_counter()
+at = AppTest.from_file({path!r}, default_timeout=120).run()
+t2 = time.perf_counter()
+print(json.dumps({{"import_ms": (t1 - t0) * 1e3, "render_ms": (t2 - t1) * 1e3,
+                  "errors": [e.value for e in at.exception]}}))
+"""
+
+
+def _python(code, *flags):
+    return subprocess.run([sys.executable, *flags, "-c", code], cwd=ROOT,
+                          capture_output=True, text=True, check=True)
+
+
+def first_render(app):
+    """One cold first render of ``app``: ``{"import_ms", "render_ms", "errors"}``."""
+    code = _FIRST_RENDER.format(baseline=BASELINE, path=str(ROOT / app))
+    return json.loads(_python(code).stdout.strip().splitlines()[-1])
+
+
+def bench(apps=ENTRY_POINTS, runs=RUNS):
+    """Median cold-start timings per entry point over ``runs`` fresh processes."""
+    report = {}
+    for app in apps:
+        samples = [first_render(app) for _ in range(runs)]
+        report[app] = {
+            "import_ms": statistics.median(s["import_ms"] for s in samples),
+            "render_ms": statistics.median(s["render_ms"] for s in samples),
+            "errors": samples[-1]["errors"],
+        }
+    return report
+
+
+def _importtime(code):
+    """``{module: (self_us, cumulative_us)}`` from ``-X importtime`` stderr."""
+    times = {}
+    for line in _python(code, "-X", "importtime").stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|")
+        if self_us.strip().isdigit():
+            times[name.strip()] = (int(self_us), int(cum_us))
+    return times
+
+
+def profile(app):
+    """Modules imported by ``app``'s first render, beyond Streamlit's baseline.
+
+    Returns ``[(module, self_ms, cumulative_ms)]`` sorted by self time.
+    """
+    baseline = _importtime(BASELINE)
+    full = _importtime(_FIRST_RENDER.format(baseline=BASELINE, path=str(ROOT / app)))
+    rows = [(name, s / 1e3, c / 1e3) for name, (s, c) in full.items() if name not in baseline]
+    return sorted(rows, key=lambda r: -r[1])
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Import-time profile and time-to-first-render benchmark.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("profile", help="per-module import time for one entry point")
+    p.add_argument("app", nargs="?", default="app.py")
+    p.add_argument("--top", type=int, default=25)
+    b = sub.add_parser("bench", help="cold time-to-first-render per entry point")
+    b.add_argument("apps", nargs="*", default=list(ENTRY_POINTS))
+    b.add_argument("--runs", type=int, default=RUNS)
+    args = ap.parse_args(argv)
+
+    if args.cmd == "profile":
+        rows = profile(args.app)
+        total = sum(s for _, s, _ in rows)
+        print(f"{args.app}: {len(rows)} modules beyond Streamlit, {total:,.1f} ms self time")
+        print(f"{'module':<48} {'self ms':>8} {'cum ms':>8}")
+        for name, self_ms, cum_ms in rows[:args.top]:
+            print(f"{name:<48} {self_ms:>8.1f} {cum_ms:>8.1f}")
+    else:
+        print(f"{'entry point':<16} {'streamlit ms':>13} {'first render ms':>16}")
+        for app, r in bench(args.apps, args.runs).items():
+            note = f"  ERROR: {r['errors'][0][:60]}" if r["errors"] else ""
+            print(f"{app:<16} {r['import_ms']:>13.0f} {r['render_ms']:>16.0f}{note}")
+
+
+if __name__ == "__main__":
+    main()
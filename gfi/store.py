@@ -0,0 +1,394 @@
+"""
+Append-only time-series store for quarterly GL re-measurements.
+
+Layout under ``root``::
+
+    clients.jsonl         client ids, one per line; line number = client code
+    manifest.json         sealed segments
+    rollup-<col>.npy      latest row per (quarter, client), columnar
+    wal.jsonl             rows not yet sealed into a segment
+    seg-000001/<col>.npy  immutable columnar segment, one file per column
+    seg-000001/index.json client code → row numbers within the segment
+
+Rows land in the write-ahead log first and are sealed into a new columnar
+segment every ``segment_rows`` rows (or on ``flush()``). Every row carries
+a sequence number and the manifest records the last one sealed, so a
+crash at any point of a flush recovers on the next open: WAL rows already
+in a segment are skipped, and a segment directory the manifest does not
+list (written, but never committed) is discarded. Segments are
+memory-mapped on read, so a client trend touches only that client's rows.
+The index and rollups are updated on every write. "Latest quarter across
+all clients" and per-quarter aggregates therefore never scan segments.
+
+The calculator records every assessment that names a company in the
+process-wide store (``track()``, under ``data/local/tracking``), so a
+client re-measured next quarter sees the change against their last
+measurement.
+
+    python -m gfi.store data/local/tracking trend "Acme Corp"
+    python -m gfi.store data/local/tracking latest
+"""
+import argparse
+import atexit
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from gfi import gl as gl_engine
+from gfi import leak
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_ROOT = ROOT / "data" / "local" / "tracking"
+
+SEGMENT_ROWS = 4096
+
+log = logging.getLogger("gfi.store")
+
+METRICS = ("total_leak", "risk_score") + tuple(f"leak_{c}" for c in leak.CATEGORIES) + ("gl",)
+COLUMNS = {
+    "client": np.int32,
+    "ts": np.float64,
+    "quarter": np.int32,
+    **{name: np.float32 for name in leak.INPUTS},
+    **{name: np.float64 for name in METRICS},
+}
+
+
+def quarter_of(ts):
+    """Epoch seconds → ``YYYYQ`` integer, e.g. 20263 for 2026 Q3."""
+    d = datetime.fromtimestamp(ts, tz=timezone.utc)
+    return d.year * 10 + (d.month - 1) // 3 + 1
+
+
+def quarter_label(q):
+    return f"{q // 10}-Q{q % 10}"
+
+
+def _write_json(path, data):
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data))
+    os.replace(tmp, path)
+
+
+class TimeSeriesStore:
+
+    def __init__(self, root, segment_rows=SEGMENT_ROWS):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.segment_rows = segment_rows
+        self._lock = threading.RLock()
+        self._mmaps = {}
+
+        clients_path = self.root / "clients.jsonl"
+        self._clients = ([json.loads(line) for line in clients_path.read_text().splitlines() if line]
+                         if clients_path.exists() else [])
+        self._codes = {c: i for i, c in enumerate(self._clients)}
+        self._clients_log = open(clients_path, "a")
+
+        manifest_path = self.root / "manifest.json"
+        manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+        self._segments = manifest.get("segments", [])
+        self._sealed = manifest.get("sealed_seq", 0)
+        self._drop_uncommitted()
+        self._latest = {}
+        self._quarters = {}
+        self._load_rollups()
+
+        # client code → [[segment, row], …]; segment -1 = WAL buffer
+        self._index = {}
+        for seg_no, seg in enumerate(self._segments, start=1):
+            seg_index = json.loads((self.root / seg["name"] / "index.json").read_text())
+            for code, rows in seg_index.items():
+                self._index.setdefault(int(code), []).extend([seg_no, r] for r in rows)
+        self._pending = []
+
+        self._buffer = []
+        self._seq = self._sealed
+        wal = self.root / "wal.jsonl"
+        if wal.exists():
+            for line in wal.read_text().splitlines():
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                # Rows written before sequence numbers existed were never sealed
+                seq = row.setdefault("seq", self._seq + 1)
+                if seq <= self._sealed:
+                    # Sealed by a flush that stopped before truncating the WAL
+                    continue
+                self._seq = seq
+                self._apply(row)
+        self._wal = open(wal, "a")
+
+    def _drop_uncommitted(self):
+        """Remove segment directories a crashed flush left outside the manifest."""
+        listed = {seg["name"] for seg in self._segments}
+        for path in self.root.glob("seg-*"):
+            if path.is_dir() and path.name not in listed:
+                shutil.rmtree(path)
+
+    # ── writes ──
+    def record(self, client, inputs, gl=None, ts=None):
+        """Score ``inputs`` with the leak model and append one measurement.
+
+        ``gl`` is either a GL score or a mapping of GL inputs
+        (``fs``/``vn``/``pd``/``cf``/``srf``) to score.
+        """
+        return self.record_many([client], inputs, gl=gl, ts=None if ts is None else [ts])[0]
+
+    def record_many(self, clients, inputs, gl=None, ts=None):
+        """Append one measurement per entry of ``clients`` in a single scoring pass.
+
+        ``inputs`` (and ``gl``, if a mapping) hold scalars or arrays aligned
+        with ``clients``; ``ts`` defaults to now.
+        """
+        n = len(clients)
+        result = leak.score(**{k: inputs[k] for k in leak.INPUTS})
+        if isinstance(gl, dict):
+            gl = gl_engine.score(**gl).gl
+        columns = {
+            "ts": np.full(n, time.time()) if ts is None else np.asarray(ts, dtype=float),
+            **{k: np.asarray(inputs[k], dtype=float) for k in leak.INPUTS},
+            "total_leak": result.total,
+            "risk_score": result.risk,
+            **{f"leak_{c}": result.breakdown[..., i] for i, c in enumerate(leak.CATEGORIES)},
+            "gl": np.nan if gl is None else np.asarray(gl, dtype=float),
+        }
+        columns = {k: np.broadcast_to(v, (n,)).tolist() for k, v in columns.items()}
+        rows = [{k: v[i] for k, v in columns.items()} for i in range(n)]
+
+        with self._lock:
+            for client, row in zip(clients, rows):
+                self._seq += 1
+                row["seq"] = self._seq
+                row["client"] = self._code(client)
+                row["quarter"] = quarter_of(row["ts"])
+            self._wal.write("".join(json.dumps(row) + "\n" for row in rows))
+            self._wal.flush()
+            for row in rows:
+                self._apply(row)
+                if len(self._buffer) >= self.segment_rows:
+                    self.flush()
+        return rows
+
+    def _code(self, client):
+        if client not in self._codes:
+            self._codes[client] = len(self._clients)
+            self._clients.append(client)
+            self._clients_log.write(json.dumps(client) + "\n")
+            self._clients_log.flush()
+        return self._codes[client]
+
+    def _apply(self, row):
+        """Buffer a row and update the index and rollups incrementally."""
+        code = row["client"]
+        ref = [-1, len(self._buffer)]
+        self._index.setdefault(code, []).append(ref)
+        self._pending.append(ref)
+        self._buffer.append(row)
+        self._rollup(code, {"ts": row["ts"], **{m: row[m] for m in METRICS}}, row["quarter"])
+
+    def _rollup(self, code, summary, quarter):
+        if code not in self._latest or summary["ts"] >= self._latest[code]["ts"]:
+            self._latest[code] = summary
+        rows = self._quarters.setdefault(quarter, {})
+        if code not in rows or summary["ts"] >= rows[code]["ts"]:
+            rows[code] = summary
+
+    _ROLLUP_COLUMNS = ("quarter", "client", "ts") + METRICS
+
+    def _save_rollups(self):
+        entries = [(q, c, r) for q, rows in self._quarters.items() for c, r in rows.items()]
+        arrays = {
+            "quarter": np.array([q for q, _, _ in entries], dtype=np.int32),
+            "client": np.array([c for _, c, _ in entries], dtype=np.int32),
+            **{m: np.array([r[m] for _, _, r in entries], dtype=np.float64) for m in ("ts",) + METRICS},
+        }
+        for col, values in arrays.items():
+            tmp = self.root / f"rollup-{col}.tmp.npy"
+            np.save(tmp, values)
+            os.replace(tmp, self.root / f"rollup-{col}.npy")
+
+    def _load_rollups(self):
+        if not (self.root / "rollup-quarter.npy").exists():
+            return
+        cols = {col: np.load(self.root / f"rollup-{col}.npy").tolist() for col in self._ROLLUP_COLUMNS}
+        for i, (q, c) in enumerate(zip(cols["quarter"], cols["client"])):
+            self._rollup(c, {m: cols[m][i] for m in ("ts",) + METRICS}, q)
+
+    def flush(self):
+        """Seal buffered rows into a new columnar segment."""
+        with self._lock:
+            if not self._buffer:
+                return
+            seg_no = len(self._segments) + 1
+            name = f"seg-{seg_no:06d}"
+            tmp = self.root / (name + ".tmp")
+            tmp.mkdir(exist_ok=True)
+            for col, dtype in COLUMNS.items():
+                np.save(tmp / f"{col}.npy", np.array([r[col] for r in self._buffer], dtype=dtype))
+            seg_index = {}
+            for i, r in enumerate(self._buffer):
+                seg_index.setdefault(r["client"], []).append(i)
+            (tmp / "index.json").write_text(json.dumps(seg_index))
+            if (self.root / name).exists():
+                # Left by an earlier flush of this process that failed before committing
+                shutil.rmtree(self.root / name)
+            os.replace(tmp, self.root / name)
+
+            segments = self._segments + [{"name": name, "rows": len(self._buffer)}]
+            sealed = self._buffer[-1]["seq"]
+            self._save_rollups()
+            # The commit point: until the manifest lists it, the segment does not exist
+            _write_json(self.root / "manifest.json", {"segments": segments, "sealed_seq": sealed})
+            self._segments, self._sealed = segments, sealed
+            for ref in self._pending:
+                ref[0] = seg_no
+            self._pending = []
+            self._buffer = []
+            self._wal.close()
+            self._wal = open(self.root / "wal.jsonl", "w")
+
+    def close(self):
+        self.flush()
+        self._wal.close()
+        self._clients_log.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ── reads ──
+    def _column(self, seg_no, col):
+        key = (seg_no, col)
+        if key not in self._mmaps:
+            name = self._segments[seg_no - 1]["name"]
+            self._mmaps[key] = np.load(self.root / name / f"{col}.npy", mmap_mode="r")
+        return self._mmaps[key]
+
+    def clients(self):
+        return list(self._clients)
+
+    def trend(self, client, columns=("ts", "quarter") + METRICS):
+        """Every measurement for ``client`` as ``{column: array}``, oldest first."""
+        with self._lock:
+            refs = list(self._index.get(self._codes.get(client), []))
+            buffer = list(self._buffer)
+        out = {col: np.empty(len(refs), dtype=COLUMNS[col]) for col in columns}
+        by_segment = {}
+        for i, (seg, row) in enumerate(refs):
+            by_segment.setdefault(seg, []).append((i, row))
+        for seg, pairs in by_segment.items():
+            pos = np.array([p for p, _ in pairs])
+            rows = np.array([r for _, r in pairs])
+            for col in columns:
+                if seg == -1:
+                    out[col][pos] = [buffer[r][col] for r in rows]
+                else:
+                    out[col][pos] = self._column(seg, col)[rows]
+        order = np.argsort(out["ts"], kind="stable") if "ts" in out else slice(None)
+        return {col: values[order] for col, values in out.items()}
+
+    def latest(self, client):
+        """Most recent measurement summary for ``client`` (from the rollup)."""
+        code = self._codes.get(client)
+        return None if code is None else dict(self._latest[code])
+
+    def quarters(self):
+        return sorted(self._quarters)
+
+    def latest_quarter(self):
+        """``(quarter, {client: summary})`` for the most recent quarter on record."""
+        with self._lock:
+            if not self._quarters:
+                return None, {}
+            q = max(self._quarters)
+            return q, {self._clients[c]: dict(r) for c, r in self._quarters[q].items()}
+
+    def quarter_summary(self, quarter):
+        """Client count and mean / median of each metric over clients' latest rows."""
+        with self._lock:
+            rows = list(self._quarters.get(quarter, {}).values())
+        summary = {"quarter": quarter, "clients": len(rows)}
+        for m in METRICS:
+            values = np.array([r[m] for r in rows], dtype=float)
+            values = values[np.isfinite(values)]
+            summary[m] = {
+                "mean": float(values.mean()) if values.size else None,
+                "median": float(np.median(values)) if values.size else None,
+            }
+        return summary
+
+
+# ============================================================================
+# PROCESS-WIDE STORE
+# ============================================================================
+_default = None
+_default_lock = threading.Lock()
+
+
+def default(root=None):
+    """The process-wide store (``GFI_TRACKING_DIR`` or ``data/local/tracking``)."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = TimeSeriesStore(root or os.environ.get("GFI_TRACKING_DIR") or DEFAULT_ROOT)
+            atexit.register(_default.close)
+        return _default
+
+
+def track(client, inputs):
+    """Record one assessment for ``client``; a failure is logged, never raised.
+
+    Returns the recorded measurement (``ts``, ``total_leak``,
+    ``risk_score``, …), or ``None`` if it could not be stored. Nothing is
+    read back: ``client`` is whatever name the visitor typed, so its
+    history is for operators (``python -m gfi.store``), never for display.
+    """
+    try:
+        return default().record(client, inputs)
+    except Exception:
+        log.exception("could not record a measurement for %r", client)
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m gfi.store", description="Query a GL time-series store.")
+    parser.add_argument("root", help="store directory")
+    sub = parser.add_subparsers(dest="command", required=True)
+    trend = sub.add_parser("trend", help="all measurements for one client")
+    trend.add_argument("client")
+    sub.add_parser("latest", help="latest quarter across all clients")
+    sub.add_parser("quarters", help="per-quarter rollup")
+    args = parser.parse_args(argv)
+
+    store = TimeSeriesStore(args.root)
+    if args.command == "trend":
+        t = store.trend(args.client)
+        for i in range(len(t["ts"])):
+            print(f"{quarter_label(int(t['quarter'][i]))}  leak ${t['total_leak'][i]:>14,.0f}  "
+                  f"risk {t['risk_score'][i]:5.1f}  GL {t['gl'][i]:.2f}")
+    elif args.command == "latest":
+        q, rows = store.latest_quarter()
+        if q is None:
+            parser.exit(0, "store is empty\n")
+        print(quarter_label(q))
+        for client, r in sorted(rows.items()):
+            print(f"  {client:<30} leak ${r['total_leak']:>14,.0f}  risk {r['risk_score']:5.1f}  GL {r['gl']:.2f}")
+    else:
+        for q in store.quarters():
+            s = store.quarter_summary(q)
+            print(f"{quarter_label(q)}  clients {s['clients']:>6,}  "
+                  f"mean leak ${s['total_leak']['mean']:>14,.0f}  mean risk {s['risk_score']['mean']:5.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,387 @@
+"""
+Build-once stylesheets generated from the GFI design tokens.
+
+The Streamlit apps used to re-send their whole ``<style>`` block through
+``st.markdown`` on every rerun. Instead, each stylesheet is rendered from
+``TOKENS`` once per process, written to ``static/`` under a content-hashed
+name and served by Streamlit's static file serving
+(``server.enableStaticServing``). A rerun now only carries a short
+``<link>`` tag; the browser fetches the file once and reuses it.
+
+    st.markdown(theme.head(), unsafe_allow_html=True)
+
+    python -m gfi.theme          # build all sheets and print payload sizes
+"""
+import argparse
+import functools
+import hashlib
+from pathlib import Path
+
+# ============================================================================
+# DESIGN TOKENS — matches gfiintel.com exactly
+# ============================================================================
+BG       = "#141d2e"
+SURF     = "#1c2740"
+SURF2    = "#22304e"
+BORDER   = "rgba(255,255,255,0.08)"
+TEXT     = "#edf0f8"
+MUTED    = "#8fa3c0"
+DIM      = "#4a6080"
+ACCENT   = "#c8f542"   # lime green
+BLUE     = "#4da3ff"
+DANGER   = "#ff6b6b"
+WARN     = "#f59e0b"
+SUCCESS  = "#34d399"
+
+TOKENS = {
+    "BG": BG, "SURF": SURF, "SURF2": SURF2, "BORDER": BORDER, "TEXT": TEXT,
+    "MUTED": MUTED, "DIM": DIM, "ACCENT": ACCENT, "BLUE": BLUE,
+    "DANGER": DANGER, "WARN": WARN, "SUCCESS": SUCCESS,
+}
+
+FONTS_URL = ("https://fonts.googleapis.com/css2?family=DM+Serif+Display:ital@0;1"
+             "&family=DM+Mono:wght@400;500&family=DM+Sans:wght@300;400;500&display=swap")
+
+# Streamlit serves <main script dir>/static at app/static/
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+STATIC_URL = "app/static"
+
+# ============================================================================
+# STYLESHEETS — str.format templates over TOKENS
+# ============================================================================
+# Dark theme for the main calculator (app.py)
+APP_CSS = """
+  /* ── Base ── */
+  html, body, [data-testid="stAppViewContainer"], [data-testid="stMain"] {{
+    background-color: {BG} !important;
+    color: {TEXT} !important;
+    font-family: 'DM Sans', system-ui, sans-serif;
+  }}
+
+  [data-testid="stSidebar"] {{ background-color: {SURF} !important; }}
+
+  /* Remove default padding */
+  .block-container {{ padding-top: 2rem !important; max-width: 1100px; }}
+
+  /* ── Typography ── */
+  h1, h2, h3, h4, h5 {{ color: {TEXT} !important; font-weight: 500 !important; letter-spacing: -0.01em; }}
+  p, li, span, div {{ color: {MUTED}; }}
+  strong {{ color: {TEXT} !important; }}
+
+  /* ── Inputs ── */
+  [data-testid="stTextInput"] input,
+  [data-testid="stNumberInput"] input,
+  [data-testid="stSelectbox"] div[data-baseweb="select"] {{
+    background-color: {SURF} !important;
+    border: 1px solid {BORDER} !important;
+    color: {TEXT} !important;
+    border-radius: 6px !important;
+  }}
+  [data-testid="stSelectbox"] div[data-baseweb="select"]:hover {{
+    border-color: rgba(255,255,255,0.18) !important;
+  }}
+  [data-baseweb="popover"] ul {{
+    background-color: {SURF2} !important;
+  }}
+
+  /* Sliders */
+  [data-testid="stSlider"] [data-baseweb="slider"] div[role="slider"] {{
+    background-color: {ACCENT} !important;
+  }}
+  [data-testid="stSlider"] div[data-testid="stTickBarMin"],
+  [data-testid="stSlider"] div[data-testid="stTickBarMax"] {{
+    color: {MUTED} !important;
+  }}
+
+  /* ── Tabs ── */
+  [data-testid="stTabs"] [data-baseweb="tab-list"] {{
+    background-color: {SURF} !important;
+    border-radius: 8px;
+    padding: 4px;
+    gap: 4px;
+    border: 1px solid {BORDER};
+  }}
+  [data-testid="stTabs"] [data-baseweb="tab"] {{
+    background-color: transparent !important;
+    color: {MUTED} !important;
+    border-radius: 6px !important;
+    font-size: 14px !important;
+    padding: 8px 16px !important;
+    transition: all .2s;
+  }}
+  [data-testid="stTabs"] [aria-selected="true"] {{
+    background-color: {SURF2} !important;
+    color: {TEXT} !important;
+  }}
+  [data-testid="stTabs"] [data-baseweb="tab-border"] {{ display: none !important; }}
+
+  /* ── Form submit button ── */
+  [data-testid="stFormSubmitButton"] button {{
+    background-color: {ACCENT} !important;
+    color: #0d1117 !important;
+    font-weight: 600 !important;
+    border: none !important;
+    border-radius: 8px !important;
+    padding: 12px 28px !important;
+    font-size: 16px !important;
+    transition: opacity .2s !important;
+    width: 100% !important;
+  }}
+  [data-testid="stFormSubmitButton"] button:hover {{
+    opacity: 0.88 !important;
+  }}
+
+  /* ── Expanders ── */
+  [data-testid="stExpander"] {{
+    background-color: {SURF} !important;
+    border: 1px solid {BORDER} !important;
+    border-radius: 8px !important;
+    margin-bottom: 8px;
+  }}
+  [data-testid="stExpander"] summary {{
+    color: {TEXT} !important;
+    font-size: 15px !important;
+  }}
+
+  /* ── Alerts ── */
+  [data-testid="stAlert"] {{
+    background-color: {SURF} !important;
+    border-radius: 8px !important;
+    border: 1px solid {BORDER} !important;
+  }}
+
+  /* ── Divider ── */
+  hr {{ border-color: {BORDER} !important; }}
+
+  /* ── Plotly charts background ── */
+  .js-plotly-plot .plotly {{ background: transparent !important; }}
+
+  /* ── Custom components ── */
+
+  .eyebrow {{
+    font-family: 'DM Mono', monospace;
+    font-size: 11px;
+    letter-spacing: 0.2em;
+    text-transform: uppercase;
+    color: {ACCENT};
+    margin-bottom: 8px;
+  }}
+
+  .card {{
+    background: {SURF};
+    border: 1px solid {BORDER};
+    border-radius: 10px;
+    padding: clamp(20px, 3vw, 32px);
+  }}
+
+  .card-accent {{
+    background: rgba(200,245,66,0.03);
+    border-color: rgba(200,245,66,0.18);
+  }}
+
+  .price-card {{
+    background: {SURF};
+    border: 1px solid {BORDER};
+    border-radius: 10px;
+    padding: 28px;
+    text-align: center;
+    height: 100%;
+    transition: border-color .2s, transform .25s;
+  }}
+  .price-card:hover {{
+    border-color: rgba(200,245,66,0.22);
+    transform: translateY(-3px);
+  }}
+  .price-card.featured {{
+    background: rgba(200,245,66,0.03);
+    border-color: rgba(200,245,66,0.2);
+  }}
+
+  .price-tier {{
+    font-family: 'DM Mono', monospace;
+    font-size: 10px;
+    letter-spacing: 0.14em;
+    text-transform: uppercase;
+    color: {MUTED};
+    margin-bottom: 12px;
+  }}
+  .featured .price-tier {{ color: {ACCENT}; }}
+
+  .price-amount {{
+    font-size: 48px;
+    font-weight: 600;
+    color: {TEXT};
+    line-height: 1;
+    margin-bottom: 4px;
+  }}
+  .price-cur {{ font-size: 20px; color: {MUTED}; vertical-align: top; line-height: 1.3; }}
+
+  .feat-list {{
+    list-style: none;
+    padding: 0;
+    text-align: left;
+    margin: 16px 0 24px;
+  }}
+  .feat-list li {{
+    font-size: 14px;
+    color: {MUTED};
+    padding: 8px 0;
+    border-bottom: 1px solid {BORDER};
+    display: flex;
+    gap: 8px;
+  }}
+  .feat-list li::before {{ content: '→'; color: {ACCENT}; flex-shrink: 0; }}
+
+  .cta-btn {{
+    display: block;
+    width: 100%;
+    text-align: center;
+    padding: 13px 20px;
+    background: {SURF2};
+    color: {TEXT};
+    border: 1px solid {BORDER};
+    border-radius: 7px;
+    font-size: 14px;
+    text-decoration: none;
+    transition: background .2s, border-color .2s;
+    margin-top: 8px;
+    cursor: pointer;
+  }}
+  .cta-btn:hover {{ background: rgba(255,255,255,0.04); border-color: rgba(255,255,255,0.18); color: {TEXT}; }}
+
+  .cta-btn-primary {{
+    background: {ACCENT};
+    color: #0d1117;
+    border-color: transparent;
+    font-weight: 600;
+  }}
+  .cta-btn-primary:hover {{ opacity: 0.88; background: {ACCENT}; color: #0d1117; }}
+
+  .result-hero {{
+    background: {SURF};
+    border: 1px solid rgba(255,107,107,0.25);
+    border-radius: 12px;
+    padding: 2.5rem;
+    text-align: center;
+    margin: 1.5rem 0;
+  }}
+  .result-num {{
+    font-size: 56px;
+    font-weight: 600;
+    color: {DANGER};
+    line-height: 1;
+    margin: 1rem 0;
+  }}
+
+  .insight-box {{
+    background: {SURF};
+    border: 1px solid {BORDER};
+    border-left: 3px solid {ACCENT};
+    border-radius: 8px;
+    padding: 20px 24px;
+    margin: 16px 0;
+  }}
+
+  .risk-hi  {{ color: {DANGER}; }}
+  .risk-med {{ color: {WARN}; }}
+  .risk-lo  {{ color: {SUCCESS}; }}
+
+  .guarantee {{
+    background: rgba(52,211,153,0.05);
+    border: 1px solid rgba(52,211,153,0.2);
+    border-radius: 8px;
+    padding: 20px 24px;
+    text-align: center;
+    margin: 24px 0;
+  }}
+  .guarantee h4 {{ color: {SUCCESS} !important; }}
+
+  .badge {{
+    display: inline-block;
+    background: rgba(200,245,66,0.12);
+    color: {ACCENT};
+    font-family: 'DM Mono', monospace;
+    font-size: 10px;
+    letter-spacing: 0.1em;
+    padding: 4px 10px;
+    border-radius: 4px;
+    margin-bottom: 12px;
+  }}
+
+  .two-col {{
+    display: grid;
+    grid-template-columns: 1fr 1fr;
+    gap: 16px;
+    margin: 16px 0;
+  }}
+  @media (max-width: 640px) {{
+    .two-col {{ grid-template-columns: 1fr; }}
+    .result-num {{ font-size: 40px; }}
+  }}
+"""
+
+SHEETS = {
+    "gfi": (APP_CSS, True),      # (template, needs web fonts)
+}
+
+
+def render(name, tokens=None):
+    """Stylesheet text for ``name`` with ``tokens`` substituted."""
+    template, _ = SHEETS[name]
+    return template.format(**{**TOKENS, **(tokens or {})}).strip() + "\n"
+
+
+@functools.lru_cache(maxsize=None)
+def build(name):
+    """Write ``static/<name>.<hash>.css`` once per process; return its URL.
+
+    The file name changes whenever the tokens or template change, so the
+    browser can cache it indefinitely and never sees a stale sheet.
+    """
+    css = render(name).encode()
+    digest = hashlib.sha256(css).hexdigest()[:10]
+    filename = f"{name}.{digest}.css"
+    path = STATIC_DIR / filename
+    if not path.exists():
+        STATIC_DIR.mkdir(exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(css)
+        tmp.replace(path)
+        for stale in STATIC_DIR.glob(f"{name}.*.css"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    return f"{STATIC_URL}/{filename}"
+
+
+@functools.lru_cache(maxsize=None)
+def head(name="gfi"):
+    """The ``<link>`` tags to emit on each rerun in place of inline CSS."""
+    tags = [f'<link rel="stylesheet" href="{build(name)}">']
+    if SHEETS[name][1]:
+        tags.append(f'<link rel="stylesheet" href="{FONTS_URL}">')
+    return "\n".join(tags)
+
+
+def inline_payload(name):
+    """The markup the apps used to send on every rerun, for comparison."""
+    html = f"<style>\n{render(name)}</style>"
+    if SHEETS[name][1]:
+        html += f'\n<link href="{FONTS_URL}" rel="stylesheet">'
+    return html
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Build the GFI stylesheets into static/.")
+    ap.parse_args(argv)
+    for name in SHEETS:
+        before = len(inline_payload(name).encode())
+        after = len(head(name).encode())
+        print(f"{build(name):<40} per-rerun {before:>6,} B -> {after:>4,} B "
+              f"({1 - after / before:.0%} smaller)")
+
+
+if __name__ == "__main__":
+    main()
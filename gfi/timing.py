@@ -0,0 +1,101 @@
+"""
+Per-rerun execution timing for the Streamlit apps.
+
+A full rerun executes the whole script; a fragment rerun executes only the
+decorated function. Recording both under separate scopes shows what an
+interaction costs before (``script``) and after (the fragment's scope)
+moving widgets into fragments.
+
+    _t0 = timing.start()
+    ...
+    timing.TIMINGS.record("script", timing.elapsed(_t0))
+
+    @st.fragment
+    @timing.timed("calculator")
+    def calculator(): ...
+
+Timings are kept in a bounded process-wide buffer and logged on the
+``gfi.timing`` logger; ``?timing=1`` shows the summary in the app.
+"""
+import functools
+import logging
+import statistics
+import threading
+import time
+from collections import deque
+
+HISTORY = 500
+
+log = logging.getLogger("gfi.timing")
+
+
+class Timings:
+    """Thread-safe ring buffer of ``(scope, ms)`` samples."""
+
+    def __init__(self, maxlen=HISTORY, kind="rerun"):
+        self.kind = kind
+        self._samples = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def record(self, scope, ms):
+        with self._lock:
+            self._samples.append((scope, ms))
+        log.info("%s %-12s %8.1f ms", self.kind, scope, ms)
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+
+    def summary(self):
+        """``{scope: {"n", "last", "p50", "p95"}}`` over the buffered samples."""
+        with self._lock:
+            samples = list(self._samples)
+        by_scope = {}
+        for scope, ms in samples:
+            by_scope.setdefault(scope, []).append(ms)
+        return {
+            scope: {
+                "n": len(ms),
+                "last": ms[-1],
+                "p50": statistics.median(ms),
+                "p95": _p95(ms),
+            }
+            for scope, ms in by_scope.items()
+        }
+
+
+def _p95(values):
+    return statistics.quantiles(values, n=20, method="inclusive")[-1] if len(values) > 1 else values[0]
+
+
+TIMINGS = Timings()
+
+
+def start():
+    return time.perf_counter()
+
+
+def elapsed(t0):
+    return (time.perf_counter() - t0) * 1e3
+
+
+def timed(scope, timings=TIMINGS):
+    """Decorator recording each call's wall time under ``scope``."""
+    def wrap(fn):
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            t0 = start()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                timings.record(scope, elapsed(t0))
+        return inner
+    return wrap
+
+
+def table(timings=TIMINGS):
+    """Markdown table of the summary, for an in-app debug panel."""
+    rows = ["| scope | runs | last ms | p50 ms | p95 ms |", "|---|---:|---:|---:|---:|"]
+    for scope, s in sorted(timings.summary().items()):
+        rows.append(f"| {scope} | {s['n']} | {s['last']:.1f} | {s['p50']:.1f} | {s['p95']:.1f} |")
+    return "\n".join(rows)
@@ -0,0 +1,52 @@
+"""
+Incremental what-if scoring for the live slider mode.
+
+A ``Scenario`` keeps the six category costs and six risk factors of the
+current inputs. Changing one input recomputes only the terms that read it
+(``leak.COST_INPUTS`` / ``leak.RISK_INPUTS``) and re-aggregates; moving
+the rework slider, for example, touches one cost and one risk factor.
+"""
+from gfi import leak
+
+# input -> (cost categories, risk factor indices) that read it
+AFFECTS = {
+    name: (
+        tuple(c for c in leak.CATEGORIES if name in leak.COST_INPUTS[c]),
+        tuple(i for i, n in enumerate(leak.RISK_INPUTS) if n == name),
+    )
+    for name in leak.INPUTS
+}
+
+
+class Scenario:
+    """Mutable single assessment with O(changed terms) updates."""
+
+    def __init__(self, inputs, multipliers=None):
+        self.inputs = {name: float(inputs[name]) for name in leak.INPUTS}
+        self.multipliers = {**leak.MULTIPLIERS, **(multipliers or {})}
+        self.costs = {c: float(leak.COST_TERMS[c](self.inputs, self.multipliers)) for c in leak.CATEGORIES}
+        self.factors = [float(f(self.inputs[n])) for f, n in zip(leak.RISK_TERMS, leak.RISK_INPUTS)]
+
+    @property
+    def total(self):
+        return max(sum(self.costs.values()), 0.0)
+
+    @property
+    def risk(self):
+        return min(sum(self.factors) / len(self.factors), 100.0)
+
+    def update(self, **changes):
+        """Apply input changes; return the set of categories whose cost changed."""
+        touched = set()
+        for name, value in changes.items():
+            value = float(value)
+            if self.inputs[name] == value:
+                continue
+            self.inputs[name] = value
+            categories, factors = AFFECTS[name]
+            for c in categories:
+                self.costs[c] = float(leak.COST_TERMS[c](self.inputs, self.multipliers))
+                touched.add(c)
+            for i in factors:
+                self.factors[i] = float(leak.RISK_TERMS[i](value))
+        return touched
@@ -0,0 +1,422 @@
+"""
+Write-behind queue in front of a ``gfi.repository.Repository``.
+
+``repository.persist`` writes on the caller's thread, so a submit waited
+for a round trip to Supabase before the results rendered — and waited
+longer whenever the database was slow. ``submit()`` now only puts the row
+on a bounded in-process queue; one background thread per process drains
+it:
+
+    batching      up to ``max_batch`` rows, or whatever arrived within
+                  ``max_delay`` seconds of the first one, one insert per table
+    retries       a failed batch is retried with exponential backoff and
+                  jitter; after ``retries`` attempts it is logged and left
+                  to the spool (below). A batch the store refuses outright
+                  (``RepositoryError.permanent``) is not retried
+    backpressure  while the queue is full ``submit()`` waits up to
+                  ``put_timeout`` seconds for room, then rejects the row
+                  (returns ``False``) instead of stalling the session
+    metrics       queue depth (current and peak), counters, and per-table
+                  flush latency and submit-to-stored lag in ``FLUSHES``
+
+Inserts are idempotent on the row id, so a retry after a write that did
+land (but timed out on the way back) stores nothing twice.
+
+With a ``gfi.spool.Spool`` (the process-wide queue opens one before it
+touches the repository) every row is appended to the spool before it is
+queued, and acknowledged there once stored. Nothing is lost any more: a
+row whose batch failed, or that found the queue full, stays in the spool,
+and the worker replays the spool at the next idle moment after a failed
+batch, whenever the queue has been idle for ``replay_interval`` seconds,
+and once at start-up, for rows a previous process left behind. A refused
+batch is replayed row by row, so one bad row is dead-lettered by the spool
+instead of holding back the rest.
+
+    python -m gfi.writebehind bench --latency-ms 100   # submit latency, slow store
+"""
+import argparse
+import atexit
+import logging
+import queue
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from gfi import repository, spool, timing
+
+MAX_BATCH = 100         # rows per flush
+MAX_DELAY = 0.5         # seconds a row may wait for its batch to fill
+MAX_QUEUE = 10_000      # rows buffered before submit() pushes back
+PUT_TIMEOUT = 0.05      # seconds submit() waits for room in a full queue
+RETRIES = 5             # attempts per batch
+BACKOFF = 0.2           # seconds before the first retry, doubled each time
+MAX_BACKOFF = 10.0
+REPLAY_INTERVAL = 30.0  # idle seconds between spool replays
+
+log = logging.getLogger("gfi.writebehind")
+
+FLUSHES = timing.Timings(kind="flush")
+
+_STOP = object()
+
+
+class WriteBehind:
+    """Bounded queue plus one flushing thread for one repository.
+
+    ``repo`` is a ``Repository``, or a callable that opens one: it is then
+    called on the worker thread when a batch is due (and again after it
+    fails), so a store that is slow or impossible to open never blocks
+    ``submit()`` — rows wait in the spool instead.
+    """
+
+    def __init__(self, repo, max_batch=MAX_BATCH, max_delay=MAX_DELAY, max_queue=MAX_QUEUE,
+                 put_timeout=PUT_TIMEOUT, retries=RETRIES, backoff=BACKOFF, max_backoff=MAX_BACKOFF,
+                 spool=None, replay_interval=REPLAY_INTERVAL, timings=None):
+        if isinstance(repo, repository.Repository):
+            self.repo, self._open = repo, None
+        else:
+            self.repo, self._open = None, repo
+        self.spool = spool
+        self.replay_interval = replay_interval
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.put_timeout = put_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timings = FLUSHES if timings is None else timings
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(
+            ("submitted", "rejected", "deferred", "written", "failed", "retries", "batches", "replayed"), 0)
+        self._peak = 0
+        self._replay_due = spool is not None
+        self._replay_stopped = False
+        self._thread = threading.Thread(target=self._run, name="gfi-writebehind", daemon=True)
+        self._thread.start()
+
+    def _count(self, name, n=1):
+        with self._lock:
+            self._counts[name] += n
+
+    # ---------------------------------------------------------------- producer
+    def submit(self, table, row):
+        """Queue ``row`` for ``table``.
+
+        ``False`` if the row was neither spooled nor queued: no spool (or
+        the spool failed) and the queue stayed full.
+        """
+        if table not in repository.TABLES:
+            raise ValueError(f"unknown table {table!r}")
+        seq = None
+        if self.spool is not None:
+            try:
+                seq = self.spool.append(table, row)
+            except Exception:
+                log.exception("could not spool %s row %s; queueing in memory only", table, row.get("id"))
+        try:
+            self._queue.put((table, row, time.perf_counter(), seq), timeout=self.put_timeout)
+        except queue.Full:
+            if seq is not None:
+                # Safe on disk; the next replay delivers it
+                self._count("deferred")
+                self._replay_due = True
+                return True
+            self._count("rejected")
+            log.warning("write-behind queue full (%d rows); rejected %s row %s",
+                        self._queue.maxsize, table, row.get("id"))
+            return False
+        depth = self._queue.qsize()
+        with self._lock:
+            self._counts["submitted"] += 1
+            self._peak = max(self._peak, depth)
+        return True
+
+    def flush(self, timeout=None):
+        """Block until every queued row has been written or given up on.
+
+        Returns ``False`` if ``timeout`` seconds passed first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout=10.0):
+        """Flush what is queued (up to ``timeout`` seconds) and stop the thread."""
+        if not self._thread.is_alive():
+            return
+        self._queue.put((_STOP, None, None, None))
+        self._thread.join(timeout)
+
+    def stats(self):
+        with self._lock:
+            stats = {"depth": self._queue.qsize(), "peak_depth": self._peak,
+                     "capacity": self._queue.maxsize, **self._counts}
+        if self.spool is not None:
+            spooled = self.spool.stats()
+            stats["spooled"], stats["dead"] = spooled["pending"], spooled["dead"]
+        return stats
+
+    # ---------------------------------------------------------------- consumer
+    def _run(self):
+        while True:
+            if self._replay_due and self._queue.empty():
+                self._replay()
+            try:
+                batch = [self._queue.get(timeout=None if self.spool is None else self.replay_interval)]
+            except queue.Empty:
+                self._replay_due = True
+                continue
+            deadline = time.monotonic() + self.max_delay
+            while batch[-1][0] is not _STOP and len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            stop = batch[-1][0] is _STOP
+            if stop:
+                batch.pop()
+                # Drain what is still queued so close() loses nothing
+                while True:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+            self._flush(batch)
+            for _ in range(len(batch) + stop):
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _flush(self, batch):
+        by_table = {}
+        for table, row, queued, seq in batch:
+            if table is not _STOP:
+                by_table.setdefault(table, []).append((row, queued, seq))
+        for table, items in by_table.items():
+            rows = [row for row, _, _ in items]
+            seqs = [seq for _, _, seq in items if seq is not None]
+            t0 = timing.start()
+            if self._write(table, rows):
+                self._count("written", len(rows))
+                self._spool_call("ack", seqs)
+                if self._replay_stopped:
+                    # The store is back: deliver what the failed replay left
+                    self._replay_due = True
+            else:
+                self._count("failed", len(rows))
+                log.error("%d %s row(s) not stored (%d kept in the spool): %s",
+                          len(rows), table, len(seqs), [r.get("id") for r in rows])
+            self._count("batches")
+            self.timings.record(table, timing.elapsed(t0))
+            self.timings.record(f"{table} lag", timing.elapsed(min(q for _, q, _ in items)))
+
+    def _spool_call(self, method, seqs):
+        if seqs:
+            try:
+                getattr(self.spool, method)(seqs)
+            except Exception:
+                log.exception("spool %s failed for %d row(s)", method, len(seqs))
+
+    def _replay(self):
+        """Deliver whatever the spool still holds, then compact it."""
+        self._replay_due = self._replay_stopped = False
+        t0 = timing.start()
+        try:
+            n = self.spool.replay(self._repository())
+        except Exception as e:
+            # Pending rows wait for the next idle interval (or the next batch
+            # that gets through) rather than hammer the store
+            log.warning("spool replay stopped: %s", e)
+            self._replay_stopped = True
+            return
+        if n:
+            self._count("replayed", n)
+            self.timings.record("replay", timing.elapsed(t0))
+            log.info("replayed %d spooled row(s)", n)
+        try:
+            self.spool.compact()
+        except Exception:
+            log.exception("spool compaction failed")
+
+    def _repository(self):
+        if self.repo is None:
+            try:
+                self.repo = self._open()
+            except Exception as e:
+                raise repository.RepositoryError(f"could not open the repository: {e}") from e
+            log.info("writing behind to %s", self.repo.name)
+        return self.repo
+
+    def _write(self, table, rows):
+        delay = self.backoff
+        for attempt in range(1, self.retries + 1):
+            try:
+                self._repository().write(table, rows)
+                return True
+            except repository.RepositoryError as e:
+                if e.permanent or attempt == self.retries:
+                    log.error("%s", e)
+                    # Permanent: isolate the bad row. Transient: the rows are
+                    # in the spool; try again at the next idle moment
+                    if self.spool is not None:
+                        self._replay_due = True
+                    return False
+                self._count("retries")
+                log.warning("%s; retry %d/%d in %.1fs", e, attempt, self.retries - 1, delay)
+                time.sleep(delay * random.uniform(0.5, 1.5))
+                delay = min(delay * 2, self.max_backoff)
+        return False
+
+
+# ============================================================================
+# PROCESS-WIDE QUEUE
+# ============================================================================
+_default = None
+_default_lock = threading.Lock()
+
+
+def default(secrets=None):
+    """The process-wide queue in front of ``repository.default()``, spooled to disk.
+
+    The spool is opened first and on its own; the repository is opened by
+    the worker thread, so rows are kept even while it cannot be.
+    """
+    global _default
+    with _default_lock:
+        if _default is None:
+            try:
+                local = spool.Spool()
+            except Exception:
+                log.exception("could not open the spool; queueing in memory only")
+                local = None
+            _default = WriteBehind(lambda: repository.default(secrets), spool=local)
+            # atexit runs last-registered first: stop the worker, then close the spool
+            if local is not None:
+                atexit.register(local.close)
+            atexit.register(_default.close)
+        return _default
+
+
+def submit(table, row, secrets=None):
+    """Queue a row for the process-wide repository; never raises.
+
+    Returns whether the row was accepted (``False`` when it could be
+    neither spooled nor queued).
+    """
+    try:
+        return default(secrets).submit(table, row)
+    except Exception:
+        log.exception("could not queue %s row %s", table, row.get("id"))
+        return False
+
+
+def table(writer=None):
+    """Markdown summary of the queue, for an in-app debug panel."""
+    writer = writer or _default
+    if writer is None:
+        return ""
+    s = writer.stats()
+    keys = ("submitted", "written", "failed", "rejected", "deferred", "retries", "replayed", "spooled", "dead")
+    counts = " · ".join(f"{k} {s[k]:,}" for k in keys if k in s)
+    return f"queue {s['depth']:,} / {s['capacity']:,} (peak {s['peak_depth']:,}) · {counts}\n\n" + timing.table(writer.timings)
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+class _Slow(repository.Repository):
+    """Adds a fixed round trip to every insert, like a remote database."""
+
+    def __init__(self, inner, latency):
+        super().__init__(inner.timings)
+        self.inner = inner
+        self.name = f"{inner.name}+{latency * 1e3:.0f}ms"
+        self.latency = latency
+
+    def _insert(self, table, rows):
+        time.sleep(self.latency)
+        self.inner._insert(table, rows)
+
+    def count(self, table):
+        return self.inner.count(table)
+
+
+def _submits(fn, n, sessions):
+    """Per-call latency (ms) of ``fn(i)`` from ``sessions`` concurrent threads."""
+    ms = []
+    lock = threading.Lock()
+
+    def session(k):
+        local = []
+        for i in range(k, n, sessions):
+            t0 = timing.start()
+            fn(i)
+            local.append(timing.elapsed(t0))
+        with lock:
+            ms.extend(local)
+
+    threads = [threading.Thread(target=session, args=(k,)) for k in range(sessions)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    ms.sort()
+    return ms[len(ms) // 2], ms[int(len(ms) * 0.99)]
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m gfi.writebehind",
+                                 description="Write-behind queue for assessment / lead writes.")
+    sub = ap.add_subparsers(dest="command", required=True)
+    b = sub.add_parser("bench", help="submit latency, synchronous vs write-behind, against a slow store")
+    b.add_argument("--latency-ms", type=float, default=100.0, help="simulated round trip per insert")
+    b.add_argument("-n", type=int, default=400, help="assessments per run")
+    b.add_argument("--sessions", type=int, default=4, help="concurrent submitting sessions")
+    args = ap.parse_args(argv)
+
+    rows = [repository.assessment({"employees": 100}, {"total_leak": float(i), "risk_score": 50.0},
+                                  locale="en", company="bench") for i in range(args.n)]
+    with tempfile.TemporaryDirectory() as tmp:
+        sync = _Slow(repository.SQLiteRepository(Path(tmp) / "sync.db", timing.Timings()), args.latency_ms / 1e3)
+        t0 = time.perf_counter()
+        p50, p99 = _submits(lambda i: sync.save_assessment(rows[i]), args.n, args.sessions)
+        wall = time.perf_counter() - t0
+        print(f"store: sqlite + {args.latency_ms:.0f} ms per insert, {args.n:,} submits, {args.sessions} sessions")
+        print(f"{'mode':<14} {'p50 ms':>8} {'p99 ms':>8} {'drained s':>10} {'inserts':>8}")
+        print(f"{'synchronous':<14} {p50:8.3f} {p99:8.3f} {wall:10.2f} {args.n:>8,}")
+
+        for label, spooled in (("write-behind", False), ("+ spool", True)):
+            slow = _Slow(repository.SQLiteRepository(Path(tmp) / f"{label}.db", timing.Timings()),
+                         args.latency_ms / 1e3)
+            local = spool.Spool(Path(tmp) / f"{label}.spool", timings=timing.Timings()) if spooled else None
+            writer = WriteBehind(slow, spool=local, timings=timing.Timings(kind="flush"))
+            t0 = time.perf_counter()
+            p50, p99 = _submits(lambda i: writer.submit("assessments", rows[i]), args.n, args.sessions)
+            writer.flush()
+            wall = time.perf_counter() - t0
+            s = writer.stats()
+            print(f"{label:<14} {p50:8.3f} {p99:8.3f} {wall:10.2f} {s['batches']:>8,}")
+            writer.close()
+            assert slow.count("assessments") == args.n and s.get("spooled", 0) == 0
+            slow.inner.close()
+            if local is not None:
+                local.close()
+        assert sync.count("assessments") == args.n
+        print(f"\npeak queue depth {s['peak_depth']:,}, rejected {s['rejected']}, failed {s['failed']}")
+        print(timing.table(writer.timings))
+        sync.inner.close()
+
+
+if __name__ == "__main__":
+    main()
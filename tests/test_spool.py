@@ -0,0 +1,55 @@
+"""gfi.spool replay: a row the store refuses is dead-lettered, the rest are delivered."""
+import pytest
+
+from gfi import repository, spool
+
+
+def _row(i, **overrides):
+    row = dict(id=f"row-{i}", created_at="2026-01-01T00:00:00+00:00", organisation=f"Co {i}")
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = repository.SQLiteRepository(tmp_path / "gfi.sqlite3")
+    yield repo
+    repo.close()
+
+
+def test_poison_row_is_dead_lettered_and_the_rest_delivered(tmp_path, repo):
+    sp = spool.Spool(tmp_path / "spool.sqlite3", max_attempts=2)
+    sp.append("leads", _row(1))
+    sp.append("leads", _row(2, name={"first": "Ada"}))  # no column can bind a dict
+    sp.append("leads", _row(3))
+
+    assert sp.replay(repo) == 2
+    assert repo.count("leads") == 2
+    assert sp.stats()["pending"] == 1 and sp.stats()["dead"] == 0
+
+    sp.append("leads", _row(4))
+    assert sp.replay(repo) == 1
+    s = sp.stats()
+    assert s["pending"] == 0 and s["dead"] == 1
+    assert [row[2] for row in sp.dead()] == ["row-2"]
+
+    assert sp.requeue() == 1
+    assert sp.stats()["pending"] == 1 and sp.stats()["dead"] == 0
+    sp.close()
+
+
+class Down(repository.Repository):
+    name = "down"
+
+    def _insert(self, table, rows):
+        raise OSError("connection refused")
+
+
+def test_outage_charges_nothing(tmp_path):
+    sp = spool.Spool(tmp_path / "spool.sqlite3", max_attempts=1)
+    sp.append("leads", _row(1))
+    with pytest.raises(repository.RepositoryError):
+        sp.replay(Down())
+    s = sp.stats()
+    assert s["pending"] == 1 and s["retried"] == 0 and s["dead"] == 0
+    sp.close()
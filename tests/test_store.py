@@ -0,0 +1,75 @@
+"""Crash recovery of gfi.store: a flush interrupted at each step reopens intact."""
+import pytest
+
+from gfi import leak, store
+
+INPUTS = dict(employees=100, avg_salary=75000, revenue_per_employee=150000, meeting_hours_per_week=15,
+              approval_layers=3, project_delay_pct=30, rework_pct=15, decision_time_days=14,
+              turnover_rate=15, customer_complaint_rate=5)
+assert set(INPUTS) == set(leak.INPUTS)
+
+
+class Crash(Exception):
+    pass
+
+
+def _fill(ts, n=3, client="Acme"):
+    for i in range(n):
+        ts.record(client, INPUTS, ts=1.75e9 + i)
+
+
+def test_reopen_keeps_sealed_and_unsealed_rows(tmp_path):
+    with store.TimeSeriesStore(tmp_path, segment_rows=2) as ts:
+        _fill(ts)
+    ts = store.TimeSeriesStore(tmp_path, segment_rows=2)
+    _fill(ts, 1)
+    assert len(ts.trend("Acme")["ts"]) == 4
+    ts.close()
+
+
+def test_crash_before_manifest_discards_uncommitted_segment(tmp_path, monkeypatch):
+    ts = store.TimeSeriesStore(tmp_path)
+    _fill(ts)
+    write_json = store._write_json
+
+    def crash(path, data):
+        raise Crash
+
+    monkeypatch.setattr(store, "_write_json", crash)
+    with pytest.raises(Crash):
+        ts.flush()
+    assert (tmp_path / "seg-000001").is_dir()
+    monkeypatch.setattr(store, "_write_json", write_json)
+
+    ts = store.TimeSeriesStore(tmp_path)
+    assert not (tmp_path / "seg-000001").exists()
+    assert len(ts.trend("Acme")["ts"]) == 3
+    _fill(ts, 2)
+    ts.flush()
+    assert len(ts.trend("Acme")["ts"]) == 5
+    ts.close()
+    assert len(store.TimeSeriesStore(tmp_path).trend("Acme")["ts"]) == 5
+
+
+def test_crash_before_wal_truncate_does_not_replay_sealed_rows(tmp_path, monkeypatch):
+    ts = store.TimeSeriesStore(tmp_path)
+    _fill(ts)
+
+    def crash(path, mode="r", *args, **kwargs):
+        if mode == "w":
+            raise Crash
+        return open(path, mode, *args, **kwargs)
+
+    monkeypatch.setattr(store, "open", crash, raising=False)
+    with pytest.raises(Crash):
+        ts.flush()
+    monkeypatch.undo()
+
+    ts = store.TimeSeriesStore(tmp_path)
+    assert len(ts.trend("Acme")["ts"]) == 3
+    _fill(ts, 1)
+    ts.close()
+    ts = store.TimeSeriesStore(tmp_path)
+    assert len(ts.trend("Acme")["ts"]) == 4
+    assert ts.quarter_summary(ts.quarters()[-1])["clients"] == 1
+    ts.close()